@@ -25,6 +25,7 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.template import async_get_render_stats
 
 from .const import DOMAIN
 
@@ -40,6 +41,7 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_TEMPLATE_STATS = "template_stats"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
@@ -63,15 +65,18 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_TEMPLATE_STATS,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
 
 DEFAULT_MAX_OBJECTS = 5
+DEFAULT_MAX_TEMPLATES = 25
 
 CONF_ENABLED = "enabled"
 CONF_SECONDS = "seconds"
 CONF_MAX_OBJECTS = "max_objects"
+CONF_MAX_TEMPLATES = "max_templates"
 
 LOG_INTERVAL_SUB = "log_interval_subscription"
 
@@ -231,6 +236,32 @@ async def async_setup_entry(  # noqa: C901
             notification_id="profile_lru_stats",
         )
 
+    @callback
+    def _async_template_stats(call: ServiceCall) -> None:
+        """Log the templates that spent the most time rendering."""
+        for stats in async_get_render_stats(hass)[: call.data[CONF_MAX_TEMPLATES]]:
+            _LOGGER.critical(
+                (
+                    "Template rendered %s times in %.3f seconds, 95th percentile"
+                    " %.6f seconds, last triggered by %s: %s"
+                ),
+                stats["renders"],
+                stats["render_time"],
+                stats["p95_render_time"],
+                stats["last_trigger"],
+                stats["template"],
+            )
+
+        persistent_notification.async_create(
+            hass,
+            (
+                "Template render stats have been dumped to the log. See [the"
+                " logs](/config/logs) to review the stats."
+            ),
+            title="Template stats completed",
+            notification_id="profile_template_stats",
+        )
+
     async def _async_dump_thread_frames(call: ServiceCall) -> None:
         """Log all thread frames."""
         frames = sys._current_frames()  # noqa: SLF001
@@ -353,6 +384,20 @@ async def async_setup_entry(  # noqa: C901
         _lru_stats,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_TEMPLATE_STATS,
+        _async_template_stats,
+        schema=vol.Schema(
+            {
+                vol.Optional(
+                    CONF_MAX_TEMPLATES, default=DEFAULT_MAX_TEMPLATES
+                ): vol.Range(min=1, max=1024)
+            }
+        ),
+    )
+
     async_register_admin_service(
         hass,
         DOMAIN,
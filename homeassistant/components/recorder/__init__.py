@@ -31,10 +31,12 @@ from homeassistant.util.event_type import EventType
 from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
+    DEFAULT_QUERY_WORKERS,
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORM_METHODS,
     SQLITE_URL_PREFIX,
+    QueryType,
     SupportedDialect,
 )
 from .core import Recorder
@@ -54,6 +56,10 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_BULK_INSERT = "bulk_insert"
+CONF_QUERY_WORKERS = "query_workers"
+CONF_RANGE_PURGE = "range_purge"
+CONF_COMPACT_AFTER_DAYS = "compact_after_days"
 CONF_DB_URL = "db_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
@@ -96,6 +102,14 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT, default=False): cv.boolean,
+                    vol.Optional(
+                        CONF_QUERY_WORKERS, default=DEFAULT_QUERY_WORKERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=16)),
+                    vol.Optional(CONF_RANGE_PURGE, default=False): cv.boolean,
+                    vol.Optional(CONF_COMPACT_AFTER_DAYS): vol.All(
+                        vol.Coerce(int), vol.Range(min=1)
+                    ),
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
@@ -138,6 +152,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     entity_filter = None if _filter.empty_filter else _filter.get_filter()
     auto_purge = conf[CONF_AUTO_PURGE]
     auto_repack = conf[CONF_AUTO_REPACK]
+    bulk_insert = conf[CONF_BULK_INSERT]
+    query_workers = conf[CONF_QUERY_WORKERS]
+    range_purge = conf[CONF_RANGE_PURGE]
+    compact_after_days = conf.get(CONF_COMPACT_AFTER_DAYS)
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
@@ -156,6 +174,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         hass=hass,
         auto_purge=auto_purge,
         auto_repack=auto_repack,
+        bulk_insert=bulk_insert,
+        query_workers=query_workers,
+        range_purge=range_purge,
+        compact_after_days=compact_after_days,
         keep_days=keep_days,
         commit_interval=commit_interval,
         uri=db_url,
@@ -0,0 +1,58 @@
+"""A bloom filter of the hashes stored in the database."""
+
+from __future__ import annotations
+
+# With 10 bits per item and 7 probes about 1% of the lookups
+# of hashes that are not in the filter are false positives.
+BITS_PER_ITEM = 10
+PROBES = 7
+
+# The smallest number of items the filter is sized for
+MIN_CAPACITY = 65536
+
+# Multiplier used to derive the step between the probes from the hash
+_GOLDEN_RATIO_32 = 0x9E3779B1
+
+
+class HashBloomFilter:
+    """A bloom filter of 32-bit hashes.
+
+    There are no false negatives, so a hash that is not in the filter
+    is known not to be in the database. A false positive only costs
+    a query that does not find anything.
+
+    The filter can hold more items than its capacity but the false
+    positive rate goes up as it fills.
+    """
+
+    __slots__ = ("_bits", "_size", "capacity", "count")
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize a filter sized for capacity items."""
+        self.capacity = max(capacity, MIN_CAPACITY)
+        self.count = 0
+        self._size = self.capacity * BITS_PER_ITEM
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def add(self, hash_: int) -> None:
+        """Add a hash to the filter."""
+        bits = self._bits
+        size = self._size
+        position = hash_ % size
+        step = ((hash_ * _GOLDEN_RATIO_32) & 0xFFFFFFFF) | 1
+        for _ in range(PROBES):
+            bits[position >> 3] |= 1 << (position & 7)
+            position = (position + step) % size
+        self.count += 1
+
+    def __contains__(self, hash_: int) -> bool:
+        """Return if the hash may be in the filter."""
+        bits = self._bits
+        size = self._size
+        position = hash_ % size
+        step = ((hash_ * _GOLDEN_RATIO_32) & 0xFFFFFFFF) | 1
+        for _ in range(PROBES):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % size
+        return True
@@ -45,6 +45,9 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_QUERY_WORKER_PREFIX = "DbQueryWorker"
+
+DEFAULT_QUERY_WORKERS = 4
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -80,3 +83,11 @@ class SupportedDialect(StrEnum):
     SQLITE = "sqlite"
     MYSQL = "mysql"
     POSTGRESQL = "postgresql"
+
+
+class QueryType(StrEnum):
+    """Types of read-only queries that run on the query workers."""
+
+    HISTORY = "history"
+    LOGBOOK = "logbook"
+    STATISTICS = "statistics"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import defaultdict
 from collections.abc import Callable, Iterable
 from concurrent.futures import CancelledError
 import contextlib
@@ -16,7 +17,14 @@ from typing import TYPE_CHECKING, Any, cast
 
 from propcache import cached_property
 import psutil_home_assistant as ha_psutil
-from sqlalchemy import create_engine, event as sqlalchemy_event, exc, select, update
+from sqlalchemy import (
+    create_engine,
+    event as sqlalchemy_event,
+    exc,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.engine import Engine
 from sqlalchemy.engine.interfaces import DBAPIConnection
 from sqlalchemy.exc import SQLAlchemyError
@@ -51,6 +59,7 @@ from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
 from .const import (
+    DB_QUERY_WORKER_PREFIX,
     DB_WORKER_PREFIX,
     DOMAIN,
     KEEPALIVE_TIME,
@@ -63,6 +72,7 @@ from .const import (
     MYSQLDB_URL_PREFIX,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
+    QueryType,
     SupportedDialect,
 )
 from .db_schema import (
@@ -78,6 +88,7 @@ from .db_schema import (
     StatisticsShortTerm,
 )
 from .executor import DBInterruptibleThreadPoolExecutor
+from .history.cache import HistoryCache
 from .migration import (
     EntityIDMigration,
     EventIDPostMigration,
@@ -87,12 +98,14 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .query_limiter import QueryLimiter
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
 from .table_managers.state_attributes import StateAttributesManager
-from .table_managers.states import StatesManager
+from .table_managers.states import PendingStateRow, StatesManager
 from .table_managers.states_meta import StatesMetaManager
 from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
@@ -101,6 +114,7 @@ from .tasks import (
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
+    CompactStatesTask,
     CompileMissingStatisticsTask,
     DatabaseLockTask,
     ImportStatisticsTask,
@@ -115,11 +129,13 @@ from .tasks import (
     UpdateStatisticsMetadataTask,
     WaitTask,
 )
+from .throughput import RecorderThroughput
 from .util import (
     async_create_backup_failure_issue,
     build_mysqldb_conv,
     dburl_to_path,
     end_incomplete_runs,
+    execute_on_connection,
     execute_stmt_lambda_element,
     is_second_sunday,
     move_away_broken_database,
@@ -149,6 +165,10 @@ DB_LOCK_QUEUE_CHECK_TIMEOUT = 10  # check every 10 seconds
 
 QUEUE_CHECK_INTERVAL = timedelta(minutes=5)
 
+# How far back the nightly compaction looks for states that were
+# not compacted yet, compacting states twice keeps the same states
+COMPACT_LOOKBACK = timedelta(days=2)
+
 INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
@@ -166,6 +186,10 @@ class Recorder(threading.Thread):
         hass: HomeAssistant,
         auto_purge: bool,
         auto_repack: bool,
+        bulk_insert: bool,
+        query_workers: int,
+        range_purge: bool,
+        compact_after_days: int | None,
         keep_days: int,
         commit_interval: int,
         uri: str,
@@ -182,6 +206,20 @@ class Recorder(threading.Thread):
         self.recorder_and_worker_thread_ids: set[int] = set()
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
+        # When enabled, state rows are accumulated as plain values and
+        # written with a single executemany per commit instead of being
+        # flushed one by one through the ORM unit of work.
+        self.bulk_insert = bulk_insert
+        # History, logbook and statistics queries run on their own
+        # workers so they do not queue behind each other or other jobs.
+        self.query_workers = query_workers
+        self.query_limiter = QueryLimiter(query_workers)
+        # When enabled, states are purged in ranges of last_updated_ts
+        # instead of by lists of state ids.
+        self.range_purge = range_purge
+        self.purge_progress: PurgeProgress | None = None
+        # Numeric states older than this are compacted every night
+        self.compact_after_days = compact_after_days
         self.keep_days = keep_days
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
@@ -201,6 +239,8 @@ class Recorder(threading.Thread):
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
+        self.throughput = RecorderThroughput()
+        self.history_cache = HistoryCache()
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
         # The entity_filter is exposed on the recorder instance so that
@@ -229,6 +269,7 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._query_executor: DBInterruptibleThreadPoolExecutor | None = None
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -291,6 +332,12 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._query_executor = DBInterruptibleThreadPoolExecutor(
+            self.recorder_and_worker_thread_ids,
+            thread_name_prefix=DB_QUERY_WORKER_PREFIX,
+            max_workers=self.query_workers,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
@@ -302,7 +349,14 @@ class Recorder(threading.Thread):
         """Initialize the recorder."""
         entity_filter = self.entity_filter
         exclude_event_types = self.exclude_event_types
-        queue_put = self._queue.put_nowait
+        queue_put_nowait = self._queue.put_nowait
+        record_enqueued = self.throughput.async_record_enqueued
+
+        @callback
+        def queue_put(event: Event) -> None:
+            """Put an event in the process queue and record it."""
+            record_enqueued(event)
+            queue_put_nowait(event)
 
         @callback
         def _event_listener(event: Event) -> None:
@@ -331,6 +385,9 @@ class Recorder(threading.Thread):
             # Unknown what it is.
             queue_put(event)
 
+        # State changed events are not received with a batch listener since
+        # tasks queued from the event loop, like renaming an entity, must be
+        # processed after the events that were fired before them.
         self._event_listener = self.hass.bus.async_listen(
             MATCH_ALL,
             _event_listener,
@@ -365,6 +422,21 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    async def async_add_query_job[_T](
+        self, query_type: QueryType, target: Callable[..., _T], *args: Any
+    ) -> _T:
+        """Run a read-only query job from within the event loop.
+
+        The job runs on one of the query workers, which use read-only
+        connections when the database is SQLite. Jobs of the same
+        query type wait for each other when the limit for the type
+        has been reached.
+        """
+        async with self.query_limiter.async_limit(query_type):
+            return await self.hass.loop.run_in_executor(
+                self._query_executor, target, *args
+            )
+
     @callback
     def _async_check_queue(self, *_: Any) -> None:
         """Periodic check of the queue size to ensure we do not exhaust memory.
@@ -527,6 +599,11 @@ class Recorder(threading.Thread):
             self.queue_task(PurgeTask(purge_before, repack=repack, apply_filter=False))
         else:
             self.queue_task(PerodicCleanupTask())
+        if self.compact_after_days:
+            compact_before = dt_util.utcnow() - timedelta(days=self.compact_after_days)
+            self.queue_task(
+                CompactStatesTask(compact_before - COMPACT_LOOKBACK, compact_before)
+            )
 
     @callback
     def _async_five_minute_tasks(self, now: datetime) -> None:
@@ -823,6 +900,15 @@ class Recorder(threading.Thread):
         # and not the old ones as soon as the API is available.
         self.hass.add_job(self.async_set_db_ready)
 
+        # Prime the state attributes cache before the events that
+        # were queued during startup are processed to avoid looking
+        # up attributes that are not in the database.
+        if not schema_status.migration_needed:
+            with session_scope(session=self.get_session(), read_only=True) as session:
+                self.state_attributes_manager.prewarm(
+                    session, self.states_meta_manager.active
+                )
+
     def _run_event_loop(self) -> None:
         """Run the event loop for the recorder."""
         # Use a session for the event read loop
@@ -1026,9 +1112,14 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
         if event.event_type == EVENT_STATE_CHANGED:
-            self._process_state_changed_event_into_session(event)
+            self.history_cache.process_state_time(event.time_fired_timestamp)
+            if self.bulk_insert:
+                self._process_state_changed_event_into_bulk_rows(event)
+            else:
+                self._process_state_changed_event_into_session(event)
         else:
             self._process_non_state_changed_event_into_session(event)
+        self.throughput.record_processed()
         # Commit if the commit interval is zero
         if not self.commit_interval:
             self._commit_event_session_or_retry()
@@ -1162,6 +1253,181 @@ class Recorder(threading.Thread):
 
         self._add_to_session(session, dbstate)
 
+    def _process_state_changed_event_into_bulk_rows(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Process a state_changed event into a row for the next bulk insert.
+
+        Only ids that are already known (pending or cached) are resolved
+        here. Everything else is resolved in batch when the rows are written
+        in _write_pending_state_rows.
+        """
+        states_meta_manager = self.states_meta_manager
+        state_attributes_manager = self.state_attributes_manager
+        entity_removed = not event.data.get("new_state")
+        entity_id = event.data["entity_id"]
+
+        row = PendingStateRow.from_event(event)
+        old_state = event.data["old_state"]
+
+        states_manager = self.states_manager
+        if pending_row := states_manager.pop_pending_row(entity_id):
+            row.link_old_state(pending_row)
+            if old_state:
+                pending_row.last_reported_ts = old_state.last_reported_timestamp
+        elif old_state_id := states_manager.pop_committed(entity_id):
+            row.old_state_id = old_state_id
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        if entity_removed:
+            row.state = None
+
+        if entity_id is None or not (
+            shared_attrs_bytes := state_attributes_manager.serialize_from_event(event)
+        ):
+            return
+
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            row.states_meta = pending_states_meta
+        else:
+            row.metadata_id = states_meta_manager.get_from_cache(entity_id)
+
+        shared_attrs = shared_attrs_bytes.decode("utf-8")
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            row.state_attributes = pending_attributes
+        elif not (
+            attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
+        ):
+            row.shared_attrs_bytes = shared_attrs_bytes
+        else:
+            row.attributes_id = attributes_id
+
+        states_manager.queue_bulk_insert_row(row)
+        # Only rows that are written can be the old state of the next row
+        if not entity_removed:
+            states_manager.add_pending_row(entity_id, row)
+        self._event_session_has_pending_writes = True
+
+    def _write_pending_state_rows(self, session: Session) -> None:
+        """Resolve ids in batch and write the pending state rows.
+
+        The StatesMeta and StateAttributes ids that could not be found
+        in the caches when the events were processed are looked up with
+        one query per chunk, new ones are added to the session, and the
+        session is flushed so every row can be written with an executemany.
+        """
+        if not (rows := self.states_manager.pop_bulk_insert_rows()):
+            return
+        states_meta_manager = self.states_meta_manager
+        state_attributes_manager = self.state_attributes_manager
+
+        metadata_ids = states_meta_manager.get_many(
+            {
+                row.entity_id
+                for row in rows
+                if row.states_meta is None and row.metadata_id is None
+            },
+            session,
+            True,
+        )
+        shared_attrs_bytes_by_str = {
+            row.shared_attrs_bytes.decode("utf-8"): row.shared_attrs_bytes
+            for row in rows
+            if row.shared_attrs_bytes is not None
+        }
+        attributes_ids = state_attributes_manager.get_many(
+            (
+                (shared_attrs, StateAttributes.hash_shared_attrs_bytes(attrs_bytes))
+                for shared_attrs, attrs_bytes in shared_attrs_bytes_by_str.items()
+            ),
+            session,
+        )
+
+        rows_to_write: list[PendingStateRow] = []
+        for row in rows:
+            if row.states_meta is None and row.metadata_id is None:
+                entity_id = row.entity_id
+                if metadata_id := metadata_ids.get(entity_id):
+                    row.metadata_id = metadata_id
+                elif pending_states_meta := states_meta_manager.get_pending(entity_id):
+                    row.states_meta = pending_states_meta
+                elif states_meta_manager.active and row.state is None:
+                    # If the entity was removed, we don't need to add it to the
+                    # StatesMeta table if it does not have a metadata_id allocated
+                    # to it as it either never existed or was just renamed.
+                    continue
+                else:
+                    states_meta = StatesMeta(entity_id=entity_id)
+                    states_meta_manager.add_pending(states_meta)
+                    self._add_to_session(session, states_meta)
+                    row.states_meta = states_meta
+
+            if (shared_attrs_bytes := row.shared_attrs_bytes) is not None:
+                shared_attrs = shared_attrs_bytes.decode("utf-8")
+                if attributes_id := attributes_ids.get(shared_attrs):
+                    row.attributes_id = attributes_id
+                elif pending_attributes := state_attributes_manager.get_pending(
+                    shared_attrs
+                ):
+                    row.state_attributes = pending_attributes
+                else:
+                    dbstate_attributes = StateAttributes(
+                        shared_attrs=shared_attrs,
+                        hash=StateAttributes.hash_shared_attrs_bytes(
+                            shared_attrs_bytes
+                        ),
+                    )
+                    state_attributes_manager.add_pending(dbstate_attributes)
+                    self._add_to_session(session, dbstate_attributes)
+                    row.state_attributes = dbstate_attributes
+            rows_to_write.append(row)
+
+        # Assign ids to the new StatesMeta and StateAttributes
+        session.flush()
+
+        # Rows that are skipped can leave gaps in the depths
+        generations: defaultdict[int, list[PendingStateRow]] = defaultdict(list)
+        for row in rows_to_write:
+            if row.states_meta is not None:
+                row.metadata_id = row.states_meta.metadata_id
+            if row.state_attributes is not None:
+                row.attributes_id = row.state_attributes.attributes_id
+            generations[row.depth].append(row)
+
+        # Rows that replace another row in the same batch need the
+        # state_id of the previous row so they are written in generations
+        include_entity_id = not states_meta_manager.active
+        for depth in sorted(generations):
+            generation = generations[depth]
+            for row in generation:
+                if (old_row := row.old_state) is not None:
+                    row.old_state_id = old_row.state_id
+            self._insert_state_rows(session, generation, include_entity_id)
+
+    def _insert_state_rows(
+        self, session: Session, rows: list[PendingStateRow], include_entity_id: bool
+    ) -> None:
+        """Insert state rows and assign their state_ids."""
+        connection = session.connection()
+        assert self.engine is not None
+        if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            result = connection.execute(
+                insert(States).returning(States.state_id, sort_by_parameter_order=True),
+                [row.as_insert_params(include_entity_id) for row in rows],
+            )
+            for row, state_id in zip(rows, result.scalars(), strict=True):
+                row.state_id = state_id
+            return
+        # The database does not support RETURNING with executemany
+        # so we need to insert the rows one at a time to get the ids
+        for row in rows:
+            result = connection.execute(
+                insert(States), row.as_insert_params(include_entity_id)
+            )
+            row.state_id = result.inserted_primary_key[0]
+
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
         if (
@@ -1207,6 +1473,10 @@ class Recorder(threading.Thread):
         assert self.event_session is not None
         session = self.event_session
         self._commits_without_expire += 1
+        commit_start = time.monotonic()
+
+        if self.bulk_insert:
+            self._write_pending_state_rows(session)
 
         if (
             pending_last_reported
@@ -1224,6 +1494,8 @@ class Recorder(threading.Thread):
                     ],
                 )
         session.commit()
+        self.throughput.record_commit(time.monotonic() - commit_start)
+        self.history_cache.commit()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1257,6 +1529,8 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.throughput.discard_uncommitted()
+        self.history_cache.discard_pending()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -1376,6 +1650,12 @@ class Recorder(threading.Thread):
             self.database_engine = database_engine
             self.max_bind_vars = database_engine.max_bind_vars
         self._completed_first_database_setup = True
+        if isinstance(self.engine.pool, RecorderPool) and (
+            threading.current_thread().name.startswith(DB_QUERY_WORKER_PREFIX)
+        ):
+            # The query workers only read so their connections are
+            # made read-only to make sure they never take the write lock.
+            execute_on_connection(dbapi_connection, "PRAGMA query_only=ON")
 
     def _setup_connection(self) -> None:
         """Ensure database is ready to fly."""
@@ -1389,6 +1669,7 @@ class Recorder(threading.Thread):
             kwargs["pool_reset_on_return"] = None
         elif self.db_url.startswith(SQLITE_URL_PREFIX):
             kwargs["poolclass"] = RecorderPool
+            kwargs["pool_size"] = POOL_SIZE + self.query_workers
             kwargs["recorder_and_worker_thread_ids"] = (
                 self.recorder_and_worker_thread_ids
             )
@@ -1430,6 +1711,7 @@ class Recorder(threading.Thread):
 
     def _close_connection(self) -> None:
         """Close the connection."""
+        self.history_cache.clear()
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -1479,13 +1761,18 @@ class Recorder(threading.Thread):
         try:
             self._end_session()
         finally:
-            if self._db_executor:
-                # We shutdown the executor without forcefully
+            executors = [
+                executor
+                for executor in (self._db_executor, self._query_executor)
+                if executor
+            ]
+            for executor in executors:
+                # We shutdown the executors without forcefully
                 # joining the threads until after we have tried
                 # to cleanly close the connection.
-                self._db_executor.shutdown(join_threads_or_timeout=False)
+                executor.shutdown(join_threads_or_timeout=False)
             self._close_connection()
-            if self._db_executor:
+            for executor in executors:
                 # After the connection is closed, we can join the threads
                 # or forcefully shutdown the threads if they take too long.
-                self._db_executor.join_threads_or_timeout()
+                executor.join_threads_or_timeout()
@@ -53,6 +53,7 @@ from homeassistant.util.json import (
     json_loads,
     json_loads_object,
 )
+from homeassistant.util.read_only_dict import InternedReadOnlyDict
 
 from .const import ALL_DOMAIN_EXCLUDE_ATTRS, SupportedDialect
 from .models import (
@@ -509,14 +510,10 @@ class States(Base):
         else:
             state_value = state.state
             last_updated_ts = state.last_updated_timestamp
-            if state.last_updated == state.last_changed:
+            if (last_changed_ts := state.last_changed_timestamp) == last_updated_ts:
                 last_changed_ts = None
-            else:
-                last_changed_ts = state.last_changed_timestamp
-            if state.last_updated == state.last_reported:
+            if (last_reported_ts := state.last_reported_timestamp) == last_updated_ts:
                 last_reported_ts = None
-            else:
-                last_reported_ts = state.last_reported_timestamp
         context = event.context
         return States(
             state=state_value,
@@ -616,10 +613,20 @@ class StateAttributes(Base):
                 exclude_attrs -= _MATCH_ALL_KEEP
         else:
             exclude_attrs = ALL_DOMAIN_EXCLUDE_ATTRS
-        encoder = json_bytes_strip_null if dialect == PSQL_DIALECT else json_bytes
-        bytes_result = encoder(
-            {k: v for k, v in state.attributes.items() if k not in exclude_attrs}
-        )
+        attributes = state.attributes
+        if dialect == PSQL_DIALECT:
+            bytes_result = json_bytes_strip_null(
+                {k: v for k, v in attributes.items() if k not in exclude_attrs}
+            )
+        elif type(attributes) is InternedReadOnlyDict and exclude_attrs.isdisjoint(
+            attributes
+        ):
+            # The JSON of shared attributes is only serialized once
+            bytes_result = attributes.json_bytes
+        else:
+            bytes_result = json_bytes(
+                {k: v for k, v in attributes.items() if k not in exclude_attrs}
+            )
         if len(bytes_result) > MAX_STATE_ATTRS_BYTES:
             _LOGGER.warning(
                 "State attributes for %s exceed maximum size of %s bytes. "
@@ -0,0 +1,116 @@
+"""Cache the significant states of closed time ranges."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+from typing import Any
+
+from lru import LRU
+from sqlalchemy.engine.row import Row
+
+# The maximum number of entity timelines to keep in the cache
+HISTORY_CACHE_SIZE = 512
+
+# Timelines with more rows than this are not cached
+# to keep the memory used by the cache bounded.
+HISTORY_CACHE_MAX_ROWS = 20000
+
+type HistoryCacheKey = tuple[int, bool, bool]
+
+
+@dataclass(slots=True, frozen=True)
+class CachedTimeline:
+    """The significant state rows of an entity in a closed time range.
+
+    The rows are sorted by last_updated_ts and include every row
+    with start_ts < last_updated_ts < end_ts.
+    """
+
+    start_ts: float
+    end_ts: float
+    rows: list[Row[Any]]
+
+
+class HistoryCache:
+    """An LRU cache of the significant states of entities.
+
+    Only rows older than the time of the last state that was committed
+    to the database are cached since rows before that point in time can
+    only change when the database is purged.
+
+    The watermark is only written from the recorder thread while the
+    timelines are read and written from the executor so access to them
+    is protected by a lock.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the history cache."""
+        self._lock = threading.Lock()
+        self._timelines: LRU[HistoryCacheKey, CachedTimeline] = LRU(HISTORY_CACHE_SIZE)
+        self.generation = 0
+        self.committed_ts = 0.0
+        self._pending_ts = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def process_state_time(self, last_updated_ts: float) -> None:
+        """Track the time of a state that was added to the session.
+
+        If the state is older than the watermark, it belongs to a range
+        that may already be cached and the cache is cleared.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if last_updated_ts < self.committed_ts:
+            self.clear()
+        elif last_updated_ts > self._pending_ts:
+            self._pending_ts = last_updated_ts
+
+    def commit(self) -> None:
+        """Move the watermark after the session was committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self.committed_ts = self._pending_ts
+
+    def discard_pending(self) -> None:
+        """Discard the states of a session that was rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_ts = self.committed_ts
+
+    def clear(self) -> None:
+        """Clear the cache.
+
+        This must be called after rows were deleted from the
+        states table and the deletion was committed.
+        """
+        with self._lock:
+            self._timelines.clear()
+            self.generation += 1
+
+    def get(self, key: HistoryCacheKey, start_ts: float) -> CachedTimeline | None:
+        """Return the timeline for key if it starts at or before start_ts."""
+        with self._lock:
+            if (
+                timeline := self._timelines.get(key)
+            ) is not None and timeline.start_ts <= start_ts:
+                self.hits += 1
+                return timeline
+            self.misses += 1
+            return None
+
+    def store(
+        self, key: HistoryCacheKey, timeline: CachedTimeline, generation: int
+    ) -> None:
+        """Store a timeline that was read when the cache was at generation."""
+        if len(timeline.rows) > HISTORY_CACHE_MAX_ROWS:
+            return
+        with self._lock:
+            if generation == self.generation:
+                self._timelines[key] = timeline
@@ -19,3 +19,7 @@ NEED_ATTRIBUTE_DOMAINS = {
     "thermostat",
     "water_heater",
 }
+
+# The number of rows fetched from the database and converted
+# at a time when significant states are returned in chunks
+DEFAULT_HISTORY_CHUNK_ROWS = 8192
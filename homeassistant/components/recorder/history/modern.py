@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Iterator
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from collections.abc import Callable, Generator, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import groupby
+import math
 from operator import itemgetter
 from typing import Any, cast
 
@@ -21,6 +25,7 @@ from sqlalchemy import (
 )
 from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 from homeassistant.const import COMPRESSED_STATE_LAST_UPDATED, COMPRESSED_STATE_STATE
 from homeassistant.core import HomeAssistant, State, split_entity_id
@@ -38,7 +43,9 @@ from ..models import (
     row_to_compressed_state,
 )
 from ..util import execute_stmt_lambda_element, session_scope
+from .cache import CachedTimeline, HistoryCache
 from .const import (
+    DEFAULT_HISTORY_CHUNK_ROWS,
     LAST_CHANGED_KEY,
     NEED_ATTRIBUTE_DOMAINS,
     SIGNIFICANT_DOMAINS,
@@ -229,6 +236,61 @@ def get_significant_states_with_session(
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if not (
+        query := _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+        )
+    ):
+        return {}
+    return _sorted_states_to_dict(
+        _significant_states_rows(
+            get_instance(hass).history_cache, session, query, end_time
+        ),
+        query.start_time_ts if query.include_start_time_state else None,
+        entity_ids,
+        query.entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+    )
+
+
+@dataclass(slots=True)
+class _SignificantStatesQuery:
+    """The parameters of a significant states query."""
+
+    entity_id_to_metadata_id: dict[str, int | None]
+    metadata_ids: list[int]
+    metadata_ids_in_significant_domains: list[int]
+    start_time_ts: float
+    end_time_ts: float | None
+    significant_changes_only: bool
+    no_attributes: bool
+    include_start_time_state: bool
+    run_start_ts: float | None
+
+
+def _significant_states_query(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> _SignificantStatesQuery | None:
+    """Resolve the parameters of a significant states query.
+
+    Returns None if none of the entities have been recorded.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
@@ -237,7 +299,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -251,10 +313,33 @@ def get_significant_states_with_session(
         run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
     ):
         include_start_time_state = False
-    start_time_ts = dt_util.utc_to_timestamp(start_time)
-    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    return _SignificantStatesQuery(
+        entity_id_to_metadata_id,
+        metadata_ids,
+        metadata_ids_in_significant_domains,
+        dt_util.utc_to_timestamp(start_time),
+        datetime_to_timestamp_or_none(end_time),
+        significant_changes_only,
+        no_attributes,
+        include_start_time_state,
+        run_start_ts,
+    )
+
+
+def _significant_states_lambda_stmt(
+    query: _SignificantStatesQuery,
+    metadata_ids: list[int],
+    start_time_ts: float,
+    end_time_ts: float | None,
+    include_start_time_state: bool,
+) -> StatementLambdaElement:
+    """Return the statement for the significant states of metadata_ids."""
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
-    stmt = lambda_stmt(
+    metadata_ids_in_significant_domains = query.metadata_ids_in_significant_domains
+    significant_changes_only = query.significant_changes_only
+    no_attributes = query.no_attributes
+    run_start_ts = query.run_start_ts
+    return lambda_stmt(
         lambda: _significant_states_stmt(
             start_time_ts,
             end_time_ts,
@@ -275,17 +360,282 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
-        entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
+
+
+def _start_time_states_lambda_stmt(
+    query: _SignificantStatesQuery,
+) -> StatementLambdaElement:
+    """Return the statement for the states at the start time of the query."""
+    metadata_ids = query.metadata_ids
+    single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
+    run_start_ts = query.run_start_ts
+    assert run_start_ts is not None
+    start_time_ts = query.start_time_ts
+    no_attributes = query.no_attributes
+    include_last_changed = not query.significant_changes_only
+    return lambda_stmt(
+        lambda: _get_start_time_state_stmt(
+            run_start_ts,
+            start_time_ts,
+            single_metadata_id,
+            metadata_ids,
+            no_attributes,
+            include_last_changed,
+        ),
+        track_on=[bool(single_metadata_id), no_attributes, include_last_changed],
     )
 
 
+def _group_rows_by_metadata_id(rows: Iterable[Row]) -> dict[int, list[Row]]:
+    """Group rows sorted by metadata_id."""
+    return {
+        metadata_id: list(group)
+        for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"]))
+    }
+
+
+def _significant_states_rows(
+    cache: HistoryCache,
+    session: Session,
+    query: _SignificantStatesQuery,
+    end_time: datetime | None,
+) -> Iterable[Row]:
+    """Return the rows of a significant states query.
+
+    Rows before the committed watermark of the history cache can no longer
+    change, so they are served from the cache when possible and only the
+    tail after the cached range is fetched from the database.
+    """
+    start_time_ts = query.start_time_ts
+    end_time_ts = query.end_time_ts
+    # Read the watermark before querying so every row before it is visible
+    generation = cache.generation
+    closed_ts = cache.committed_ts
+    if end_time_ts is not None:
+        closed_ts = min(closed_ts, end_time_ts)
+    if start_time_ts >= closed_ts:
+        return execute_stmt_lambda_element(
+            session,
+            _significant_states_lambda_stmt(
+                query,
+                query.metadata_ids,
+                start_time_ts,
+                end_time_ts,
+                query.include_start_time_state,
+            ),
+            None,
+            end_time,
+            orm_rows=False,
+        )
+
+    key_suffix = (query.significant_changes_only, query.no_attributes)
+    timelines: dict[int, CachedTimeline] = {}
+    missing_metadata_ids: list[int] = []
+    for metadata_id in query.metadata_ids:
+        if timeline := cache.get((metadata_id, *key_suffix), start_time_ts):
+            timelines[metadata_id] = timeline
+        else:
+            missing_metadata_ids.append(metadata_id)
+
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    last_updated_key = itemgetter(last_updated_ts_idx)
+
+    def _store_missing(rows_by_metadata_id: dict[int, list[Row]]) -> None:
+        """Store the timelines of the entities that were not cached."""
+        for metadata_id in missing_metadata_ids:
+            cache.store(
+                (metadata_id, *key_suffix),
+                CachedTimeline(
+                    start_time_ts,
+                    closed_ts,
+                    [
+                        row
+                        for row in rows_by_metadata_id.get(metadata_id, ())
+                        if start_time_ts < row[last_updated_ts_idx] < closed_ts
+                    ],
+                ),
+                generation,
+            )
+
+    if not timelines:
+        rows = list(
+            execute_stmt_lambda_element(
+                session,
+                _significant_states_lambda_stmt(
+                    query,
+                    query.metadata_ids,
+                    start_time_ts,
+                    end_time_ts,
+                    query.include_start_time_state,
+                ),
+                None,
+                end_time,
+                orm_rows=False,
+            )
+        )
+        _store_missing(_group_rows_by_metadata_id(rows))
+        return rows
+
+    rows_by_metadata_id: dict[int, list[Row]] = defaultdict(list)
+    if query.include_start_time_state:
+        for metadata_id, rows in _group_rows_by_metadata_id(
+            execute_stmt_lambda_element(
+                session, _start_time_states_lambda_stmt(query), orm_rows=False
+            )
+        ).items():
+            rows_by_metadata_id[metadata_id].extend(rows)
+
+    if missing_metadata_ids:
+        missing_rows_by_metadata_id = _group_rows_by_metadata_id(
+            execute_stmt_lambda_element(
+                session,
+                _significant_states_lambda_stmt(
+                    query, missing_metadata_ids, start_time_ts, end_time_ts, False
+                ),
+                None,
+                end_time,
+                orm_rows=False,
+            )
+        )
+        for metadata_id, rows in missing_rows_by_metadata_id.items():
+            rows_by_metadata_id[metadata_id].extend(rows)
+        _store_missing(missing_rows_by_metadata_id)
+
+    # Fetch everything after the oldest end of the cached timelines
+    tail_start_ts = min(timeline.end_ts for timeline in timelines.values())
+    tail_rows_by_metadata_id: dict[int, list[Row]] = {}
+    if end_time_ts is None or tail_start_ts < end_time_ts:
+        tail_rows_by_metadata_id = _group_rows_by_metadata_id(
+            execute_stmt_lambda_element(
+                session,
+                _significant_states_lambda_stmt(
+                    query,
+                    list(timelines),
+                    # The statement only selects rows after the start time
+                    # and the cached range does not include its end
+                    math.nextafter(tail_start_ts, -math.inf),
+                    end_time_ts,
+                    False,
+                ),
+                orm_rows=False,
+            )
+        )
+
+    for metadata_id, timeline in timelines.items():
+        cached_rows = timeline.rows
+        start_idx = bisect_right(cached_rows, start_time_ts, key=last_updated_key)
+        end_idx = (
+            len(cached_rows)
+            if end_time_ts is None
+            else bisect_left(cached_rows, end_time_ts, key=last_updated_key)
+        )
+        new_rows = [
+            row
+            for row in tail_rows_by_metadata_id.get(metadata_id, ())
+            if row[last_updated_ts_idx] >= timeline.end_ts
+        ]
+        entity_rows = rows_by_metadata_id[metadata_id]
+        entity_rows.extend(cached_rows[start_idx:end_idx])
+        entity_rows.extend(
+            row for row in new_rows if row[last_updated_ts_idx] > start_time_ts
+        )
+        if closed_ts > timeline.end_ts:
+            cache.store(
+                (metadata_id, *key_suffix),
+                CachedTimeline(
+                    timeline.start_ts,
+                    closed_ts,
+                    [
+                        *cached_rows,
+                        *(
+                            row
+                            for row in new_rows
+                            if row[last_updated_ts_idx] < closed_ts
+                        ),
+                    ],
+                ),
+                generation,
+            )
+
+    return [
+        row
+        for metadata_id in sorted(rows_by_metadata_id)
+        for row in rows_by_metadata_id[metadata_id]
+    ]
+
+
+def iter_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    entity_ids: list[str] | None = None,
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    chunk_size: int = DEFAULT_HISTORY_CHUNK_ROWS,
+) -> Generator[dict[str, list[dict[str, Any]]]]:
+    """Yield significant states in the compressed state format in chunks.
+
+    The rows are fetched from the database chunk_size rows at a time and
+    each chunk is converted before the next one is fetched so the memory
+    used does not grow with the size of the time window.
+
+    Every chunk only contains the entities that have states in it and
+    the states of an entity may be split over multiple chunks. Combining
+    all chunks results in the same states as get_significant_states with
+    compressed_state_format.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if not (
+            query := _significant_states_query(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+            )
+        ):
+            return
+        stmt = _significant_states_lambda_stmt(
+            query,
+            query.metadata_ids,
+            query.start_time_ts,
+            query.end_time_ts,
+            query.include_start_time_state,
+        )
+        start_time_ts = query.start_time_ts if query.include_start_time_state else None
+        # Track the last state of each entity across chunks so
+        # minimal responses are only deduplicated once
+        prev_states: dict[int, str | None] = {}
+        # stream_results uses a server side cursor where the database
+        # supports one so the rows are not all buffered by the driver
+        for partition in (
+            session.connection()
+            .execute(
+                stmt,
+                execution_options={"stream_results": True, "yield_per": chunk_size},
+            )
+            .partitions()
+        ):
+            if chunk := _sorted_states_to_dict(
+                partition,
+                start_time_ts,
+                entity_ids,
+                query.entity_id_to_metadata_id,
+                minimal_response,
+                True,
+                no_attributes=no_attributes,
+                prev_states=prev_states,
+            ):
+                yield cast(dict[str, list[dict[str, Any]]], chunk)
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -680,6 +1030,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    prev_states: dict[int, str | None] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -691,6 +1042,10 @@ def _sorted_states_to_dict(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When the states are converted in chunks, prev_states holds the last
+    state of each metadata_id seen in the previous chunks for minimal
+    responses and is updated with the last state of this chunk.
     """
     field_map = _FIELD_MAP
     state_class: Callable[
@@ -758,7 +1113,9 @@ def _sorted_states_to_dict(
         # State for the first and last response. All the states
         # in-between only provide the "state" and the
         # "last_changed".
-        if not ent_results:
+        if prev_states is not None and metadata_id in prev_states:
+            prev_state = prev_states[metadata_id]
+        elif not ent_results:
             if (first_state := next(group, None)) is None:
                 continue
             prev_state = first_state[state_idx]
@@ -793,6 +1150,8 @@ def _sorted_states_to_dict(
                     if (state := row[state_idx]) != prev_state
                 ]
             )
+            if prev_states is not None:
+                prev_states[metadata_id] = prev_state
             continue
 
         # Non-compressed state format returns an ISO formatted string
@@ -809,6 +1168,8 @@ def _sorted_states_to_dict(
                 if (state := row[state_idx]) != prev_state
             ]
         )
+        if prev_states is not None:
+            prev_states[metadata_id] = prev_state
 
     if descending:
         for ent_results in result.values():
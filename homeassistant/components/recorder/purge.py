@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 from itertools import zip_longest
 import logging
+import math
+from operator import itemgetter
 import time
 from typing import TYPE_CHECKING
 
@@ -18,6 +21,8 @@ from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
+    count_attributes_ids_in_states_range,
+    count_states_with_attributes_ids,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
@@ -27,9 +32,11 @@ from .queries import (
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_in_range,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_in_range,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
     find_events_to_purge,
@@ -38,6 +45,9 @@ from .queries import (
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
     find_short_term_statistics_to_purge,
+    find_states_ids_in_range,
+    find_states_range_end_to_purge,
+    find_states_to_compact,
     find_states_to_purge,
     find_statistics_runs_to_purge,
 )
@@ -53,6 +63,26 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The length of the buckets numeric states are compacted into
+COMPACT_BUCKET_SECONDS = 300
+
+
+@dataclass(slots=True)
+class PurgeProgress:
+    """Progress of a range purge that runs over several purge cycles."""
+
+    states: int = 0
+    attributes: int = 0
+    elapsed: float = 0.0
+    purged_until_ts: float | None = None
+
+    @property
+    def rows_per_second(self) -> float:
+        """Return how many rows were deleted per second spent purging."""
+        if not self.elapsed:
+            return 0.0
+        return (self.states + self.attributes) / self.elapsed
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -86,9 +116,14 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
+            if instance.range_purge:
+                has_more_to_purge |= _purge_states_and_attributes_by_range(
+                    instance, session, states_batch_size, purge_before
+                )
+            else:
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
             has_more_to_purge |= _purge_events_and_data_ids(
                 instance, session, events_batch_size, purge_before
             )
@@ -123,6 +158,15 @@ def purge_old_data(
             _purge_old_entity_ids(instance, session)
 
         _purge_old_recorder_runs(instance, session, purge_before)
+    if (progress := instance.purge_progress) is not None:
+        instance.purge_progress = None
+        _LOGGER.info(
+            "Purged %s states and %s attributes in %.1f seconds (%.0f rows/s)",
+            progress.states,
+            progress.attributes,
+            progress.elapsed,
+            progress.rows_per_second,
+        )
     if repack:
         repack_database(instance)
     return True
@@ -210,6 +254,124 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _purge_states_and_attributes_by_range(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge states in ranges of last_updated_ts and the attributes they leave unused.
+
+    Each range is found with the index on last_updated_ts and holds
+    max_bind_vars states plus the states that share the last_updated_ts
+    of the last one, so the states are deleted without selecting their ids.
+
+    The references to the attributes are counted once per purge cycle and
+    decremented for every range, so unused attributes are found without
+    checking the remaining states after every batch.
+
+    Returns true if there are more states to purge.
+    """
+    start = time.monotonic()
+    progress = instance.purge_progress
+    if progress is None:
+        progress = instance.purge_progress = PurgeProgress()
+    max_bind_vars = instance.max_bind_vars
+    # The last state that can be purged, states are purged up to and
+    # including the end of each range
+    last_purge_ts = math.nextafter(purge_before.timestamp(), -math.inf)
+    committed_states = _select_committed_states_to_purge(
+        instance, session, last_purge_ts
+    )
+    attributes_refs: dict[int, int] = {}
+    range_end: float | None = None
+    has_remaining_states_to_purge = True
+    for _ in range(states_batch_size):
+        range_end = session.execute(
+            find_states_range_end_to_purge(purge_before.timestamp(), max_bind_vars - 1)
+        ).scalar()
+        if range_end is None:
+            # Fewer than max_bind_vars states are left to purge
+            range_end = last_purge_ts
+            has_remaining_states_to_purge = False
+        _decrement_attributes_refs(instance, session, attributes_refs, range_end)
+        session.execute(disconnect_states_rows_in_range(range_end))
+        deleted_rows = session.execute(delete_states_rows_in_range(range_end))
+        progress.states += deleted_rows.rowcount
+        progress.purged_until_ts = range_end
+        if not has_remaining_states_to_purge:
+            break
+
+    if range_end is not None:
+        # Evict any entries in the old_states cache referring to a purged state
+        instance.states_manager.evict_purged_state_ids(
+            {
+                state_id
+                for state_id, last_updated_ts in committed_states.items()
+                if last_updated_ts <= range_end
+            }
+        )
+    if unused_attributes_ids := {
+        attributes_id for attributes_id, refs in attributes_refs.items() if refs <= 0
+    }:
+        _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+        progress.attributes += len(unused_attributes_ids)
+
+    progress.elapsed += time.monotonic() - start
+    _LOGGER.debug(
+        "Purged %s states and %s attributes until %s (%.0f rows/s), remaining=%s",
+        progress.states,
+        progress.attributes,
+        progress.purged_until_ts,
+        progress.rows_per_second,
+        has_remaining_states_to_purge,
+    )
+    return has_remaining_states_to_purge
+
+
+def _select_committed_states_to_purge(
+    instance: Recorder, session: Session, last_purge_ts: float
+) -> dict[int, float]:
+    """Return the last_updated_ts of the committed states that may be purged."""
+    committed_states: dict[int, float] = {}
+    for state_ids_chunk in chunked_or_all(
+        instance.states_manager.get_committed_state_ids(), instance.max_bind_vars
+    ):
+        committed_states.update(
+            session.execute(find_states_ids_in_range(state_ids_chunk, last_purge_ts))
+            .tuples()
+            .all()
+        )
+    return committed_states
+
+
+def _decrement_attributes_refs(
+    instance: Recorder,
+    session: Session,
+    attributes_refs: dict[int, int],
+    range_end: float,
+) -> None:
+    """Decrement the references to the attributes of a range of states.
+
+    The references to attributes that were not seen before are
+    counted before the states in the range are deleted.
+    """
+    range_refs: dict[int, int] = dict(
+        session.execute(count_attributes_ids_in_states_range(range_end)).tuples().all()
+    )
+    if new_attributes_ids := range_refs.keys() - attributes_refs.keys():
+        for attributes_ids_chunk in chunked_or_all(
+            new_attributes_ids, instance.max_bind_vars
+        ):
+            attributes_refs.update(
+                session.execute(count_states_with_attributes_ids(attributes_ids_chunk))
+                .tuples()
+                .all()
+            )
+    for attributes_id, refs in range_refs.items():
+        attributes_refs[attributes_id] -= refs
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
@@ -800,3 +962,76 @@ def purge_entity_data(
         _purge_old_entity_ids(instance, session)
 
     return True
+
+
+@retryable_database_job("compact_states")
+def compact_states(instance: Recorder, start: datetime, end: datetime) -> bool:
+    """Compact the numeric states between start and end.
+
+    The states of each entity are grouped in buckets of COMPACT_BUCKET_SECONDS,
+    and of the numeric states in each bucket only the first, the last, the
+    minimum and the maximum are kept. States that are not numeric, such as
+    unavailable, are always kept since they mark gaps in the history, and
+    they split the bucket so the states on each side of a gap are kept.
+
+    The states that are kept are regular states so the history
+    queries serve the compacted history like any other history.
+    """
+    state_ids: set[int] = set()
+    attributes_ids: set[int] = set()
+    with session_scope(session=instance.get_session()) as session:
+        bucket_key: tuple[int | None, int] | None = None
+        bucket: list[tuple[int, float, int | None]] = []
+        for (
+            state_id,
+            metadata_id,
+            last_updated_ts,
+            state,
+            attributes_id,
+        ) in session.execute(
+            find_states_to_compact(start.timestamp(), end.timestamp())
+        ).tuples():
+            key = (metadata_id, int(last_updated_ts // COMPACT_BUCKET_SECONDS))
+            if key != bucket_key:
+                _select_compacted_states(bucket, state_ids, attributes_ids)
+                bucket_key = key
+                bucket = []
+            try:
+                value = float(state)
+            except (TypeError, ValueError):
+                value = math.nan
+            if math.isfinite(value):
+                bucket.append((state_id, value, attributes_id))
+            else:
+                # The bucket is split at states that are not numeric so
+                # the first state after a gap, which ends it, is kept
+                _select_compacted_states(bucket, state_ids, attributes_ids)
+                bucket = []
+        _select_compacted_states(bucket, state_ids, attributes_ids)
+
+        for state_ids_chunk in chunked_or_all(state_ids, instance.max_bind_vars):
+            _purge_state_ids(instance, session, set(state_ids_chunk))
+        _purge_unused_attributes_ids(instance, session, attributes_ids)
+    _LOGGER.debug("Compacted %s states between %s and %s", len(state_ids), start, end)
+    return True
+
+
+def _select_compacted_states(
+    bucket: list[tuple[int, float, int | None]],
+    state_ids: set[int],
+    attributes_ids: set[int],
+) -> None:
+    """Select the states of a bucket that are not kept when it is compacted."""
+    if len(bucket) <= 4:
+        return
+    keep = {
+        bucket[0][0],
+        bucket[-1][0],
+        min(bucket, key=itemgetter(1))[0],
+        max(bucket, key=itemgetter(1))[0],
+    }
+    for state_id, _, attributes_id in bucket:
+        if state_id not in keep:
+            state_ids.add(state_id)
+            if attributes_id:
+                attributes_ids.add(attributes_id)
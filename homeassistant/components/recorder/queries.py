@@ -5,7 +5,17 @@ from __future__ import annotations
 from collections.abc import Iterable
 from datetime import datetime
 
-from sqlalchemy import delete, distinct, func, lambda_stmt, select, union_all, update
+from sqlalchemy import (
+    and_,
+    delete,
+    distinct,
+    func,
+    lambda_stmt,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.orm import aliased
 from sqlalchemy.sql.lambdas import StatementLambdaElement
 from sqlalchemy.sql.selectable import Select
 
@@ -44,6 +54,42 @@ def get_shared_attributes(hashes: list[int]) -> StatementLambdaElement:
     )
 
 
+_LATEST_STATES = aliased(States)
+
+
+def get_latest_shared_attributes(limit: int) -> StatementLambdaElement:
+    """Load the shared attributes of the latest state of each entity."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id, StateAttributes.shared_attrs)
+        .select_from(StatesMeta)
+        .join(
+            States,
+            and_(
+                States.metadata_id == StatesMeta.metadata_id,
+                States.last_updated_ts
+                == (
+                    select(func.max(_LATEST_STATES.last_updated_ts))
+                    .where(_LATEST_STATES.metadata_id == StatesMeta.metadata_id)
+                    .correlate(StatesMeta)
+                    .scalar_subquery()
+                ),
+            ),
+        )
+        .join(StateAttributes, StateAttributes.attributes_id == States.attributes_id)
+        .limit(limit)
+    )
+
+
+def count_shared_attributes() -> StatementLambdaElement:
+    """Count the shared attributes in the database."""
+    return lambda_stmt(lambda: select(func.count(StateAttributes.attributes_id)))
+
+
+def get_shared_attributes_hashes() -> StatementLambdaElement:
+    """Load the hashes of all shared attributes from the database."""
+    return lambda_stmt(lambda: select(StateAttributes.hash))
+
+
 def get_shared_event_datas(hashes: list[int]) -> StatementLambdaElement:
     """Load shared event data from the database."""
     return lambda_stmt(
@@ -636,6 +682,106 @@ def find_states_to_purge(
     )
 
 
+def find_states_range_end_to_purge(
+    purge_before: float, offset: int
+) -> StatementLambdaElement:
+    """Find the last_updated_ts that ends the next range of states to purge.
+
+    The range ends at the state at offset in the index on last_updated_ts.
+    """
+    return lambda_stmt(
+        lambda: select(States.last_updated_ts)
+        .filter(States.last_updated_ts < purge_before)
+        .order_by(States.last_updated_ts)
+        .offset(offset)
+        .limit(1)
+    )
+
+
+def count_attributes_ids_in_states_range(range_end: float) -> StatementLambdaElement:
+    """Count the states that use each attributes_id in a range of states."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count(States.state_id))
+        .filter(States.last_updated_ts <= range_end)
+        .filter(States.attributes_id.is_not(None))
+        .group_by(States.attributes_id)
+    )
+
+
+def count_states_with_attributes_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Count the states that use each attributes_id."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count(States.attributes_id))
+        .filter(States.attributes_id.in_(attributes_ids))
+        .group_by(States.attributes_id)
+    )
+
+
+def find_states_ids_in_range(
+    state_ids: Iterable[int], range_end: float
+) -> StatementLambdaElement:
+    """Find which of the state_ids are in a range of states."""
+    return lambda_stmt(
+        lambda: select(States.state_id, States.last_updated_ts)
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.last_updated_ts <= range_end)
+    )
+
+
+_PURGED_STATES = aliased(States)
+
+
+def disconnect_states_rows_in_range(range_end: float) -> StatementLambdaElement:
+    """Disconnect states rows from the states in a range of states.
+
+    The purged state ids are selected from a derived table since
+    MySQL does not allow selecting from the table that is updated
+    in a subquery.
+    """
+    return lambda_stmt(
+        lambda: update(States)
+        .where(
+            States.old_state_id.in_(
+                select(
+                    select(_PURGED_STATES.state_id)
+                    .filter(_PURGED_STATES.last_updated_ts <= range_end)
+                    .subquery()
+                    .c.state_id
+                )
+            )
+        )
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_in_range(range_end: float) -> StatementLambdaElement:
+    """Delete the states rows in a range of states."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .filter(States.last_updated_ts <= range_end)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_states_to_compact(start_ts: float, end_ts: float) -> StatementLambdaElement:
+    """Find the states in a time range ordered by entity and time."""
+    return lambda_stmt(
+        lambda: select(
+            States.state_id,
+            States.metadata_id,
+            States.last_updated_ts,
+            States.state,
+            States.attributes_id,
+        )
+        .filter(States.last_updated_ts >= start_ts)
+        .filter(States.last_updated_ts < end_ts)
+        .order_by(States.metadata_id, States.last_updated_ts)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
@@ -0,0 +1,94 @@
+"""Limit and measure the read-only queries that run on the query workers."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import time
+from typing import Any
+
+from homeassistant.core import callback
+
+from .const import QueryType
+
+
+class QueryTypeStats:
+    """Statistics of the queries of a single query type."""
+
+    __slots__ = ("running", "waiting", "completed", "failed", "wait_time", "run_time")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.failed = 0
+        self.wait_time = 0.0
+        self.run_time = 0.0
+
+
+class QueryLimiter:
+    """Limit how many queries of each type run at the same time.
+
+    Each query type may use all but one of the query workers so
+    a burst of one type of query, for example several dashboards
+    requesting history at once, does not hold up the others.
+
+    The limiter is only used from the event loop so no locking is needed.
+    """
+
+    def __init__(self, workers: int) -> None:
+        """Initialize the limiter for a pool of workers."""
+        self.workers = workers
+        self.limit = max(1, workers - 1)
+        self._semaphores = {
+            query_type: asyncio.Semaphore(self.limit) for query_type in QueryType
+        }
+        self._stats = {query_type: QueryTypeStats() for query_type in QueryType}
+
+    @asynccontextmanager
+    async def async_limit(self, query_type: QueryType) -> AsyncIterator[None]:
+        """Wait until a query of query_type may run and measure it."""
+        stats = self._stats[query_type]
+        stats.waiting += 1
+        start = time.monotonic()
+        try:
+            await self._semaphores[query_type].acquire()
+        finally:
+            stats.waiting -= 1
+        started = time.monotonic()
+        stats.running += 1
+        try:
+            yield
+        except BaseException:
+            stats.failed += 1
+            raise
+        else:
+            stats.completed += 1
+        finally:
+            stats.running -= 1
+            stats.wait_time += started - start
+            stats.run_time += time.monotonic() - started
+            self._semaphores[query_type].release()
+
+    @callback
+    def async_snapshot(self) -> dict[str, Any]:
+        """Return a snapshot of the queries of each type."""
+        snapshot: dict[str, Any] = {}
+        for query_type, stats in self._stats.items():
+            finished = stats.completed + stats.failed
+            snapshot[query_type] = {
+                "limit": self.limit,
+                "running": stats.running,
+                "waiting": stats.waiting,
+                "completed": stats.completed,
+                "failed": stats.failed,
+                "mean_wait_ms": round(stats.wait_time / finished * 1000, 2)
+                if finished
+                else None,
+                "mean_ms": round(stats.run_time / finished * 1000, 2)
+                if finished
+                else None,
+            }
+        return snapshot
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from collections import defaultdict
 from collections.abc import Callable, Iterable, Sequence
 import dataclasses
@@ -54,6 +55,7 @@ from .const import (
     INTEGRATION_PLATFORM_LIST_STATISTIC_IDS,
     INTEGRATION_PLATFORM_UPDATE_STATISTICS_ISSUES,
     INTEGRATION_PLATFORM_VALIDATE_STATISTICS,
+    QueryType,
     SupportedDialect,
 )
 from .db_schema import (
@@ -156,6 +158,9 @@ UNIT_CLASSES = {
 }
 
 DATA_SHORT_TERM_STATISTICS_RUN_CACHE = "recorder_short_term_statistics_run_cache"
+DATA_HOURLY_STATISTICS_ACCUMULATOR = "recorder_hourly_statistics_accumulator"
+
+SHORT_TERM_PERIODS_PER_HOUR = int(Statistics.duration / StatisticsShortTerm.duration)
 
 
 def mean(values: list[float]) -> float | None:
@@ -199,6 +204,113 @@ class ShortTermStatisticsRunCache:
         self._latest_id_by_metadata_id.update(metadata_id_to_id)
 
 
+@dataclasses.dataclass(slots=True)
+class _HourlySummary:
+    """Running summary of the short term statistics of one metadata_id."""
+
+    mean_total: float = 0.0
+    mean_count: int = 0
+    min: float | None = None
+    max: float | None = None
+    last_reset_ts: float | None = None
+    state: float | None = None
+    sum: float | None = None
+
+
+@dataclasses.dataclass(slots=True)
+class HourlyStatisticsAccumulator:
+    """Accumulate the hourly statistics while short term statistics are compiled.
+
+    The running mean, min, max and the last sum are kept in memory per
+    metadata_id so the hourly statistics can be written at the hour boundary
+    without rescanning the short term statistics table. If a period is
+    missing, compiled twice, or the short term statistics are modified behind
+    our back the hour is marked as incomplete and the caller must fall back
+    to summarizing the short term statistics in the database.
+    """
+
+    _hour_start_ts: float | None = None
+    _next_start_ts: float | None = None
+    _periods: int = 0
+    _complete: bool = False
+    _summaries: dict[int, _HourlySummary] = dataclasses.field(default_factory=dict)
+
+    def start_period(self, start: datetime) -> None:
+        """Start accumulating the short term statistics for a period."""
+        start_ts = start.timestamp()
+        if start.minute == 0:
+            self._hour_start_ts = start_ts
+            self._periods = 0
+            self._complete = True
+            self._summaries = {}
+        elif start_ts != self._next_start_ts:
+            # A period was skipped or is being compiled again after a failure
+            self._complete = False
+        self._next_start_ts = start_ts + StatisticsShortTerm.duration.total_seconds()
+        self._periods += 1
+
+    def add(self, metadata_id: int, stat: StatisticData) -> None:
+        """Add a short term statistic that was inserted in the current period."""
+        if (summary := self._summaries.get(metadata_id)) is None:
+            summary = self._summaries[metadata_id] = _HourlySummary()
+        if (mean_ := stat.get("mean")) is not None:
+            summary.mean_total += mean_
+            summary.mean_count += 1
+        if (min_ := stat.get("min")) is not None and (
+            summary.min is None or min_ < summary.min
+        ):
+            summary.min = min_
+        if (max_ := stat.get("max")) is not None and (
+            summary.max is None or max_ > summary.max
+        ):
+            summary.max = max_
+        # The periods are compiled in order so the last one wins
+        summary.last_reset_ts = datetime_to_timestamp_or_none(stat.get("last_reset"))
+        summary.state = stat.get("state")
+        summary.sum = stat.get("sum")
+
+    def invalidate(self) -> None:
+        """Mark the current hour as incomplete.
+
+        Must be called when the short term statistics are
+        modified outside of the periodic compile.
+        """
+        self._complete = False
+        self._summaries = {}
+
+    def pop_hour(
+        self, start_time_ts: float
+    ) -> dict[int, StatisticDataTimestamp] | None:
+        """Return the hourly statistics for the hour starting at start_time_ts.
+
+        Returns None if the hour was not completely accumulated.
+        """
+        complete = (
+            self._complete
+            and self._hour_start_ts == start_time_ts
+            and self._periods == SHORT_TERM_PERIODS_PER_HOUR
+        )
+        summaries = self._summaries
+        self._complete = False
+        self._summaries = {}
+        if not complete:
+            return None
+        return {
+            metadata_id: {
+                "start_ts": start_time_ts,
+                "mean": summary.mean_total / summary.mean_count
+                if summary.mean_count
+                else None,
+                "min": summary.min,
+                "max": summary.max,
+                "last_reset_ts": summary.last_reset_ts,
+                "state": summary.state,
+                "sum": summary.sum,
+            }
+            for metadata_id, summary in summaries.items()
+        }
+
+
 class BaseStatisticsRow(TypedDict, total=False):
     """A processed row of statistic data."""
 
@@ -218,6 +330,24 @@ class StatisticsRow(BaseStatisticsRow, total=False):
     change: float | None
 
 
+class StatisticsColumns(TypedDict, total=False):
+    """Processed statistic data stored as parallel columns.
+
+    All columns have the same length, the values at the same index
+    belong to the same period.
+    """
+
+    start: list[float]
+    end: list[float]
+    last_reset: list[float | None]
+    state: list[float | None]
+    sum: list[float | None]
+    min: list[float | None]
+    max: list[float | None]
+    mean: list[float | None]
+    change: list[float | None]
+
+
 def get_display_unit(
     hass: HomeAssistant,
     statistic_id: str,
@@ -388,20 +518,32 @@ def _compile_hourly_statistics_last_sum_stmt(
     )
 
 
-def _compile_hourly_statistics(session: Session, start: datetime) -> None:
+def _compile_hourly_statistics(
+    session: Session, start: datetime, accumulator: HourlyStatisticsAccumulator
+) -> None:
     """Compile hourly statistics.
 
     This will summarize 5-minute statistics for one hour:
     - average, min max is computed by a database query
     - sum is taken from the last 5-minute entry during the hour
+
+    If all the 5-minute statistics of the hour were accumulated
+    in memory while they were compiled, the database is not queried.
     """
     start_time = start.replace(minute=0)
     start_time_ts = start_time.timestamp()
     end_time = start_time + Statistics.duration
     end_time_ts = end_time.timestamp()
 
+    if (summary := accumulator.pop_hour(start_time_ts)) is not None:
+        session.add_all(
+            Statistics.from_stats_ts(metadata_id, summary_item)
+            for metadata_id, summary_item in summary.items()
+        )
+        return
+
     # Compute last hour's average, min, max
-    summary: dict[int, StatisticDataTimestamp] = {}
+    summary = {}
     stmt = _compile_hourly_statistics_summary_mean_stmt(start_time_ts, end_time_ts)
     stats = execute_stmt_lambda_element(session, stmt)
 
@@ -459,9 +601,7 @@ def compile_missing_statistics(instance: Recorder) -> bool:
 
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_compile_statistics_exception_filter(instance),
     ) as session:
         # Find the newest statistics run, if any
         if last_run := session.query(func.max(StatisticsRuns.start)).scalar():
@@ -501,9 +641,7 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     # Return if we already have 5-minute statistics for the requested period
     with session_scope(
         session=instance.get_session(),
-        exception_filter=filter_unique_constraint_integrity_error(
-            instance, "statistic"
-        ),
+        exception_filter=_compile_statistics_exception_filter(instance),
     ) as session:
         modified_statistic_ids = _compile_statistics(
             instance, session, start, fire_events
@@ -520,6 +658,26 @@ def compile_statistics(instance: Recorder, start: datetime, fire_events: bool) -
     return True
 
 
+def _compile_statistics_exception_filter(
+    instance: Recorder,
+) -> Callable[[Exception], bool]:
+    """Create an exception filter for compiling statistics.
+
+    Any error rolls back the short term statistics that were already
+    accumulated for the hourly statistics so the accumulator is invalidated.
+    """
+    unique_constraint_filter = filter_unique_constraint_integrity_error(
+        instance, "statistic"
+    )
+
+    def _filter_compile_statistics_error(err: Exception) -> bool:
+        """Invalidate the accumulator and filter unique constraint errors."""
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
+        return unique_constraint_filter(err)
+
+    return _filter_compile_statistics_error
+
+
 def _get_first_id_stmt(start: datetime) -> StatementLambdaElement:
     """Return a statement that returns the first run_id at start."""
     return lambda_stmt(lambda: select(StatisticsRuns.run_id).filter_by(start=start))
@@ -546,6 +704,8 @@ def _compile_statistics(
         return modified_statistic_ids
 
     _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+    accumulator = get_hourly_statistics_accumulator(instance.hass)
+    accumulator.start_period(start)
     platform_stats: list[StatisticResult] = []
     current_metadata: dict[str, tuple[int, StatisticMetaData]] = {}
     # Collect statistics from all platforms implementing support
@@ -586,6 +746,7 @@ def _compile_statistics(
             stats["stat"],
         ):
             new_short_term_stats.append(new_stat)
+            accumulator.add(metadata_id, stats["stat"])
 
     if start.minute == 50:
         # Once every hour, update issues
@@ -600,7 +761,7 @@ def _compile_statistics(
 
     if start.minute == 55:
         # A full hour is ready, summarize it
-        _compile_hourly_statistics(session, start)
+        _compile_hourly_statistics(session, start, accumulator)
 
     session.add(StatisticsRuns(start=start))
 
@@ -745,6 +906,7 @@ def get_metadata(
 
 def clear_statistics(instance: Recorder, statistic_ids: list[str]) -> None:
     """Clear statistics for a list of statistic_ids."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
     with session_scope(session=instance.get_session()) as session:
         instance.statistics_meta_manager.delete(session, statistic_ids)
 
@@ -796,7 +958,8 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_query_job(
+        QueryType.STATISTICS,
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -1113,6 +1276,73 @@ def _reduce_statistics_per_month(
     )
 
 
+def _reduce_statistics_columns(
+    stats: dict[str, StatisticsColumns],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Reduce hourly statistics columns to daily, weekly or monthly columns.
+
+    Instead of comparing every row with the previous one, the boundaries of
+    each period are found with a binary search in the sorted start column
+    and each column is then reduced one slice at a time.
+    """
+    result: dict[str, StatisticsColumns] = {}
+    for statistic_id, columns in stats.items():
+        starts = columns["start"]
+        num_rows = len(starts)
+        period_starts: list[float] = []
+        period_ends: list[float] = []
+        slices: list[tuple[int, int]] = []
+        idx = 0
+        while idx < num_rows:
+            start, end = period_start_end(starts[idx])
+            end_idx = bisect_left(starts, end, idx + 1)
+            period_starts.append(start)
+            period_ends.append(end)
+            slices.append((idx, end_idx))
+            idx = end_idx
+
+        reduced: StatisticsColumns = {"start": period_starts, "end": period_ends}
+        if "mean" in types:
+            mean_column = columns["mean"]
+            reduced["mean"] = [
+                mean(values)
+                if (values := [v for v in mean_column[lo:hi] if v is not None])
+                else None
+                for lo, hi in slices
+            ]
+        if "min" in types:
+            min_column = columns["min"]
+            reduced["min"] = [
+                min(values)
+                if (values := [v for v in min_column[lo:hi] if v is not None])
+                else None
+                for lo, hi in slices
+            ]
+        if "max" in types:
+            max_column = columns["max"]
+            reduced["max"] = [
+                max(values)
+                if (values := [v for v in max_column[lo:hi] if v is not None])
+                else None
+                for lo, hi in slices
+            ]
+        # The last row of the period holds the last_reset, state and sum
+        last_rows = [hi - 1 for _, hi in slices]
+        for key in ("last_reset", "state", "sum"):
+            if key in types:
+                column: list[float | None] = columns.get(key, [])  # type: ignore[assignment]
+                reduced[key] = (  # type: ignore[literal-required]
+                    [column[row] for row in last_rows]
+                    if column
+                    else [None] * len(last_rows)
+                )
+        result[statistic_id] = reduced
+
+    return result
+
+
 def _generate_statistics_during_period_stmt(
     start_time: datetime,
     end_time: datetime | None,
@@ -1647,22 +1877,20 @@ def _extract_metadata_and_discard_impossible_columns(
     return metadata_ids
 
 
-def _augment_result_with_change(
+def _get_sums_before_period(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
     units: dict[str, str] | None,
-    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
     table: type[Statistics | StatisticsShortTerm],
     metadata: dict[str, tuple[int, StatisticMetaData]],
-    result: dict[str, list[StatisticsRow]],
-) -> None:
-    """Add change to the result."""
-    drop_sum = "sum" not in _types
-    prev_sums = {}
+    statistic_ids: Iterable[str],
+) -> dict[str, float | None]:
+    """Return the sum of each statistic at start_time, converted to display units."""
+    prev_sums: dict[str, float | None] = {}
     if tmp := _statistics_at_time(
         session,
-        {metadata[statistic_id][0] for statistic_id in result},
+        {metadata[statistic_id][0] for statistic_id in statistic_ids},
         table,
         start_time,
         {"sum"},
@@ -1682,6 +1910,24 @@ def _augment_result_with_change(
             else:
                 prev_sums[statistic_id] = row.sum
 
+    return prev_sums
+
+
+def _augment_result_with_change(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+    table: type[Statistics | StatisticsShortTerm],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    result: dict[str, list[StatisticsRow]],
+) -> None:
+    """Add change to the result."""
+    drop_sum = "sum" not in _types
+    prev_sums = _get_sums_before_period(
+        hass, session, start_time, units, table, metadata, result
+    )
     for statistic_id, rows in result.items():
         prev_sum = prev_sums.get(statistic_id) or 0
         for statistics_row in rows:
@@ -1698,44 +1944,42 @@ def _augment_result_with_change(
             prev_sum = _sum
 
 
-def _statistics_during_period_with_session(
+def _augment_columns_with_change(
     hass: HomeAssistant,
     session: Session,
     start_time: datetime,
-    end_time: datetime | None,
-    statistic_ids: set[str] | None,
-    period: Literal["5minute", "day", "hour", "week", "month"],
     units: dict[str, str] | None,
     _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
-) -> dict[str, list[StatisticsRow]]:
-    """Return statistic data points during UTC period start_time - end_time.
-
-    If end_time is omitted, returns statistics newer than or equal to start_time.
-    If statistic_ids is omitted, returns statistics for all statistics ids.
-    """
-    if statistic_ids is not None and not isinstance(statistic_ids, set):
-        # This is for backwards compatibility to avoid a breaking change
-        # for custom integrations that call this method.
-        statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
-    # Fetch metadata for the given (or all) statistic_ids
-    metadata = get_instance(hass).statistics_meta_manager.get_many(
-        session, statistic_ids=statistic_ids
+    table: type[Statistics | StatisticsShortTerm],
+    metadata: dict[str, tuple[int, StatisticMetaData]],
+    result: dict[str, StatisticsColumns],
+) -> None:
+    """Add a change column to the columnar result."""
+    drop_sum = "sum" not in _types
+    prev_sums = _get_sums_before_period(
+        hass, session, start_time, units, table, metadata, result
     )
-    if not metadata:
-        return {}
-
-    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = set()
-    for stat_type in _types:
-        if stat_type == "change":
-            types.add("sum")
+    for statistic_id, columns in result.items():
+        if "sum" not in columns:
             continue
-        types.add(stat_type)
+        prev_sum = prev_sums.get(statistic_id) or 0
+        sums = columns.pop("sum") if drop_sum else columns["sum"]
+        changes: list[float | None] = []
+        for _sum in sums:
+            if _sum is None:
+                changes.append(None)
+                continue
+            changes.append(_sum - prev_sum)
+            prev_sum = _sum
+        columns["change"] = changes
 
-    metadata_ids = None
-    if statistic_ids is not None:
-        metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
 
-    # Align start_time and end_time with the period
+def _align_statistics_period(
+    start_time: datetime,
+    end_time: datetime | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+) -> tuple[datetime, datetime | None]:
+    """Align start_time and end_time with the period."""
     if period == "day":
         start_time = dt_util.as_local(start_time).replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -1764,6 +2008,52 @@ def _statistics_during_period_with_session(
         )
         if end_time is not None:
             end_time = _find_month_end_time(dt_util.as_local(end_time))
+    return start_time, end_time
+
+
+@dataclasses.dataclass(slots=True)
+class _StatisticsDuringPeriodQuery:
+    """The raw result of a statistics during period query."""
+
+    start_time: datetime
+    table: type[Statistics | StatisticsShortTerm]
+    metadata: dict[str, tuple[int, StatisticMetaData]]
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]]
+    stats: Sequence[Row]
+
+
+def _query_statistics_during_period(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> _StatisticsDuringPeriodQuery | None:
+    """Fetch the database rows for statistics_during_period.
+
+    Returns None if there are no matching statistics.
+    """
+    # Fetch metadata for the given (or all) statistic_ids
+    metadata = get_instance(hass).statistics_meta_manager.get_many(
+        session, statistic_ids=statistic_ids
+    )
+    if not metadata:
+        return None
+
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = set()
+    for stat_type in _types:
+        if stat_type == "change":
+            types.add("sum")
+            continue
+        types.add(stat_type)
+
+    metadata_ids = None
+    if statistic_ids is not None:
+        metadata_ids = _extract_metadata_and_discard_impossible_columns(metadata, types)
+
+    start_time, end_time = _align_statistics_period(start_time, end_time, period)
 
     table: type[Statistics | StatisticsShortTerm] = (
         Statistics if period != "5minute" else StatisticsShortTerm
@@ -1776,15 +2066,45 @@ def _statistics_during_period_with_session(
     )
 
     if not stats:
+        return None
+
+    return _StatisticsDuringPeriodQuery(start_time, table, metadata, types, stats)
+
+
+def _statistics_during_period_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Return statistic data points during UTC period start_time - end_time.
+
+    If end_time is omitted, returns statistics newer than or equal to start_time.
+    If statistic_ids is omitted, returns statistics for all statistics ids.
+    """
+    if statistic_ids is not None and not isinstance(statistic_ids, set):
+        # This is for backwards compatibility to avoid a breaking change
+        # for custom integrations that call this method.
+        statistic_ids = set(statistic_ids)  # type: ignore[unreachable]
+    if not (
+        query := _query_statistics_during_period(
+            hass, session, start_time, end_time, statistic_ids, period, _types
+        )
+    ):
         return {}
 
+    types = query.types
     result = _sorted_statistics_to_dict(
         hass,
-        stats,
+        query.stats,
         statistic_ids,
-        metadata,
+        query.metadata,
         True,
-        table,
+        query.table,
         units,
         types,
     )
@@ -1800,13 +2120,65 @@ def _statistics_during_period_with_session(
 
     if "change" in _types:
         _augment_result_with_change(
-            hass, session, start_time, units, _types, table, metadata, result
+            hass,
+            session,
+            query.start_time,
+            units,
+            _types,
+            query.table,
+            query.metadata,
+            result,
         )
 
     # Return statistics combined with metadata
     return result
 
 
+def _statistics_columns_during_period_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    _types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data columns during UTC period start_time - end_time."""
+    if not (
+        query := _query_statistics_during_period(
+            hass, session, start_time, end_time, statistic_ids, period, _types
+        )
+    ):
+        return {}
+
+    types = query.types
+    result = _sorted_statistics_to_columns(
+        hass, query.stats, statistic_ids, query.metadata, query.table, units, types
+    )
+
+    if period == "day":
+        result = _reduce_statistics_columns(result, reduce_day_ts_factory()[1], types)
+    elif period == "week":
+        result = _reduce_statistics_columns(result, reduce_week_ts_factory()[1], types)
+    elif period == "month":
+        result = _reduce_statistics_columns(result, reduce_month_ts_factory()[1], types)
+
+    if "change" in _types:
+        _augment_columns_with_change(
+            hass,
+            session,
+            query.start_time,
+            units,
+            _types,
+            query.table,
+            query.metadata,
+            result,
+        )
+
+    return result
+
+
 def statistics_during_period(
     hass: HomeAssistant,
     start_time: datetime,
@@ -1834,6 +2206,34 @@ def statistics_during_period(
         )
 
 
+def statistics_columns_during_period(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str] | None,
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Return statistic data during UTC period start_time - end_time as columns.
+
+    This returns the same data as statistics_during_period, but instead of
+    a list of rows each statistic has a list of values per field which
+    avoids creating a dict for every row.
+    """
+    with session_scope(hass=hass, read_only=True) as session:
+        return _statistics_columns_during_period_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            statistic_ids,
+            period,
+            units,
+            types,
+        )
+
+
 def _get_last_statistics_stmt(
     metadata_id: int,
     number_of_stats: int,
@@ -2213,6 +2613,65 @@ def _sorted_statistics_to_dict(
     return result
 
 
+def _sorted_statistics_to_columns(
+    hass: HomeAssistant,
+    stats: Sequence[Row[Any]],
+    statistic_ids: set[str] | None,
+    _metadata: dict[str, tuple[int, StatisticMetaData]],
+    table: type[StatisticsBase],
+    units: dict[str, str] | None,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, StatisticsColumns]:
+    """Convert SQL results into parallel columns per statistic_id."""
+    assert stats, "stats must not be empty"  # Guard against implementation error
+    result: dict[str, StatisticsColumns] = {}
+    metadata = dict(_metadata.values())
+    field_map: dict[str, int] = {key: idx for idx, key in enumerate(stats[0]._fields)}
+    metadata_id_idx = field_map["metadata_id"]
+    start_ts_idx = field_map["start_ts"]
+    stats_by_statistic_id: dict[str, list[Row]] = {
+        metadata[meta_id]["statistic_id"]: list(group)
+        for meta_id, group in groupby(stats, itemgetter(metadata_id_idx))
+    }
+    if "last_reset_ts" in field_map:
+        field_map["last_reset"] = field_map.pop("last_reset_ts")
+    row_mapping = tuple((key, field_map[key]) for key in types if key in field_map)
+    table_duration_seconds = table.duration.total_seconds()
+
+    # Maintain the order of the requested statistic IDs
+    ordered_ids: Iterable[str] = (
+        [stat_id for stat_id in statistic_ids if stat_id in stats_by_statistic_id]
+        if statistic_ids is not None
+        else ()
+    )
+    for statistic_id in chain(ordered_ids, stats_by_statistic_id):
+        if statistic_id in result:
+            continue
+        db_rows = stats_by_statistic_id[statistic_id]
+        state_unit = unit = _metadata[statistic_id][1]["unit_of_measurement"]
+        if state := hass.states.get(statistic_id):
+            state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        convert = _get_statistic_to_display_unit_converter(
+            unit, state_unit, units, allow_none=False
+        )
+        starts = [db_row[start_ts_idx] for db_row in db_rows]
+        columns: StatisticsColumns = {
+            "start": starts,
+            "end": [start_ts + table_duration_seconds for start_ts in starts],
+        }
+        for key, idx in row_mapping:
+            if convert:
+                columns[key] = [  # type: ignore[literal-required]
+                    None if (v := db_row[idx]) is None else convert(v)
+                    for db_row in db_rows
+                ]
+            else:
+                columns[key] = [db_row[idx] for db_row in db_rows]  # type: ignore[literal-required]
+        result[statistic_id] = columns
+
+    return result
+
+
 def validate_statistics(hass: HomeAssistant) -> dict[str, list[ValidationIssue]]:
     """Validate statistics."""
     platform_validation: dict[str, list[ValidationIssue]] = {}
@@ -2333,6 +2792,8 @@ def _import_statistics_with_session(
     table: type[StatisticsBase],
 ) -> bool:
     """Import statistics to the database."""
+    if table == StatisticsShortTerm:
+        get_hourly_statistics_accumulator(instance.hass).invalidate()
     statistics_meta_manager = instance.statistics_meta_manager
     old_metadata_dict = statistics_meta_manager.get_many(
         session, statistic_ids={metadata["statistic_id"]}
@@ -2367,6 +2828,14 @@ def get_short_term_statistics_run_cache(
     return ShortTermStatisticsRunCache()
 
 
+@singleton(DATA_HOURLY_STATISTICS_ACCUMULATOR)
+def get_hourly_statistics_accumulator(
+    hass: HomeAssistant,
+) -> HourlyStatisticsAccumulator:
+    """Get the hourly statistics accumulator."""
+    return HourlyStatisticsAccumulator()
+
+
 def cache_latest_short_term_statistic_id_for_metadata_id(
     run_cache: ShortTermStatisticsRunCache,
     session: Session,
@@ -2446,6 +2915,7 @@ def adjust_statistics(
     adjustment_unit: str,
 ) -> bool:
     """Process an add_statistics job."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
 
     with session_scope(session=instance.get_session()) as session:
         metadata = instance.statistics_meta_manager.get_many(
@@ -2509,6 +2979,7 @@ def change_statistics_unit(
     old_unit: str,
 ) -> None:
     """Change statistics unit for a statistic_id."""
+    get_hourly_statistics_accumulator(instance.hass).invalidate()
     statistics_meta_manager = instance.statistics_meta_manager
     with session_scope(session=instance.get_session()) as session:
         metadata = statistics_meta_manager.get(session, statistic_id)
@@ -63,6 +63,11 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
     db_stats: dict[str, Any] = {}
+    throughput = instance.throughput.async_snapshot(1)
+    queue_info = {
+        "backlog": instance.backlog,
+        "events_per_second": throughput["committed_per_second"],
+    }
 
     if instance.async_db_ready.done():
         db_stats = await instance.async_add_executor_job(
@@ -72,4 +77,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | queue_info
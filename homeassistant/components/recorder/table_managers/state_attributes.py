@@ -12,8 +12,14 @@ from homeassistant.core import Event, EventStateChangedData
 from homeassistant.util.collection import chunked_or_all
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
+from ..bloom_filter import HashBloomFilter
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import (
+    count_shared_attributes,
+    get_latest_shared_attributes,
+    get_shared_attributes,
+    get_shared_attributes_hashes,
+)
 from ..util import execute_stmt_lambda_element
 from . import BaseLRUTableManager
 
@@ -28,6 +34,12 @@ if TYPE_CHECKING:
 # - How much memory our low end hardware has
 CACHE_SIZE = 2048
 
+# The number of hashes to fetch at a time when loading the known hashes
+LOAD_HASHES_CHUNK_SIZE = 10000
+
+# The maximum number of attributes of the latest states to load at startup
+MAX_LATEST_ATTRIBUTES = 16384
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +49,52 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
         super().__init__(recorder, CACHE_SIZE)
+        # The hashes of all attributes in the database once they are loaded
+        self._known_hashes: HashBloomFilter | None = None
+        self.skipped_lookups = 0
+
+    def prewarm(self, session: Session, load_latest: bool) -> None:
+        """Load the known hashes and the attributes of the latest states.
+
+        The hashes of all attributes are loaded into a bloom filter so
+        attributes that are not in the database are never looked up, and
+        if load_latest is set, the cache is filled with the attributes of
+        the latest state of each entity since they are the most likely
+        to be used again after a restart.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        known_hashes = HashBloomFilter(
+            cast(int, session.execute(count_shared_attributes()).scalar()) * 2
+        )
+        for (hash_,) in (
+            session.connection()
+            .execute(get_shared_attributes_hashes())
+            .yield_per(LOAD_HASHES_CHUNK_SIZE)
+        ):
+            if hash_ is not None:
+                known_hashes.add(hash_)
+        self._known_hashes = known_hashes
+        if not load_latest:
+            return
+        latest = list(
+            execute_stmt_lambda_element(
+                session,
+                get_latest_shared_attributes(MAX_LATEST_ATTRIBUTES),
+                orm_rows=False,
+            )
+        )
+        # Resize first or the LRU would evict the attributes we load
+        self.adjust_lru_size(len(latest) * 2)
+        id_map = self._id_map
+        for attributes_id, shared_attrs in latest:
+            id_map[shared_attrs] = attributes_id
+        _LOGGER.debug(
+            "Loaded %s known attributes hashes and %s latest attributes",
+            known_hashes.count,
+            len(latest),
+        )
 
     def serialize_from_event(self, event: Event[EventStateChangedData]) -> bytes | None:
         """Serialize event data."""
@@ -105,6 +163,11 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         recorder thread.
         """
         results: dict[str, int | None] = {}
+        if (known_hashes := self._known_hashes) is not None:
+            # Attributes that are not in the filter are not in the database
+            known = [hash_ for hash_ in hashes if hash_ in known_hashes]
+            self.skipped_lookups += len(hashes) - len(known)
+            hashes = known
         with session.no_autoflush:
             for hashs_chunk in chunked_or_all(hashes, self.recorder.max_bind_vars):
                 for attributes_id, shared_attrs in execute_stmt_lambda_element(
@@ -132,10 +195,25 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         This call is not thread-safe and must be called from the
         recorder thread.
         """
+        known_hashes = self._known_hashes
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
+            if known_hashes is not None and db_state_attributes.hash is not None:
+                known_hashes.add(db_state_attributes.hash)
         self._pending.clear()
 
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        The known hashes are dropped since they may not match the
+        new database.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._known_hashes = None
+
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
 
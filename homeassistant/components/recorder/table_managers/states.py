@@ -2,7 +2,131 @@
 
 from __future__ import annotations
 
-from ..db_schema import States
+from typing import Any
+
+from homeassistant.core import Event, EventStateChangedData
+
+from ..db_schema import StateAttributes, States, StatesMeta
+from ..models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+
+
+class PendingStateRow:
+    """A states row waiting to be written with a bulk insert.
+
+    Rows are kept as plain values instead of ORM objects so
+    they can be written with a single executemany at commit time
+    without going through the ORM unit of work.
+    """
+
+    __slots__ = (
+        "attributes_id",
+        "context_id_bin",
+        "context_parent_id_bin",
+        "context_user_id_bin",
+        "depth",
+        "entity_id",
+        "last_changed_ts",
+        "last_reported_ts",
+        "last_updated_ts",
+        "metadata_id",
+        "old_state",
+        "old_state_id",
+        "origin_idx",
+        "shared_attrs_bytes",
+        "state",
+        "state_attributes",
+        "state_id",
+        "states_meta",
+    )
+
+    def __init__(
+        self,
+        entity_id: str,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float | None,
+        last_reported_ts: float | None,
+        context_id_bin: bytes | None,
+        context_user_id_bin: bytes | None,
+        context_parent_id_bin: bytes | None,
+        origin_idx: int,
+    ) -> None:
+        """Initialize the pending state row."""
+        self.entity_id = entity_id
+        self.state = state
+        self.last_updated_ts = last_updated_ts
+        self.last_changed_ts = last_changed_ts
+        self.last_reported_ts = last_reported_ts
+        self.context_id_bin = context_id_bin
+        self.context_user_id_bin = context_user_id_bin
+        self.context_parent_id_bin = context_parent_id_bin
+        self.origin_idx = origin_idx
+        self.state_id: int | None = None
+        self.old_state_id: int | None = None
+        self.old_state: PendingStateRow | None = None
+        self.depth = 0
+        self.metadata_id: int | None = None
+        self.states_meta: StatesMeta | None = None
+        self.attributes_id: int | None = None
+        self.state_attributes: StateAttributes | None = None
+        self.shared_attrs_bytes: bytes | None = None
+
+    @staticmethod
+    def from_event(event: Event[EventStateChangedData]) -> PendingStateRow:
+        """Create a pending row from a state_changed event."""
+        state = event.data["new_state"]
+        # None state means the state was removed from the state machine
+        if state is None:
+            state_value = ""
+            last_updated_ts = event.time_fired_timestamp
+            last_changed_ts = None
+            last_reported_ts = None
+        else:
+            state_value = state.state
+            last_updated_ts = state.last_updated_timestamp
+            if (last_changed_ts := state.last_changed_timestamp) == last_updated_ts:
+                last_changed_ts = None
+            if (last_reported_ts := state.last_reported_timestamp) == last_updated_ts:
+                last_reported_ts = None
+        context = event.context
+        return PendingStateRow(
+            event.data["entity_id"],
+            state_value,
+            last_updated_ts,
+            last_changed_ts,
+            last_reported_ts,
+            ulid_to_bytes_or_none(context.id),
+            uuid_hex_to_bytes_or_none(context.user_id),
+            ulid_to_bytes_or_none(context.parent_id),
+            event.origin.idx,
+        )
+
+    def link_old_state(self, old_state: PendingStateRow) -> None:
+        """Link the previous pending row for the same entity."""
+        self.old_state = old_state
+        self.depth = old_state.depth + 1
+
+    def as_insert_params(self, include_entity_id: bool) -> dict[str, Any]:
+        """Return the bind parameters to insert the row.
+
+        The metadata_id, attributes_id, and old_state_id must
+        already be resolved. The entity_id is only written
+        before the states_meta migration has completed.
+        """
+        return {
+            "state": self.state,
+            "entity_id": self.entity_id if include_entity_id else None,
+            "last_updated_ts": self.last_updated_ts,
+            "last_changed_ts": self.last_changed_ts,
+            "last_reported_ts": self.last_reported_ts,
+            "old_state_id": self.old_state_id,
+            "attributes_id": self.attributes_id,
+            "metadata_id": self.metadata_id,
+            "context_id_bin": self.context_id_bin,
+            "context_user_id_bin": self.context_user_id_bin,
+            "context_parent_id_bin": self.context_parent_id_bin,
+            "origin_idx": self.origin_idx,
+        }
 
 
 class StatesManager:
@@ -11,6 +135,8 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_rows: dict[str, PendingStateRow] = {}
+        self._bulk_insert_rows: list[PendingStateRow] = []
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -45,6 +171,40 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def pop_pending_row(self, entity_id: str) -> PendingStateRow | None:
+        """Pop a pending row for the bulk insert path.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_rows.pop(entity_id, None)
+
+    def add_pending_row(self, entity_id: str, row: PendingStateRow) -> None:
+        """Add a pending row for the bulk insert path.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_rows[entity_id] = row
+
+    def queue_bulk_insert_row(self, row: PendingStateRow) -> None:
+        """Queue a row to be written at the next commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._bulk_insert_rows.append(row)
+
+    def pop_bulk_insert_rows(self) -> list[PendingStateRow]:
+        """Pop all rows waiting to be written.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        rows = self._bulk_insert_rows
+        self._bulk_insert_rows = []
+        return rows
+
     def update_pending_last_reported(
         self, state_id: int, last_reported_timestamp: float
     ) -> None:
@@ -63,7 +223,11 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        for entity_id, row in self._pending_rows.items():
+            if row.state_id is not None:
+                self._last_committed_id[entity_id] = row.state_id
         self._pending.clear()
+        self._pending_rows.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +238,16 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_rows.clear()
+        self._bulk_insert_rows.clear()
+
+    def get_committed_state_ids(self) -> set[int]:
+        """Return the state ids of the last committed state of each entity.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return set(self._last_committed_id.values())
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -6,7 +6,7 @@ import abc
 import asyncio
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
 import logging
 import threading
 from typing import TYPE_CHECKING, Any
@@ -22,6 +22,8 @@ from .util import periodic_db_cleanups, session_scope
 
 _LOGGER = logging.getLogger(__name__)
 
+# The time compacted by each compact states task
+COMPACT_SLICE = timedelta(hours=1)
 
 if TYPE_CHECKING:
     from .core import Recorder
@@ -117,9 +119,12 @@ class PurgeTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge the database."""
-        if purge.purge_old_data(
+        finished = purge.purge_old_data(
             instance, self.purge_before, self.repack, self.apply_filter
-        ):
+        )
+        # The purged states may be in the cache
+        instance.history_cache.clear()
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -133,6 +138,26 @@ class PurgeTask(RecorderTask):
         )
 
 
+@dataclass(slots=True)
+class CompactStatesTask(RecorderTask):
+    """Object to store information about a compact states task."""
+
+    start: datetime
+    end: datetime
+
+    def run(self, instance: Recorder) -> None:
+        """Compact the numeric states, one slice of time at a time."""
+        slice_end = min(self.start + COMPACT_SLICE, self.end)
+        finished = purge.compact_states(instance, self.start, slice_end)
+        # The compacted states may be in the cache
+        instance.history_cache.clear()
+        if not finished:
+            # Retry the slice if it didn't finish
+            instance.queue_task(CompactStatesTask(self.start, self.end))
+        elif slice_end < self.end:
+            instance.queue_task(CompactStatesTask(slice_end, self.end))
+
+
 @dataclass(slots=True)
 class PurgeEntitiesTask(RecorderTask):
     """Object to store entity information about purge task."""
@@ -142,7 +167,12 @@ class PurgeEntitiesTask(RecorderTask):
 
     def run(self, instance: Recorder) -> None:
         """Purge entities from the database."""
-        if purge.purge_entity_data(instance, self.entity_filter, self.purge_before):
+        finished = purge.purge_entity_data(
+            instance, self.entity_filter, self.purge_before
+        )
+        # The purged states may be in the cache
+        instance.history_cache.clear()
+        if finished:
             return
         # Schedule a new purge task if this one didn't finish
         instance.queue_task(PurgeEntitiesTask(self.entity_filter, self.purge_before))
@@ -0,0 +1,191 @@
+"""Track the throughput of the recorder queue."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+import time
+from typing import Any
+
+from homeassistant.const import ATTR_ENTITY_ID, EVENT_STATE_CHANGED
+from homeassistant.core import Event, callback, split_entity_id
+
+# How long each sampling window lasts in seconds.
+#
+# The rates and the top contributors are calculated
+# over the current and the previous window.
+THROUGHPUT_WINDOW = 60
+
+# Upper bounds of the commit latency histogram buckets in milliseconds
+COMMIT_LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+DEFAULT_TOP_COUNT = 10
+
+
+class RecorderThroughput:
+    """Track events flowing into and out of the recorder queue.
+
+    Counters that are updated when events are put into the queue
+    are only written from the event loop, and counters that are updated
+    when the session is committed are only written from the recorder
+    thread so no locking is needed.
+
+    The windows are rolled over when they are written or read, so the
+    rates and the top contributors only cover the current and the
+    previous window even if nothing read them for a long time.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the throughput tracker."""
+        now = time.monotonic()
+        self._start = now
+        window = int(now // THROUGHPUT_WINDOW)
+        # Written from the event loop
+        self.enqueued = 0
+        self._window = window
+        self._window_enqueued = 0
+        self._previous_enqueued = 0
+        self._event_types: Counter[str] = Counter()
+        self._entity_ids: Counter[str] = Counter()
+        self._previous_event_types: Counter[str] = Counter()
+        self._previous_entity_ids: Counter[str] = Counter()
+        # Written from the recorder thread
+        self.committed = 0
+        self.commits = 0
+        self._uncommitted = 0
+        self._commit_time = 0.0
+        self._commit_latency_buckets = [0] * (len(COMMIT_LATENCY_BUCKETS_MS) + 1)
+        # The window, and the events committed in it and in the window before
+        # it. It is replaced as a whole so the event loop always reads
+        # counts that belong together.
+        self._committed_windows = (window, 0, 0)
+
+    @callback
+    def _async_roll_window(self, window: int) -> None:
+        """Start a new window if window is after the current one."""
+        if window == self._window:
+            return
+        if window == self._window + 1:
+            self._previous_enqueued = self._window_enqueued
+            self._previous_event_types = self._event_types
+            self._previous_entity_ids = self._entity_ids
+        else:
+            self._previous_enqueued = 0
+            self._previous_event_types = Counter()
+            self._previous_entity_ids = Counter()
+        self._window = window
+        self._window_enqueued = 0
+        self._event_types = Counter()
+        self._entity_ids = Counter()
+
+    @callback
+    def async_record_enqueued(self, event: Event) -> None:
+        """Record an event that was put into the recorder queue."""
+        self._async_roll_window(int(time.monotonic() // THROUGHPUT_WINDOW))
+        self.enqueued += 1
+        self._window_enqueued += 1
+        event_type = event.event_type
+        self._event_types[event_type] += 1
+        if event_type == EVENT_STATE_CHANGED:
+            self._entity_ids[event.data[ATTR_ENTITY_ID]] += 1
+
+    def record_processed(self) -> None:
+        """Record an event that was added to the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._uncommitted += 1
+
+    def record_commit(self, latency: float) -> None:
+        """Record a successful commit that took latency seconds.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        window = int(time.monotonic() // THROUGHPUT_WINDOW)
+        committed_window, window_committed, previous_committed = self._committed_windows
+        if window == committed_window + 1:
+            previous_committed = window_committed
+        elif window != committed_window:
+            previous_committed = 0
+        if window != committed_window:
+            window_committed = 0
+        self._committed_windows = (
+            window,
+            window_committed + self._uncommitted,
+            previous_committed,
+        )
+        self.commits += 1
+        self.committed += self._uncommitted
+        self._uncommitted = 0
+        self._commit_time += latency
+        self._commit_latency_buckets[
+            bisect_left(COMMIT_LATENCY_BUCKETS_MS, latency * 1000)
+        ] += 1
+
+    def discard_uncommitted(self) -> None:
+        """Discard events that were in a session that was rolled back.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._uncommitted = 0
+
+    @callback
+    def _async_rates(self, now: float) -> tuple[float, float]:
+        """Return the enqueued and committed events per second.
+
+        The rates are calculated over the previous window, or over
+        the current window if there was no previous window yet.
+        """
+        window = int(now // THROUGHPUT_WINDOW)
+        window_start = window * THROUGHPUT_WINDOW
+        committed_window, window_committed, previous_committed = self._committed_windows
+        if committed_window == window - 1:
+            previous_committed = window_committed
+            window_committed = 0
+        elif committed_window != window:
+            previous_committed = window_committed = 0
+        if self._start >= window_start:
+            elapsed = max(now - self._start, 1)
+            return self._window_enqueued / elapsed, window_committed / elapsed
+        elapsed = window_start - max(self._start, window_start - THROUGHPUT_WINDOW)
+        return self._previous_enqueued / elapsed, previous_committed / elapsed
+
+    @callback
+    def async_snapshot(self, top: int = DEFAULT_TOP_COUNT) -> dict[str, Any]:
+        """Return a snapshot of the throughput."""
+        now = time.monotonic()
+        self._async_roll_window(int(now // THROUGHPUT_WINDOW))
+        enqueued_per_second, committed_per_second = self._async_rates(now)
+        entity_ids = self._previous_entity_ids + self._entity_ids
+        domains: Counter[str] = Counter()
+        for entity_id, count in entity_ids.items():
+            domains[split_entity_id(entity_id)[0]] += count
+        commits = self.commits
+        buckets = dict(
+            zip(
+                (*(str(bound) for bound in COMMIT_LATENCY_BUCKETS_MS), "+Inf"),
+                self._commit_latency_buckets,
+                strict=True,
+            )
+        )
+        return {
+            "enqueued": self.enqueued,
+            "committed": self.committed,
+            "enqueued_per_second": round(enqueued_per_second, 2),
+            "committed_per_second": round(committed_per_second, 2),
+            "commit_latency": {
+                "commits": commits,
+                "mean_ms": round(self._commit_time / commits * 1000, 2)
+                if commits
+                else None,
+                "buckets_ms": buckets,
+            },
+            "top_event_types": (
+                self._previous_event_types + self._event_types
+            ).most_common(top),
+            "top_entity_ids": entity_ids.most_common(top),
+            "top_domains": domains.most_common(top),
+        }
@@ -34,6 +34,7 @@ from homeassistant.util.unit_conversion import (
     VolumeFlowRateConverter,
 )
 
+from .const import QueryType
 from .models import StatisticPeriod
 from .statistics import (
     STATISTIC_UNIT_TO_UNIT_CONVERTER,
@@ -43,6 +44,7 @@ from .statistics import (
     async_list_statistic_ids,
     list_statistic_ids,
     statistic_during_period,
+    statistics_columns_during_period,
     statistics_during_period,
     update_statistics_issues,
     validate_statistics,
@@ -83,6 +85,8 @@ def async_setup(hass: HomeAssistant) -> None:
     websocket_api.async_register_command(hass, ws_get_statistic_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_during_period)
     websocket_api.async_register_command(hass, ws_get_statistics_metadata)
+    websocket_api.async_register_command(hass, ws_get_throughput)
+    websocket_api.async_register_command(hass, ws_get_query_stats)
     websocket_api.async_register_command(hass, ws_list_statistic_ids)
     websocket_api.async_register_command(hass, ws_import_statistics)
     websocket_api.async_register_command(hass, ws_update_statistics_issues)
@@ -134,7 +138,8 @@ async def ws_get_statistic_during_period(
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
+            QueryType.STATISTICS,
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -177,6 +182,37 @@ def _ws_get_statistics_during_period(
     return json_bytes(messages.result_message(msg_id, result))
 
 
+def _ws_get_statistics_columns_during_period(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    statistic_ids: set[str] | None,
+    period: Literal["5minute", "day", "hour", "week", "month"],
+    units: dict[str, str],
+    types: set[Literal["change", "last_reset", "max", "mean", "min", "state", "sum"]],
+) -> bytes:
+    """Fetch statistics as columns and convert them to json in the executor."""
+    result = statistics_columns_during_period(
+        hass,
+        start_time,
+        end_time,
+        statistic_ids,
+        period,
+        units,
+        types,
+    )
+    for columns in result.values():
+        columns["start"] = [int(start * 1000) for start in columns["start"]]
+        columns["end"] = [int(end * 1000) for end in columns["end"]]
+        if (last_resets := columns.get("last_reset")) is not None:
+            columns["last_reset"] = [
+                None if last_reset is None else int(last_reset * 1000)
+                for last_reset in last_resets
+            ]
+    return json_bytes(messages.result_message(msg_id, result))
+
+
 async def ws_handle_get_statistics_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
@@ -202,8 +238,11 @@ async def ws_handle_get_statistics_during_period(
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
-            _ws_get_statistics_during_period,
+        await get_instance(hass).async_add_query_job(
+            QueryType.STATISTICS,
+            _ws_get_statistics_columns_during_period
+            if msg.get("columnar")
+            else _ws_get_statistics_during_period,
             hass,
             msg["id"],
             start_time,
@@ -228,6 +267,7 @@ async def ws_handle_get_statistics_during_period(
             [vol.Any("change", "last_reset", "max", "mean", "min", "state", "sum")],
             vol.Coerce(set),
         ),
+        vol.Optional("columnar", default=False): bool,
     }
 )
 @websocket_api.async_response
@@ -257,7 +297,8 @@ async def ws_handle_list_statistic_ids(
 ) -> None:
     """Fetch a list of available statistic_id."""
     connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+        await get_instance(hass).async_add_query_job(
+            QueryType.STATISTICS,
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
@@ -369,6 +410,46 @@ async def ws_get_statistics_metadata(
     connection.send_result(msg["id"], metadata)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "recorder/throughput",
+        vol.Optional("top", default=10): vol.All(int, vol.Range(min=1, max=100)),
+    }
+)
+@callback
+def ws_get_throughput(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return the throughput of the recorder queue and what is filling it."""
+    instance = get_instance(hass)
+    connection.send_result(
+        msg["id"],
+        {
+            "backlog": instance.backlog,
+            "max_backlog": instance.max_backlog,
+            **instance.throughput.async_snapshot(msg["top"]),
+        },
+    )
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "recorder/query_stats"})
+@callback
+def ws_get_query_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return how the query workers are used by each type of query."""
+    query_limiter = get_instance(hass).query_limiter
+    connection.send_result(
+        msg["id"],
+        {
+            "workers": query_limiter.workers,
+            "queries": query_limiter.async_snapshot(),
+        },
+    )
+
+
 @websocket_api.require_admin
 @websocket_api.websocket_command(
     {
@@ -461,8 +542,8 @@ async def ws_adjust_sum_statistics(
         return
 
     instance = get_instance(hass)
-    metadatas = await instance.async_add_executor_job(
-        list_statistic_ids, hass, {msg["statistic_id"]}
+    metadatas = await instance.async_add_query_job(
+        QueryType.STATISTICS, list_statistic_ids, hass, {msg["statistic_id"]}
     )
     if not metadatas:
         connection.send_error(msg["id"], "unknown_statistic_id", "Unknown statistic ID")
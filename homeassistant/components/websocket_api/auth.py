@@ -16,6 +16,7 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.json import JsonValueType
 
 from .connection import ActiveConnection
+from .const import ENCODING_JSON, ENCODINGS
 from .error import Disconnect
 
 if TYPE_CHECKING:
@@ -32,6 +33,7 @@ AUTH_MESSAGE_SCHEMA: Final = vol.Schema(
         vol.Required("type"): TYPE_AUTH,
         vol.Exclusive("api_password", "auth"): str,
         vol.Exclusive("access_token", "auth"): str,
+        vol.Optional("encodings"): [str],
     }
 )
 
@@ -41,6 +43,20 @@ AUTH_REQUIRED_MESSAGE = json_bytes(
 )
 
 
+def auth_ok_message(encoding: str) -> bytes:
+    """Return an auth_ok message with the negotiated encoding."""
+    return json_bytes(
+        {"type": TYPE_AUTH_OK, "ha_version": __version__, "encoding": encoding}
+    )
+
+
+def negotiate_encoding(encodings: list[str]) -> str:
+    """Return the first encoding the client prefers that we support."""
+    return next(
+        (encoding for encoding in encodings if encoding in ENCODINGS), ENCODING_JSON
+    )
+
+
 def auth_invalid_message(message: str) -> bytes:
     """Return an auth_invalid message."""
     return json_bytes({"type": TYPE_AUTH_INVALID, "message": message})
@@ -95,7 +111,13 @@ class AuthPhase:
                     refresh_token.id, self._cancel_ws
                 )
             )
-            await self._send_bytes_text(AUTH_OK_MESSAGE)
+            # The auth_ok message is always JSON, the negotiated
+            # encoding is used for the messages that follow it.
+            if (encodings := valid_msg.get("encodings")) is None:
+                await self._send_bytes_text(AUTH_OK_MESSAGE)
+            else:
+                conn.encoding = negotiate_encoding(encodings)
+                await self._send_bytes_text(auth_ok_message(conn.encoding))
             self._logger.debug("Auth OK")
             process_success_login(self._request)
             return conn
@@ -0,0 +1,106 @@
+"""Encode websocket messages as CBOR (RFC 8949)."""
+
+from __future__ import annotations
+
+from collections.abc import Collection
+import struct
+from typing import Any, Final
+
+from homeassistant.helpers.json import json_bytes
+
+# Major types
+_MAJOR_UNSIGNED: Final = 0
+_MAJOR_NEGATIVE: Final = 1 << 5
+_MAJOR_BYTES: Final = 2 << 5
+_MAJOR_TEXT: Final = 3 << 5
+_MAJOR_ARRAY: Final = 4 << 5
+_MAJOR_MAP: Final = 5 << 5
+
+_FALSE: Final = b"\xf4"
+_TRUE: Final = b"\xf5"
+_NULL: Final = b"\xf6"
+_FLOAT64: Final = struct.Struct(">Bd")
+
+# Tag 262 marks a byte string holding embedded JSON. It lets us send the
+# JSON that is already cached for states and events without encoding it again.
+_EMBEDDED_JSON_TAG: Final = b"\xd9\x01\x06"
+
+_UINT8: Final = struct.Struct(">BB")
+_UINT16: Final = struct.Struct(">BH")
+_UINT32: Final = struct.Struct(">BI")
+_UINT64: Final = struct.Struct(">BQ")
+
+
+def _head(major: int, length: int) -> bytes:
+    """Return the head of a data item."""
+    if length < 24:
+        return bytes((major | length,))
+    if length < 0x100:
+        return _UINT8.pack(major | 24, length)
+    if length < 0x10000:
+        return _UINT16.pack(major | 25, length)
+    if length < 0x100000000:
+        return _UINT32.pack(major | 26, length)
+    return _UINT64.pack(major | 27, length)
+
+
+def embedded_json(data: bytes) -> bytes:
+    """Return JSON bytes as an embedded JSON data item."""
+    return b"".join((_EMBEDDED_JSON_TAG, _head(_MAJOR_BYTES, len(data)), data))
+
+
+def _encode(value: Any, chunks: list[bytes]) -> None:
+    """Append the encoded value to chunks."""
+    value_type = type(value)
+    if value_type is str:
+        data = value.encode()
+        chunks.append(_head(_MAJOR_TEXT, len(data)))
+        chunks.append(data)
+    elif value_type is dict:
+        chunks.append(_head(_MAJOR_MAP, len(value)))
+        for key, item in value.items():
+            # Keys are strings in JSON
+            _encode(key if isinstance(key, str) else str(key), chunks)
+            _encode(item, chunks)
+    elif value_type is list or value_type is tuple:
+        chunks.append(_head(_MAJOR_ARRAY, len(value)))
+        for item in value:
+            _encode(item, chunks)
+    elif value is None:
+        chunks.append(_NULL)
+    elif value is True:
+        chunks.append(_TRUE)
+    elif value is False:
+        chunks.append(_FALSE)
+    elif value_type is int and -0x10000000000000000 < value < 0x10000000000000000:
+        if value >= 0:
+            chunks.append(_head(_MAJOR_UNSIGNED, value))
+        else:
+            chunks.append(_head(_MAJOR_NEGATIVE, -1 - value))
+    elif value_type is float:
+        chunks.append(_FLOAT64.pack(0xFB, value))
+    elif isinstance(value, str):
+        # Subclasses of str, like StrEnum members
+        _encode(str.__str__(value), chunks)
+    elif isinstance(value, dict):
+        # Subclasses of dict, like ReadOnlyDict
+        _encode(dict(value), chunks)
+    else:
+        # Anything else, like datetimes, sets and objects that know how to
+        # serialize themselves, is encoded by the JSON encoder and embedded.
+        chunks.append(embedded_json(json_bytes(value)))
+
+
+def encode(value: Any) -> bytes:
+    """Encode a value as CBOR.
+
+    Raises TypeError or ValueError if the value cannot be serialized.
+    """
+    chunks: list[bytes] = []
+    _encode(value, chunks)
+    return b"".join(chunks)
+
+
+def encode_array(items: Collection[bytes]) -> bytes:
+    """Return an array of encoded items."""
+    return b"".join((_head(_MAJOR_ARRAY, len(items)), *items))
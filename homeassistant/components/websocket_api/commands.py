@@ -62,7 +62,7 @@ from homeassistant.loader import (
 from homeassistant.setup import async_get_loaded_integrations, async_get_setup_timings
 from homeassistant.util.json import format_unserializable_data
 
-from . import const, decorators, messages
+from . import const, decorators, entity_changes, messages
 from .connection import ActiveConnection
 from .messages import construct_result_message
 
@@ -84,11 +84,13 @@ def async_register_commands(
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_get_states_since)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
+    async_reg(hass, handle_template_render_stats)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
@@ -368,30 +370,76 @@ def _send_handle_get_states_response(
 
 
 @callback
-def _forward_entity_changes(
-    send_message: Callable[[str | bytes | dict[str, Any]], None],
-    entity_ids: set[str] | None,
-    entity_filter: Callable[[str], bool] | None,
-    user: User,
-    message_id_as_bytes: bytes,
-    event: Event[EventStateChangedData],
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "get_states_since",
+        vol.Optional("epoch"): str,
+        vol.Optional("sequence"): cv.positive_int,
+    }
+)
+def handle_get_states_since(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Forward entity state changed events to websocket."""
-    entity_id = event.data["entity_id"]
-    if (entity_ids and entity_id not in entity_ids) or (
-        entity_filter and not entity_filter(entity_id)
-    ):
-        return
-    # We have to lookup the permissions again because the user might have
-    # changed since the subscription was created.
-    permissions = user.permissions
-    if (
-        not user.is_admin
-        and not permissions.access_all_entities(POLICY_READ)
-        and not permissions.check_entity(entity_id, POLICY_READ)
-    ):
-        return
-    send_message(messages.cached_state_diff_message(message_id_as_bytes, event))
+    """Handle get states since command.
+
+    Returns the states that changed and the entity_ids that were removed
+    since the sequence the client has seen. If the client has not seen a
+    sequence of the current epoch, or the removals since its sequence are
+    no longer known, all states are returned instead.
+    """
+    states = hass.states
+    changes = (
+        states.async_changes_since(msg["sequence"])
+        if msg.get("epoch") == states.change_epoch and "sequence" in msg
+        else None
+    )
+    user = connection.user
+    if changes is None:
+        full = True
+        changed_states = _async_get_allowed_states(hass, connection)
+        removed: list[str] = []
+    else:
+        full = False
+        changed_states, removed = changes
+        if not user.is_admin and not user.permissions.access_all_entities(POLICY_READ):
+            entity_perm = user.permissions.check_entity
+            changed_states = [
+                state
+                for state in changed_states
+                if entity_perm(state.entity_id, POLICY_READ)
+            ]
+            removed = [
+                entity_id
+                for entity_id in removed
+                if entity_perm(entity_id, POLICY_READ)
+            ]
+
+    serialized_states = []
+    for state in changed_states:
+        try:
+            serialized_states.append(state.as_dict_json)
+        except (ValueError, TypeError):
+            connection.logger.error(
+                "Unable to serialize to JSON. Bad data found at %s",
+                format_unserializable_data(
+                    find_paths_unserializable_data(state, dump=JSON_DUMP)
+                ),
+            )
+
+    connection.send_message(
+        construct_result_message(
+            msg["id"],
+            json_bytes(
+                {
+                    "epoch": states.change_epoch,
+                    "sequence": states.change_sequence,
+                    "full": full,
+                    "states": [json_fragment(state) for state in serialized_states],
+                    "removed": removed,
+                }
+            ),
+        )
+    )
 
 
 @callback
@@ -399,6 +447,7 @@ def _forward_entity_changes(
     {
         vol.Required("type"): "subscribe_entities",
         vol.Optional("entity_ids"): cv.entity_ids,
+        vol.Optional("min_interval"): cv.positive_float,
         **INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA.schema,
     }
 )
@@ -415,16 +464,18 @@ def handle_subscribe_entities(
     states = _async_get_allowed_states(hass, connection)
     msg_id = msg["id"]
     message_id_as_bytes = str(msg_id).encode()
-    connection.subscriptions[msg_id] = hass.bus.async_listen(
-        EVENT_STATE_CHANGED,
-        partial(
-            _forward_entity_changes,
+    connection.subscriptions[msg_id] = entity_changes.async_get_hub(
+        hass
+    ).async_subscribe(
+        entity_changes.EntityChangesSubscription(
+            hass,
             connection.send_message,
             entity_ids,
             entity_filter,
             connection.user,
             message_id_as_bytes,
-        ),
+            msg.get("min_interval", 0),
+        )
     )
     connection.send_result(msg_id)
 
@@ -683,6 +734,16 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+@callback
+@decorators.require_admin
+@decorators.websocket_command({vol.Required("type"): "template/render_stats"})
+def handle_template_render_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle template render stats command."""
+    connection.send_result(msg["id"], template.async_get_render_stats(hass))
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
@@ -6,9 +6,11 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.core import HomeAssistant
+from homeassistant.util.hass_dict import HassKey
 
 if TYPE_CHECKING:
     from .connection import ActiveConnection
+    from .http import WebSocketHandler
 
 
 type WebSocketCommandHandler = Callable[
@@ -34,6 +36,11 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Messages of at least this many bytes, like large get_states results,
+# are queued as bulk messages. Bulk messages are sent when no other
+# messages are pending so they do not delay command results and updates.
+BULK_MSG_SIZE: Final = 65536
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -56,5 +63,13 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 
 # Data used to store the current connection list
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
+# Data used to store the handlers of the authenticated connections
+DATA_HANDLERS: HassKey[set[WebSocketHandler]] = HassKey(f"{DOMAIN}.handlers")
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+
+# Encodings of the outgoing messages that can be negotiated in the
+# auth message. JSON messages are sent as text, others as binary.
+ENCODING_JSON: Final = "json"
+ENCODING_CBOR: Final = "cbor"
+ENCODINGS: Final = (ENCODING_JSON, ENCODING_CBOR)
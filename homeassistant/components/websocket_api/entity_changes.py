@@ -0,0 +1,205 @@
+"""Share the forwarding of entity changes between subscriptions."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.auth.permissions.const import POLICY_READ
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
+from homeassistant.util.hass_dict import HassKey
+
+from . import messages
+from .const import DOMAIN
+
+DATA_ENTITY_CHANGES_HUB: HassKey[EntityChangesHub] = HassKey(
+    f"{DOMAIN}_entity_changes_hub"
+)
+
+
+class EntityChangesSubscription:
+    """A subscribe_entities subscription of a connection.
+
+    With a minimum interval, changes that happen within the interval after
+    a message was sent are held back. When the interval has passed the
+    latest state of each changed entity is sent in a single message, as a
+    diff from the state the client already has.
+    """
+
+    __slots__ = (
+        "send_message",
+        "entity_ids",
+        "entity_filter",
+        "user",
+        "id_suffix",
+        "min_interval",
+        "_loop",
+        "_next_send",
+        "_pending",
+        "_flush_handle",
+    )
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send_message: Callable[[str | bytes | dict[str, Any]], None],
+        entity_ids: set[str] | None,
+        entity_filter: Callable[[str], bool] | None,
+        user: User,
+        message_id_as_bytes: bytes,
+        min_interval: float = 0,
+    ) -> None:
+        """Initialize the subscription."""
+        self.send_message = send_message
+        self.entity_ids = entity_ids
+        self.entity_filter = entity_filter
+        self.user = user
+        self.id_suffix = message_id_as_bytes + b"}"
+        self.min_interval = min_interval
+        self._loop = hass.loop
+        self._next_send = 0.0
+        # The state the client has and the latest state of each changed entity
+        self._pending: dict[str, tuple[State | None, State | None]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def async_add_change(
+        self, event: Event[EventStateChangedData], message_prefix: bytes
+    ) -> None:
+        """Send a change now or hold it back until the interval has passed."""
+        if not self._pending and (now := self._loop.time()) >= self._next_send:
+            self._next_send = now + self.min_interval
+            self.send_message(message_prefix + self.id_suffix)
+            return
+        data = event.data
+        entity_id = data["entity_id"]
+        if (pending := self._pending.get(entity_id)) is None:
+            self._pending[entity_id] = (data["old_state"], data["new_state"])
+        else:
+            self._pending[entity_id] = (pending[0], data["new_state"])
+        if self._flush_handle is None:
+            self._flush_handle = self._loop.call_at(self._next_send, self._async_flush)
+
+    @callback
+    def _async_flush(self) -> None:
+        """Send the changes that were held back."""
+        self._flush_handle = None
+        pending = self._pending
+        self._pending = {}
+        self._next_send = self._loop.time() + self.min_interval
+        if message_prefix := messages.coalesced_state_diff_message_prefix(pending):
+            self.send_message(message_prefix + self.id_suffix)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending the changes that were held back."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending = {}
+
+
+class EntityChangesHub:
+    """Forward entity state changes to all subscribe_entities subscriptions.
+
+    A single batch listener for state changed events serializes the diff
+    of a change once and checks the permissions once per user, instead of
+    every subscription doing the same work in its own listener.
+
+    The batch listener can receive changes that happened in the same loop
+    iteration before a subscription was added. Those changes are already
+    in the states the subscription started with, so sending them again
+    does not change what the client has.
+    """
+
+    __slots__ = ("hass", "_subscriptions", "_unsub_state_changed")
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the hub."""
+        self.hass = hass
+        # A tuple so sending a message can never change what we iterate over
+        self._subscriptions: tuple[EntityChangesSubscription, ...] = ()
+        self._unsub_state_changed: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_subscribe(self, subscription: EntityChangesSubscription) -> CALLBACK_TYPE:
+        """Add a subscription and return a callback to remove it."""
+        self._subscriptions = (*self._subscriptions, subscription)
+        if self._unsub_state_changed is None:
+            self._unsub_state_changed = self.hass.bus.async_listen_batch(
+                EVENT_STATE_CHANGED, self._async_forward_entity_changes
+            )
+
+        @callback
+        def _async_unsubscribe() -> None:
+            """Remove the subscription."""
+            subscription.async_cancel()
+            self._subscriptions = tuple(
+                existing
+                for existing in self._subscriptions
+                if existing is not subscription
+            )
+            if not self._subscriptions and self._unsub_state_changed is not None:
+                self._unsub_state_changed()
+                self._unsub_state_changed = None
+
+        return _async_unsubscribe
+
+    @callback
+    def _async_forward_entity_changes(
+        self, events: list[Event[EventStateChangedData]]
+    ) -> None:
+        """Forward a batch of entity state changed events to the subscriptions."""
+        for event in events:
+            self._async_forward_entity_change(event)
+
+    @callback
+    def _async_forward_entity_change(self, event: Event[EventStateChangedData]) -> None:
+        """Forward an entity state changed event to the subscriptions."""
+        entity_id = event.data["entity_id"]
+        message_prefix: bytes | None = None
+        allowed_by_user_id: dict[str, bool] = {}
+        for subscription in self._subscriptions:
+            if (
+                (entity_ids := subscription.entity_ids) and entity_id not in entity_ids
+            ) or (
+                (entity_filter := subscription.entity_filter)
+                and not entity_filter(entity_id)
+            ):
+                continue
+            # We have to lookup the permissions again because the user might
+            # have changed since the subscription was created.
+            user = subscription.user
+            if (allowed := allowed_by_user_id.get(user.id)) is None:
+                permissions = user.permissions
+                allowed = allowed_by_user_id[user.id] = (
+                    user.is_admin
+                    or permissions.access_all_entities(POLICY_READ)
+                    or permissions.check_entity(entity_id, POLICY_READ)
+                )
+            if not allowed:
+                continue
+            if message_prefix is None:
+                message_prefix = messages.state_diff_message_prefix(event)
+            if subscription.min_interval:
+                subscription.async_add_change(event, message_prefix)
+            else:
+                subscription.send_message(message_prefix + subscription.id_suffix)
+
+
+@callback
+def async_get_hub(hass: HomeAssistant) -> EntityChangesHub:
+    """Return the entity changes hub."""
+    if (hub := hass.data.get(DATA_ENTITY_CHANGES_HUB)) is None:
+        hub = hass.data[DATA_ENTITY_CHANGES_HUB] = EntityChangesHub(hass)
+    return hub
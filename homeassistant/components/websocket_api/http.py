@@ -21,9 +21,13 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.async_ import create_eager_task
 from homeassistant.util.json import json_loads
 
+from . import cbor
 from .auth import AUTH_REQUIRED_MESSAGE, AuthPhase
 from .const import (
+    BULK_MSG_SIZE,
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
+    ENCODING_JSON,
     MAX_PENDING_MSG,
     PENDING_MSG_MAX_FORCE_READY,
     PENDING_MSG_PEAK,
@@ -33,7 +37,7 @@ from .const import (
     URL,
 )
 from .error import Disconnect
-from .messages import message_to_json_bytes
+from .messages import message_id, message_to_cbor_bytes, message_to_json_bytes
 from .util import describe_request
 
 if TYPE_CHECKING:
@@ -82,6 +86,11 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_binary",
+        "_bulk_queue",
+        "_bulk_message_ids",
+        "_queued_at",
+        "_max_time_in_queue",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -89,7 +98,8 @@ class WebSocketHandler:
         self._hass = hass
         self._loop = hass.loop
         self._request: web.Request = request
-        self._wsock = web.WebSocketResponse(heartbeat=55)
+        # permessage-deflate is negotiated with clients that offer it
+        self._wsock = web.WebSocketResponse(heartbeat=55, compress=True)
         self._handle_task: asyncio.Task | None = None
         self._writer_task: asyncio.Task | None = None
         self._closing: bool = False
@@ -105,6 +115,15 @@ class WebSocketHandler:
         self._message_queue: deque[bytes] = deque()
         self._ready_future: asyncio.Future[int] | None = None
         self._release_ready_queue_size: int = 0
+        # Bulk messages and the messages that must be sent after them
+        # because they have the same id, with the time they were queued.
+        self._bulk_queue: deque[tuple[bytes, float, int | None]] = deque()
+        self._bulk_message_ids: dict[int | None, int] = {}
+        # When the oldest message in the message queue was queued
+        self._queued_at: float = 0.0
+        self._max_time_in_queue: float = 0.0
+        # Set when an encoding other than JSON was negotiated in the auth phase
+        self._binary: bool = False
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -115,6 +134,25 @@ class WebSocketHandler:
             f"description={self.description}>"
         )
 
+    @property
+    def queued_messages(self) -> int:
+        """Return the number of messages waiting to be sent."""
+        return len(self._message_queue) + len(self._bulk_queue)
+
+    @property
+    def queued_bytes(self) -> int:
+        """Return the size of the messages waiting to be sent."""
+        return sum(map(len, self._message_queue)) + sum(
+            len(message) for message, _, _ in self._bulk_queue
+        )
+
+    @callback
+    def async_pop_max_time_in_queue(self) -> float:
+        """Return the longest time a message waited since the last call."""
+        max_time_in_queue = self._max_time_in_queue
+        self._max_time_in_queue = 0.0
+        return max_time_in_queue
+
     @property
     def description(self) -> str:
         """Return a description of the connection."""
@@ -132,19 +170,21 @@ class WebSocketHandler:
         """Write outgoing messages."""
         # Variables are set locally to avoid lookups in the loop
         message_queue = self._message_queue
+        bulk_queue = self._bulk_queue
+        bulk_message_ids = self._bulk_message_ids
         logger = self._logger
         wsock = self._wsock
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
         can_coalesce = connection.can_coalesce
-        ready_message_count = len(message_queue)
+        binary = self._binary
         # Exceptions if Socket disconnected or cancelled by connection handler
         try:
             while not wsock.closed:
-                if not message_queue:
+                if not message_queue and not bulk_queue:
                     self._ready_future = loop.create_future()
-                    ready_message_count = await self._ready_future
+                    await self._ready_future
 
                 if self._closing:
                     return
@@ -153,14 +193,36 @@ class WebSocketHandler:
                     # coalesce may be enabled later in the connection
                     can_coalesce = connection.can_coalesce
 
-                if not can_coalesce or ready_message_count == 1:
+                if not message_queue:
+                    # Bulk messages are sent one at a time so messages
+                    # queued in the meantime can go before the next one.
+                    # aiohttp cannot split a message in fragments, so
+                    # this is as fine grained as sending them can be.
+                    message, queued_at, message_id_ = bulk_queue.popleft()
+                    if (count := bulk_message_ids[message_id_]) == 1:
+                        del bulk_message_ids[message_id_]
+                    else:
+                        bulk_message_ids[message_id_] = count - 1
+                    self._async_record_time_in_queue(queued_at)
+                    if is_debug_log_enabled():
+                        debug("%s: Sending %s", self.description, message)
+                    await send_bytes_text(message)
+                    continue
+
+                self._async_record_time_in_queue(self._queued_at)
+                if not can_coalesce or len(message_queue) == 1:
                     message = message_queue.popleft()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
                     await send_bytes_text(message)
                     continue
 
-                coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
+                if binary:
+                    coalesced_messages = cbor.encode_array(message_queue)
+                else:
+                    coalesced_messages = b"".join(
+                        (b"[", b",".join(message_queue), b"]")
+                    )
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
@@ -175,6 +237,12 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    @callback
+    def _async_record_time_in_queue(self, queued_at: float) -> None:
+        """Record how long the message that is sent next waited."""
+        if (time_in_queue := self._loop.time() - queued_at) > self._max_time_in_queue:
+            self._max_time_in_queue = time_in_queue
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -195,15 +263,33 @@ class WebSocketHandler:
             # max pending messages.
             return
 
-        if type(message) is not bytes:  # noqa: E721
+        unencoded_message = message
+        if self._binary:
+            message = message_to_cbor_bytes(message)
+        elif type(message) is not bytes:  # noqa: E721
             if isinstance(message, dict):
                 message = message_to_json_bytes(message)
             elif isinstance(message, str):
                 message = message.encode("utf-8")
 
         message_queue = self._message_queue
-        message_queue.append(message)
-        if (queue_size_after_add := len(message_queue)) >= MAX_PENDING_MSG:
+        bulk_queue = self._bulk_queue
+        if (is_bulk := len(message) >= BULK_MSG_SIZE) or bulk_queue:
+            # Messages must be sent in order for each id. Messages without
+            # an id we can find are kept in order with all bulk messages.
+            message_id_ = message_id(unencoded_message)
+            if is_bulk or message_id_ is None or message_id_ in self._bulk_message_ids:
+                bulk_queue.append((message, self._loop.time(), message_id_))
+                self._bulk_message_ids[message_id_] = (
+                    self._bulk_message_ids.get(message_id_, 0) + 1
+                )
+            else:
+                self._async_queue_message(message)
+        else:
+            self._async_queue_message(message)
+        if (
+            queue_size_after_add := len(message_queue) + len(bulk_queue)
+        ) >= MAX_PENDING_MSG:
             self._logger.error(
                 (
                     "%s: Client unable to keep up with pending messages. Reached %s pending"
@@ -234,6 +320,13 @@ class WebSocketHandler:
                 self._hass, PENDING_MSG_PEAK_TIME, self._check_write_peak
             )
 
+    @callback
+    def _async_queue_message(self, message: bytes) -> None:
+        """Queue a message that is not a bulk message."""
+        if not (message_queue := self._message_queue):
+            self._queued_at = self._loop.time()
+        message_queue.append(message)
+
     @callback
     def _release_ready_future_or_reschedule(self) -> None:
         """Release the ready future or reschedule.
@@ -245,7 +338,7 @@ class WebSocketHandler:
         immediately so avoid the coalesced messages from growing too large.
         """
         if not (ready_future := self._ready_future) or not (
-            queue_size := len(self._message_queue)
+            queue_size := self.queued_messages
         ):
             self._release_ready_queue_size = 0
             return
@@ -265,7 +358,7 @@ class WebSocketHandler:
         """Check that we are no longer above the write peak."""
         self._peak_checker_unsub = None
 
-        if len(self._message_queue) < PENDING_MSG_PEAK:
+        if self.queued_messages < PENDING_MSG_PEAK:
             return
 
         self._logger.error(
@@ -277,7 +370,7 @@ class WebSocketHandler:
             self.description,
             PENDING_MSG_PEAK,
             PENDING_MSG_PEAK_TIME,
-            self._message_queue[-1],
+            self._message_queue[-1] if self._message_queue else self._bulk_queue[-1][0],
         )
         self._cancel()
 
@@ -367,7 +460,7 @@ class WebSocketHandler:
 
             self._closing = True
             if self._ready_future and not self._ready_future.done():
-                self._ready_future.set_result(len(self._message_queue))
+                self._ready_future.set_result(self.queued_messages)
 
             await self._async_cleanup_writer_and_close(disconnect_warn, connection)
 
@@ -401,6 +494,9 @@ class WebSocketHandler:
         if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug("%s: Received %s", self.description, auth_msg_data)
         connection = await auth.async_handle(auth_msg_data)
+        if connection.encoding != ENCODING_JSON:
+            self._binary = True
+            send_bytes_text = partial(send_bytes_text, opcode=WSMsgType.BINARY)
         # As the webserver is now started before the start
         # event we do not want to block for websocket responses
         #
@@ -409,6 +505,7 @@ class WebSocketHandler:
         self._connection = connection
         self._writer_task = create_eager_task(self._writer(connection, send_bytes_text))
         self._hass.data[DATA_CONNECTIONS] = self._hass.data.get(DATA_CONNECTIONS, 0) + 1
+        self._hass.data.setdefault(DATA_HANDLERS, set()).add(self)
         async_dispatcher_send(self._hass, SIGNAL_WEBSOCKET_CONNECTED)
 
         self._authenticated = True
@@ -528,6 +625,7 @@ class WebSocketHandler:
 
                 if connection is not None:
                     hass.data[DATA_CONNECTIONS] -= 1
+                    hass.data[DATA_HANDLERS].discard(self)
                     self._connection = None
 
                 async_dispatcher_send(hass, SIGNAL_WEBSOCKET_DISCONNECTED)
@@ -538,6 +636,7 @@ class WebSocketHandler:
                 self._hass = None  # type: ignore[assignment]
                 self._logger = None  # type: ignore[assignment]
                 self._message_queue = None  # type: ignore[assignment]
+                self._bulk_queue = None  # type: ignore[assignment]
                 self._handle_task = None
                 self._writer_task = None
                 self._ready_future = None
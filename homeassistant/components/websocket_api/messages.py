@@ -15,7 +15,7 @@ from homeassistant.const import (
     COMPRESSED_STATE_LAST_UPDATED,
     COMPRESSED_STATE_STATE,
 )
-from homeassistant.core import CompressedState, Event, EventStateChangedData
+from homeassistant.core import CompressedState, Event, EventStateChangedData, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.json import (
     JSON_DUMP,
@@ -24,7 +24,7 @@ from homeassistant.helpers.json import (
 )
 from homeassistant.util.json import format_unserializable_data
 
-from . import const
+from . import cbor, const
 
 _LOGGER: Final = logging.getLogger(__name__)
 
@@ -141,25 +141,17 @@ def _partial_cached_event_message(event: Event) -> bytes:
     )
 
 
-def cached_state_diff_message(
-    message_id_as_bytes: bytes, event: Event[EventStateChangedData]
-) -> bytes:
-    """Return an event message.
+def state_diff_message_prefix(event: Event[EventStateChangedData]) -> bytes:
+    """Return an event message up to the value of the id.
 
     Serialize to json once per message.
 
     Since we can have many clients connected that are
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
+    The message is completed with the id followed by a closing brace.
     """
-    return b"".join(
-        (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            message_id_as_bytes,
-            b"}",
-        )
-    )
+    return _partial_cached_state_diff_message(event)[:-1] + b',"id":'
 
 
 @lru_cache(maxsize=128)
@@ -167,7 +159,7 @@ def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> b
     """Cache and serialize the event to json.
 
     The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    will be appended to state_diff_message_prefix
     """
     return (
         _message_to_json_bytes_or_none(
@@ -199,15 +191,22 @@ def _state_diff_event(
         return {ENTITY_EVENT_REMOVE: [event.data["entity_id"]]}
     if (old_state := event.data["old_state"]) is None:
         return {ENTITY_EVENT_ADD: {new_state.entity_id: new_state.as_compressed_state}}
+    return {
+        ENTITY_EVENT_CHANGE: {new_state.entity_id: _state_diff(old_state, new_state)}
+    }
+
+
+def _state_diff(old_state: State, new_state: State) -> dict[str, dict[str, Any]]:
+    """Return the diff between two states of an entity."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
     old_state_context = old_state.context
     if old_state.state != new_state.state:
         additions[COMPRESSED_STATE_STATE] = new_state.state
-    if old_state.last_changed != new_state.last_changed:
+    if old_state.last_changed_timestamp != new_state.last_changed_timestamp:
         additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed_timestamp
-    elif old_state.last_updated != new_state.last_updated:
+    elif old_state.last_updated_timestamp != new_state.last_updated_timestamp:
         additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated_timestamp
     if old_state_context.parent_id != new_state_context.parent_id:
         additions[COMPRESSED_STATE_CONTEXT] = {"parent_id": new_state_context.parent_id}
@@ -235,7 +234,44 @@ def _state_diff_event(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
+
+
+def coalesced_state_diff_message_prefix(
+    changes: dict[str, tuple[State | None, State | None]],
+) -> bytes | None:
+    """Return an event message with many entity changes up to the value of the id.
+
+    The changes map entity ids to the state the client knows and the latest
+    state, which are combined in a single diff per entity. Returns None if
+    there is nothing to send.
+    """
+    added: dict[str, CompressedState] = {}
+    changed: dict[str, dict[str, dict[str, Any]]] = {}
+    removed: list[str] = []
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            # An entity that was added and removed again is not sent
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = new_state.as_compressed_state
+        else:
+            changed[entity_id] = _state_diff(old_state, new_state)
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    if not event:
+        return None
+    message = (
+        _message_to_json_bytes_or_none({"type": "event", "event": event})
+        or INVALID_JSON_PARTIAL_MESSAGE
+    )
+    return message[:-1] + b',"id":'
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
@@ -259,3 +295,36 @@ def message_to_json_bytes(message: dict[str, Any]) -> bytes:
             message["id"], const.ERR_UNKNOWN_ERROR, "Invalid JSON in response"
         )
     )
+
+
+def message_id(message: bytes | str | dict[str, Any]) -> int | None:
+    """Return the id of a message or None if it cannot be found cheaply.
+
+    Messages serialized to JSON by us start or end with their id.
+    """
+    if isinstance(message, dict):
+        return message.get("id")
+    if isinstance(message, str):
+        message = message.encode("utf-8")
+    if message.startswith(b'{"id":'):
+        digits = message[6 : message.find(b",", 6)]
+    elif message.endswith(b"}") and (start := message.rfind(b',"id":')) != -1:
+        digits = message[start + 6 : -1]
+    else:
+        return None
+    return int(digits) if digits.isdigit() else None
+
+
+def message_to_cbor_bytes(message: bytes | str | dict[str, Any]) -> bytes:
+    """Serialize a websocket message to CBOR or return an error.
+
+    Messages that are already serialized to JSON are embedded as is.
+    """
+    if type(message) is bytes:  # noqa: E721
+        return cbor.embedded_json(message)
+    if isinstance(message, str):
+        return cbor.embedded_json(message.encode("utf-8"))
+    try:
+        return cbor.encode(message)
+    except (ValueError, TypeError):
+        return cbor.embedded_json(message_to_json_bytes(message))
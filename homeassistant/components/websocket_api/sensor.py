@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import UnitOfInformation, UnitOfTime
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -10,6 +15,7 @@ from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
     DATA_CONNECTIONS,
+    DATA_HANDLERS,
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
 )
@@ -22,9 +28,9 @@ async def async_setup_platform(
     discovery_info: DiscoveryInfoType | None = None,
 ) -> None:
     """Set up the API streams platform."""
-    entity = APICount()
-
-    async_add_entities([entity])
+    async_add_entities(
+        [APICount(), APIQueuedMessages(), APIQueuedBytes(), APIMaxTimeInQueue()]
+    )
 
 
 class APICount(SensorEntity):
@@ -54,3 +60,52 @@ class APICount(SensorEntity):
     def _update_count(self) -> None:
         self._attr_native_value = self.hass.data.get(DATA_CONNECTIONS, 0)
         self.async_write_ha_state()
+
+
+class APIQueuedMessages(SensorEntity):
+    """Entity to represent how many messages are waiting to be sent to clients."""
+
+    _attr_name = "Queued messages"
+    _attr_native_unit_of_measurement = "messages"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_update(self) -> None:
+        """Update the number of queued messages of all connections."""
+        self._attr_native_value = sum(
+            handler.queued_messages for handler in self.hass.data.get(DATA_HANDLERS, ())
+        )
+
+
+class APIQueuedBytes(SensorEntity):
+    """Entity to represent the size of the messages waiting to be sent to clients."""
+
+    _attr_name = "Queued bytes"
+    _attr_device_class = SensorDeviceClass.DATA_SIZE
+    _attr_native_unit_of_measurement = UnitOfInformation.BYTES
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    async def async_update(self) -> None:
+        """Update the size of the queued messages of all connections."""
+        self._attr_native_value = sum(
+            handler.queued_bytes for handler in self.hass.data.get(DATA_HANDLERS, ())
+        )
+
+
+class APIMaxTimeInQueue(SensorEntity):
+    """Entity to represent the longest time a message waited to be sent."""
+
+    _attr_name = "Max time in queue"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+
+    async def async_update(self) -> None:
+        """Update the longest time in queue of all connections since the last update."""
+        self._attr_native_value = 1000 * max(
+            (
+                handler.async_pop_max_time_in_queue()
+                for handler in self.hass.data.get(DATA_HANDLERS, ())
+            ),
+            default=0.0,
+        )
@@ -7,7 +7,7 @@ of entities and react to changes.
 from __future__ import annotations
 
 import asyncio
-from collections import UserDict, defaultdict
+from collections import UserDict, defaultdict, deque
 from collections.abc import (
     Callable,
     Collection,
@@ -15,6 +15,7 @@ from collections.abc import (
     Iterable,
     KeysView,
     Mapping,
+    Sequence,
     ValuesView,
 )
 import concurrent.futures
@@ -36,6 +37,8 @@ from typing import (
     Any,
     Final,
     Generic,
+    Literal,
+    NamedTuple,
     NotRequired,
     Self,
     TypedDict,
@@ -43,6 +46,7 @@ from typing import (
     overload,
 )
 from urllib.parse import urlparse
+import weakref
 
 from propcache import cached_property, under_cached_property
 from typing_extensions import TypeVar
@@ -108,8 +112,8 @@ from .util.async_ import (
 from .util.event_type import EventType
 from .util.executor import InterruptibleThreadPoolExecutor
 from .util.hass_dict import HassDict
-from .util.json import JsonObjectType
-from .util.read_only_dict import ReadOnlyDict
+from .util.json import JSON_ENCODE_EXCEPTIONS, JsonObjectType
+from .util.read_only_dict import InternedReadOnlyDict, ReadOnlyDict
 from .util.timeout import TimeoutManager
 from .util.ulid import ulid_at_time, ulid_now
 from .util.unit_system import (
@@ -201,6 +205,12 @@ EVENTS_EXCLUDED_FROM_MATCH_ALL = {
     EVENT_STATE_REPORTED,
 }
 
+# Events that batch listeners can receive coalesced once per loop iteration
+COALESCIBLE_EVENTS: set[EventType[Any] | str] = {
+    EVENT_STATE_CHANGED,
+    EVENT_STATE_REPORTED,
+}
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -1421,6 +1431,21 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+_KeyedJobType = HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None]
+
+_BatchJobType = HassJob[[list[Event[Any]]], Coroutine[Any, Any, None] | None]
+
+
+class EventBatchStats:
+    """Count the events delivered in batches of an event type."""
+
+    __slots__ = ("batches", "events")
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.batches = 0
+        self.events = 0
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1460,7 +1485,21 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_batch_listeners",
+        "_batch_stats",
+        "_coalescible",
+        "_debug",
+        "_dispatch",
+        "_flush_scheduled",
+        "_hass",
+        "_keyed_dispatch",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_dispatch",
+        "_match_all_listeners",
+        "_pending_batches",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
@@ -1469,6 +1508,36 @@ class EventBus:
         ] = defaultdict(list)
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # The listeners to call for each event type are precomputed
+        # when they are first needed and dropped whenever a listener
+        # for the event type or for all events is added or removed.
+        self._dispatch: dict[
+            EventType[Any] | str, tuple[_FilterableJobType[Any], ...]
+        ] = {}
+        self._match_all_dispatch: tuple[_FilterableJobType[Any], ...] = ()
+        # Listeners that only run when a key in the event data has
+        # a specific value are looked up by the value. The jobs of a value
+        # are replaced when a listener is added or removed, so only the
+        # data keys have to be rebuilt when they change.
+        self._keyed_listeners: defaultdict[
+            EventType[Any] | str,
+            dict[str, dict[str, tuple[_KeyedJobType[Any], ...]]],
+        ] = defaultdict(dict)
+        self._keyed_dispatch: dict[
+            EventType[Any] | str,
+            tuple[tuple[str, dict[str, tuple[_KeyedJobType[Any], ...]]], ...],
+        ] = {}
+        # Events of coalescible types are collected for the batch
+        # listeners and delivered once per loop iteration.
+        self._coalescible = set(COALESCIBLE_EVENTS)
+        self._batch_listeners: dict[
+            EventType[Any] | str, tuple[_BatchJobType, ...]
+        ] = {}
+        self._pending_batches: dict[EventType[Any] | str, list[Event[Any]]] = {}
+        self._batch_stats: defaultdict[EventType[Any] | str, EventBatchStats] = (
+            defaultdict(EventBatchStats)
+        )
+        self._flush_scheduled = False
         self._hass = hass
         self._async_logging_changed()
         self.async_listen(EVENT_LOGGING_CHANGED, self._async_logging_changed)
@@ -1484,7 +1553,16 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_listeners in self._keyed_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + sum(
+                len(jobs)
+                for jobs_by_value in keyed_listeners.values()
+                for jobs in jobs_by_value.values()
+            )
+        for event_type, batch_jobs in self._batch_listeners.items():
+            listeners[event_type] = listeners.get(event_type, 0) + len(batch_jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1549,14 +1627,103 @@ class EventBus:
                 "Bus:Handling %s", _event_repr(event_type, origin, event_data)
             )
 
-        listeners = self._listeners.get(event_type, EMPTY_LIST)
+        event: Event[_DataT] | None = None
+        if event_type in self._batch_listeners:
+            # Batch the event before any listener can fire another one
+            event = Event(event_type, event_data, origin, time_fired, context)
+            self._async_add_to_batch(event)
+        self._async_dispatch_event(
+            self._async_get_dispatch(event_type),
+            None if event_data is None else self._keyed_dispatch.get(event_type),
+            event_type,
+            event_data,
+            origin,
+            context,
+            time_fired,
+            event,
+        )
+
+    @callback
+    def async_fire_many_internal(
+        self,
+        event_type: EventType[_DataT] | str,
+        event_datas: Sequence[_DataT],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: float | None = None,
+    ) -> None:
+        """Fire several events of the same type, for internal use only.
+
+        This is the same as calling async_fire_internal for each of the
+        event_datas, but the listeners are only looked up once and batch
+        listeners receive all the events in the same batch.
+
+        This method is intended to only be used by core internally
+        and should not be considered a stable API.
+
+        This method must be run in the event loop.
+        """
+        if self._debug:
+            for event_data in event_datas:
+                _LOGGER.debug(
+                    "Bus:Handling %s", _event_repr(event_type, origin, event_data)
+                )
+
+        dispatch = self._async_get_dispatch(event_type)
+        keyed_dispatch = self._keyed_dispatch.get(event_type)
+        batched = event_type in self._batch_listeners
+        if not dispatch and keyed_dispatch is None and not batched:
+            return
+
+        for event_data in event_datas:
+            event: Event[_DataT] | None = None
+            if batched:
+                event = Event(event_type, event_data, origin, time_fired, context)
+                self._async_add_to_batch(event)
+            self._async_dispatch_event(
+                dispatch,
+                keyed_dispatch,
+                event_type,
+                event_data,
+                origin,
+                context,
+                time_fired,
+                event,
+            )
+
+    @callback
+    def _async_get_dispatch(
+        self, event_type: EventType[Any] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Return the listeners to call for an event type."""
+        if (dispatch := self._dispatch.get(event_type)) is not None:
+            return dispatch
+        if event_type in self._listeners:
+            return self._async_build_dispatch(event_type)
         if event_type not in EVENTS_EXCLUDED_FROM_MATCH_ALL:
-            match_all_listeners = self._match_all_listeners
-        else:
-            match_all_listeners = EMPTY_LIST
+            return self._match_all_dispatch
+        return ()
 
-        event: Event[_DataT] | None = None
-        for job, event_filter in listeners + match_all_listeners:
+    @callback
+    def _async_dispatch_event(
+        self,
+        dispatch: tuple[_FilterableJobType[Any], ...],
+        keyed_dispatch: tuple[
+            tuple[str, dict[str, tuple[_KeyedJobType[Any], ...]]], ...
+        ]
+        | None,
+        event_type: EventType[_DataT] | str,
+        event_data: _DataT | None,
+        origin: EventOrigin,
+        context: Context | None,
+        time_fired: float | None,
+        event: Event[_DataT] | None,
+    ) -> None:
+        """Run the listeners and keyed listeners of an event.
+
+        Unless it is passed in, the event is only created when a listener runs.
+        """
+        for job, event_filter in dispatch:
             if event_filter is not None:
                 try:
                     if event_data is None or not event_filter(event_data):
@@ -1579,6 +1746,78 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if keyed_dispatch is None:
+            return
+
+        for data_key, jobs_by_value in keyed_dispatch:
+            value = event_data.get(data_key)  # type: ignore[union-attr]
+            if type(value) is not str or not (keyed_jobs := jobs_by_value.get(value)):
+                continue
+            if not event:
+                event = Event(
+                    event_type,
+                    event_data,
+                    origin,
+                    time_fired,
+                    context,
+                )
+            for job in keyed_jobs:
+                try:
+                    self._hass.async_run_hass_job(job, event)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_add_to_batch(self, event: Event[Any]) -> None:
+        """Add an event to the batch of its event type."""
+        if (pending := self._pending_batches.get(event.event_type)) is None:
+            self._pending_batches[event.event_type] = [event]
+        else:
+            pending.append(event)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._hass.loop.call_soon(self._async_flush_batches)
+
+    @callback
+    def _async_flush_batches(self) -> None:
+        """Deliver the events collected in this loop iteration."""
+        self._flush_scheduled = False
+        pending_batches = self._pending_batches
+        self._pending_batches = {}
+        for event_type, events in pending_batches.items():
+            if not (batch_jobs := self._batch_listeners.get(event_type)):
+                continue
+            stats = self._batch_stats[event_type]
+            stats.batches += 1
+            stats.events += len(events)
+            for job in batch_jobs:
+                try:
+                    self._hass.async_run_hass_job(job, events)
+                except Exception:
+                    _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_build_dispatch(
+        self, event_type: EventType[Any] | str
+    ) -> tuple[_FilterableJobType[Any], ...]:
+        """Build the listeners to call when an event of event_type is fired."""
+        listeners = self._listeners[event_type]
+        if event_type in EVENTS_EXCLUDED_FROM_MATCH_ALL:
+            dispatch = tuple(listeners)
+        else:
+            dispatch = (*listeners, *self._match_all_listeners)
+        self._dispatch[event_type] = dispatch
+        return dispatch
+
+    @callback
+    def _async_listeners_changed(self, event_type: EventType[Any] | str) -> None:
+        """Drop the precomputed listeners after the listeners changed."""
+        if event_type == MATCH_ALL:
+            self._match_all_dispatch = tuple(self._match_all_listeners)
+            self._dispatch.clear()
+        else:
+            self._dispatch.pop(event_type, None)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1650,10 +1889,149 @@ class EventBus:
     ) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type."""
         self._listeners[event_type].append(filterable_job)
+        self._async_listeners_changed(event_type)
         return functools.partial(
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        value: str,
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type where data_key has value.
+
+        This is the same as listening with an event filter that compares
+        the value of a single key in the event data, but the listeners
+        are looked up by the value instead of calling each filter, which
+        scales to many listeners for the same event type.
+
+        Keyed listeners run after the other listeners of the event type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners require an event type")
+        job = HassJob(listener, f"listen {event_type} {data_key}={value}")
+        keyed_listeners = self._keyed_listeners[event_type]
+        if (jobs_by_value := keyed_listeners.get(data_key)) is None:
+            jobs_by_value = keyed_listeners[data_key] = {}
+            self._async_build_keyed_dispatch(event_type)
+        jobs_by_value[value] = (*jobs_by_value.get(value, ()), job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, data_key, value, job
+        )
+
+    @callback
+    def async_declare_coalescible(self, event_type: EventType[Any] | str) -> None:
+        """Allow batch listeners for events of event_type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Only event types can be coalesced")
+        self._coalescible.add(event_type)
+
+    @callback
+    def async_listen_batch(
+        self,
+        event_type: EventType[_DataT] | str,
+        listener: Callable[[list[Event[_DataT]]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for the events of a coalescible type in batches.
+
+        The listener is called at most once per loop iteration with the
+        events of event_type that were fired since it was last called,
+        in the order they were fired. Listeners registered with
+        async_listen still receive each event on its own.
+
+        This method must be run in the event loop.
+        """
+        if event_type not in self._coalescible:
+            raise HomeAssistantError(f"Event {event_type} is not coalescible")
+        job: _BatchJobType = HassJob(listener, f"listen batch {event_type}")
+        self._batch_listeners[event_type] = (
+            *self._batch_listeners.get(event_type, ()),
+            job,
+        )
+        return functools.partial(self._async_remove_batch_listener, event_type, job)
+
+    @callback
+    def _async_remove_batch_listener(
+        self, event_type: EventType[Any] | str, job: _BatchJobType
+    ) -> None:
+        """Remove a batch listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            batch_jobs = list(self._batch_listeners[event_type])
+            batch_jobs.remove(job)
+        except (KeyError, ValueError):
+            # KeyError is key event_type listener did not exist
+            # ValueError if the listener did not exist within event_type
+            _LOGGER.exception("Unable to remove unknown batch job listener %s", job)
+            return
+        if batch_jobs:
+            self._batch_listeners[event_type] = tuple(batch_jobs)
+        else:
+            del self._batch_listeners[event_type]
+
+    @callback
+    def async_batch_stats(self) -> dict[EventType[Any] | str, dict[str, int]]:
+        """Return how many events were coalesced into batches per event type.
+
+        This method must be run in the event loop.
+        """
+        return {
+            event_type: {
+                "events": stats.events,
+                "batches": stats.batches,
+                "coalesced": stats.events - stats.batches,
+            }
+            for event_type, stats in self._batch_stats.items()
+        }
+
+    @callback
+    def _async_build_keyed_dispatch(self, event_type: EventType[Any] | str) -> None:
+        """Rebuild the data keys to look up for an event type."""
+        if not (keyed_listeners := self._keyed_listeners.get(event_type)):
+            self._keyed_listeners.pop(event_type, None)
+            self._keyed_dispatch.pop(event_type, None)
+            return
+        self._keyed_dispatch[event_type] = tuple(keyed_listeners.items())
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[Any] | str,
+        data_key: str,
+        value: str,
+        job: _KeyedJobType[Any],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            jobs_by_value = keyed_listeners[data_key]
+            jobs = list(jobs_by_value[value])
+            jobs.remove(job)
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+            return
+        if jobs:
+            jobs_by_value[value] = tuple(jobs)
+            return
+        del jobs_by_value[value]
+        if not jobs_by_value:
+            del keyed_listeners[data_key]
+            self._async_build_keyed_dispatch(event_type)
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -1735,6 +2113,7 @@ class EventBus:
             # delete event_type list if empty
             if not self._listeners[event_type] and event_type != MATCH_ALL:
                 self._listeners.pop(event_type)
+            self._async_listeners_changed(event_type)
         except (KeyError, ValueError):
             # KeyError is key event_type listener did not exist
             # ValueError if listener did not exist within event_type
@@ -1771,14 +2150,16 @@ class State:
         "entity_id",
         "state",
         "attributes",
-        "last_changed",
-        "last_reported",
-        "last_updated",
         "context",
         "state_info",
         "domain",
         "object_id",
         "last_updated_timestamp",
+        "_last_changed",
+        "_last_changed_timestamp",
+        "_last_reported",
+        "_last_reported_timestamp",
+        "_last_updated",
         "_cache",
     )
 
@@ -1794,8 +2175,16 @@ class State:
         validate_entity_id: bool | None = True,
         state_info: StateInfo | None = None,
         last_updated_timestamp: float | None = None,
+        last_changed_timestamp: float | None = None,
     ) -> None:
-        """Initialize a new state."""
+        """Initialize a new state.
+
+        If last_updated is not passed but last_updated_timestamp is, the
+        state was updated and reported at last_updated_timestamp and it
+        changed at last_changed_timestamp, or at last_updated_timestamp
+        if neither last_changed nor last_changed_timestamp is passed.
+        The datetimes are then only created when they are accessed.
+        """
         self._cache: dict[str, Any] = {}
         state = str(state)
 
@@ -1812,47 +2201,155 @@ class State:
         # State only creates and expects a ReadOnlyDict so
         # there is no need to check for subclassing with
         # isinstance here so we can use the faster type check.
-        if type(attributes) is not ReadOnlyDict:
+        if (
+            type(attributes) is not ReadOnlyDict
+            and type(attributes) is not InternedReadOnlyDict
+        ):
             self.attributes = ReadOnlyDict(attributes or {})
         else:
             self.attributes = attributes
-        self.last_reported = last_reported or dt_util.utcnow()
-        self.last_updated = last_updated or self.last_reported
-        self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.state_info = state_info
         self.domain, self.object_id = split_entity_id(self.entity_id)
+        if last_updated is None and last_updated_timestamp:
+            self.last_updated_timestamp = last_updated_timestamp
+            self._last_updated = None
+            self._last_reported = last_reported
+            self._last_reported_timestamp = (
+                None if last_reported else last_updated_timestamp
+            )
+            self._last_changed = last_changed
+            if last_changed_timestamp:
+                self._last_changed_timestamp = last_changed_timestamp
+            elif last_changed:
+                self._last_changed_timestamp = None
+            else:
+                self._last_changed_timestamp = last_updated_timestamp
+            return
+
+        last_reported = last_reported or dt_util.utcnow()
+        last_updated = last_updated or last_reported
+        last_changed = last_changed or last_updated
+        self._last_reported = last_reported
+        self._last_updated = last_updated
+        self._last_changed = last_changed
         # The recorder or the websocket_api will always call the timestamps,
         # so we will set the timestamp values here to avoid the overhead of
         # the function call in the property we know will always be called.
-        last_updated = self.last_updated
         if not last_updated_timestamp:
             last_updated_timestamp = last_updated.timestamp()
         self.last_updated_timestamp = last_updated_timestamp
-        if self.last_changed == last_updated:
-            self._cache["last_changed_timestamp"] = last_updated_timestamp
-        # If last_reported is the same as last_updated async_set will pass
-        # the same datetime object for both values so we can use an identity
-        # check here.
-        if self.last_reported is last_updated:
-            self._cache["last_reported_timestamp"] = last_updated_timestamp
-
-    @under_cached_property
-    def name(self) -> str:
-        """Name of this state."""
-        return self.attributes.get(ATTR_FRIENDLY_NAME) or self.object_id.replace(
-            "_", " "
+        self._last_changed_timestamp = (
+            last_updated_timestamp if last_changed == last_updated else None
+        )
+        # If last_reported is the same as last_updated the caller will
+        # usually pass the same datetime object for both values so we can
+        # use an identity check here.
+        self._last_reported_timestamp = (
+            last_updated_timestamp if last_reported is last_updated else None
         )
 
-    @under_cached_property
+    # It is much faster to convert a timestamp to a utc datetime object
+    # than converting a utc datetime object to a timestamp since cpython
+    # does not have a fast path for handling the UTC timezone and has to do
+    # multiple local timezone conversions.
+    #
+    # from_timestamp implementation:
+    # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
+    #
+    # timestamp implementation:
+    # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
+    # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
+    #
+    # The state machine only stores the timestamps and the datetimes
+    # are created the first time they are accessed, which many states
+    # never are.
+
+    @property
+    def last_updated(self) -> datetime.datetime:
+        """Last time the state or attributes were changed."""
+        if (last_updated := self._last_updated) is None:
+            last_updated = self._last_updated = dt_util.utc_from_timestamp(
+                self.last_updated_timestamp
+            )
+        return last_updated
+
+    @last_updated.setter
+    def last_updated(self, value: datetime.datetime) -> None:
+        """Set last updated."""
+        self._last_updated = value
+        self.last_updated_timestamp = value.timestamp()
+
+    @property
+    def last_changed(self) -> datetime.datetime:
+        """Last time the state was changed."""
+        if (last_changed := self._last_changed) is None:
+            if self._last_changed_timestamp == self.last_updated_timestamp:
+                last_changed = self.last_updated
+            else:
+                last_changed = dt_util.utc_from_timestamp(
+                    self._last_changed_timestamp  # type: ignore[arg-type]
+                )
+            self._last_changed = last_changed
+        return last_changed
+
+    @last_changed.setter
+    def last_changed(self, value: datetime.datetime) -> None:
+        """Set last changed."""
+        self._last_changed = value
+        self._last_changed_timestamp = None
+
+    @property
+    def last_reported(self) -> datetime.datetime:
+        """Last time the state was reported."""
+        if (last_reported := self._last_reported) is None:
+            if (
+                self._last_updated is not None
+                and self._last_reported_timestamp == self.last_updated_timestamp
+            ):
+                last_reported = self._last_updated
+            else:
+                last_reported = dt_util.utc_from_timestamp(
+                    self._last_reported_timestamp  # type: ignore[arg-type]
+                )
+            self._last_reported = last_reported
+        return last_reported
+
+    @last_reported.setter
+    def last_reported(self, value: datetime.datetime) -> None:
+        """Set last reported."""
+        self._last_reported = value
+        self._last_reported_timestamp = None
+
+    @property
     def last_changed_timestamp(self) -> float:
         """Timestamp of last change."""
-        return self.last_changed.timestamp()
+        if (last_changed_timestamp := self._last_changed_timestamp) is None:
+            last_changed_timestamp = self._last_changed_timestamp = (
+                self.last_changed.timestamp()
+            )
+        return last_changed_timestamp
 
-    @under_cached_property
+    @property
     def last_reported_timestamp(self) -> float:
         """Timestamp of last report."""
-        return self.last_reported.timestamp()
+        if (last_reported_timestamp := self._last_reported_timestamp) is None:
+            last_reported_timestamp = self._last_reported_timestamp = (
+                self.last_reported.timestamp()
+            )
+        return last_reported_timestamp
+
+    def _set_last_reported_timestamp(self, timestamp: float) -> None:
+        """Set last reported without creating a datetime."""
+        self._last_reported = None
+        self._last_reported_timestamp = timestamp
+
+    @under_cached_property
+    def name(self) -> str:
+        """Name of this state."""
+        return self.attributes.get(ATTR_FRIENDLY_NAME) or self.object_id.replace(
+            "_", " "
+        )
 
     @under_cached_property
     def _as_dict(self) -> dict[str, Any]:
@@ -1913,6 +2410,10 @@ class State:
     @under_cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
+        if type(attributes := self.attributes) is InternedReadOnlyDict:
+            return json_bytes(
+                {**self._as_dict, "attributes": json_fragment(attributes.json_bytes)}
+            )
         return json_bytes(self._as_dict)
 
     @under_cached_property
@@ -1942,7 +2443,7 @@ class State:
             COMPRESSED_STATE_CONTEXT: context,
             COMPRESSED_STATE_LAST_CHANGED: self.last_changed_timestamp,
         }
-        if self.last_changed != self.last_updated:
+        if self.last_changed_timestamp != self.last_updated_timestamp:
             compressed_state[COMPRESSED_STATE_LAST_UPDATED] = (
                 self.last_updated_timestamp
             )
@@ -1956,7 +2457,13 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        compressed_state: dict[str, Any] = self.as_compressed_state  # type: ignore[assignment]
+        if type(attributes := self.attributes) is InternedReadOnlyDict:
+            compressed_state = {
+                **compressed_state,
+                COMPRESSED_STATE_ATTRIBUTES: json_fragment(attributes.json_bytes),
+            }
+        return json_bytes({self.entity_id: compressed_state})[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -2027,12 +2534,22 @@ class States(UserDict[str, State]):
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And secondary indexes that are kept up to date by helpers:
+    - index -> key -> dict[str, True]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        # python has no ordered set, so we use a dict with True values
+        self._secondary_indexes: defaultdict[
+            str, defaultdict[str, dict[str, Literal[True]]]
+        ] = defaultdict(lambda: defaultdict(dict))
+        self._secondary_keys: defaultdict[str, dict[str, tuple[str, ...]]] = (
+            defaultdict(dict)
+        )
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2063,11 +2580,132 @@ class States(UserDict[str, State]):
             return ()
         return self._domain_index[key].values()
 
+    def set_index_keys(self, index: str, entity_id: str, keys: Iterable[str]) -> None:
+        """Set the keys of an entity_id in a secondary index."""
+        keys = tuple(keys)
+        entity_keys = self._secondary_keys[index]
+        if (old_keys := entity_keys.get(entity_id, ())) == keys:
+            return
+        index_data = self._secondary_indexes[index]
+        for key in old_keys:
+            entity_ids = index_data[key]
+            del entity_ids[entity_id]
+            if not entity_ids:
+                del index_data[key]
+        for key in keys:
+            index_data[key][entity_id] = True
+        if keys:
+            entity_keys[entity_id] = keys
+        else:
+            entity_keys.pop(entity_id, None)
+
+    def clear_index(self, index: str) -> None:
+        """Remove all keys from a secondary index."""
+        self._secondary_indexes.pop(index, None)
+        self._secondary_keys.pop(index, None)
+
+    def index_entity_ids(self, index: str, key: str) -> KeysView[str] | tuple[()]:
+        """Get the entity_ids with a key in a secondary index.
+
+        The entity_ids are returned whether or not they have a state.
+        """
+        # Avoid polluting the indexes with non-existing keys
+        if (index_data := self._secondary_indexes.get(index)) is None or (
+            entity_ids := index_data.get(key)
+        ) is None:
+            return ()
+        return entity_ids.keys()
+
+    def index_states(self, index: str, key: str) -> list[State]:
+        """Get the states of the entity_ids with a key in a secondary index."""
+        data = self.data
+        return [
+            state
+            for entity_id in self.index_entity_ids(index, key)
+            if (state := data.get(entity_id)) is not None
+        ]
+
+
+# Attributes with JSON larger than this are not interned to
+# avoid keeping large JSON strings in memory with the attributes.
+MAX_INTERNED_ATTRIBUTES_BYTES = 16384
+
+# The number of removed entities the state machine remembers so clients
+# can be told about removals since the change sequence they have seen.
+MAX_STATE_TOMBSTONES = 4096
+
+
+class AttributesInternTable:
+    """Share equal attribute dicts between all states.
+
+    Attributes are looked up by their JSON, which is kept with the shared
+    dict so it is only serialized once for the websocket api and the
+    recorder. A dict is dropped from the table when no state uses it.
+    """
+
+    __slots__ = ("_table", "hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the intern table."""
+        self._table: weakref.WeakValueDictionary[
+            bytes, InternedReadOnlyDict[str, Any]
+        ] = weakref.WeakValueDictionary()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of shared attribute dicts."""
+        return len(self._table)
+
+    def intern(self, attributes: Mapping[str, Any]) -> ReadOnlyDict[str, Any]:
+        """Return the shared attribute dict that is equal to attributes."""
+        if type(attributes) is InternedReadOnlyDict:
+            return attributes
+        try:
+            attributes_json = json_bytes(attributes)
+        except JSON_ENCODE_EXCEPTIONS:
+            return ReadOnlyDict(attributes)
+        if len(attributes_json) > MAX_INTERNED_ATTRIBUTES_BYTES:
+            return ReadOnlyDict(attributes)
+        # Values that are different but serialize to the same
+        # JSON, like a datetime and its isoformat, are not shared.
+        if (interned := self._table.get(attributes_json)) is not None:
+            if interned == attributes:
+                self.hits += 1
+                return interned
+            return InternedReadOnlyDict(attributes, attributes_json)
+        self.misses += 1
+        interned = InternedReadOnlyDict(attributes, attributes_json)
+        self._table[attributes_json] = interned
+        return interned
+
+
+class StateWrite(NamedTuple):
+    """A state to write with StateMachine.async_set_many."""
+
+    entity_id: str
+    state: str
+    attributes: Mapping[str, Any] | None = None
+    force_update: bool = False
+    state_info: StateInfo | None = None
+
 
 class StateMachine:
     """Helper class that tracks the state of different entities."""
 
-    __slots__ = ("_states", "_states_data", "_reservations", "_bus", "_loop")
+    __slots__ = (
+        "_states",
+        "_states_data",
+        "_reservations",
+        "_bus",
+        "_loop",
+        "_attributes_intern",
+        "_change_sequence",
+        "_entity_sequences",
+        "_tombstones",
+        "_tombstones_floor",
+        "change_epoch",
+    )
 
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
@@ -2078,6 +2716,52 @@ class StateMachine:
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
+        self._attributes_intern = AttributesInternTable()
+        # Every change and removal gets the next sequence number. The sequences
+        # only compare within an epoch, which is new every time we start.
+        self.change_epoch = ulid_now()
+        self._change_sequence = 0
+        # The sequence of the last change of each entity, ordered by sequence
+        self._entity_sequences: dict[str, int] = {}
+        # The sequence and entity_id of the latest removals
+        self._tombstones: deque[tuple[int, str]] = deque(maxlen=MAX_STATE_TOMBSTONES)
+        # The sequence of the latest removal that was dropped from the tombstones
+        self._tombstones_floor = 0
+
+    @property
+    def change_sequence(self) -> int:
+        """Return the sequence of the latest change or removal."""
+        return self._change_sequence
+
+    @callback
+    def async_changes_since(
+        self, sequence: int
+    ) -> tuple[list[State], list[str]] | None:
+        """Return the changes since a sequence of the current epoch.
+
+        Returns the current states of the entities that changed and the
+        entity_ids of the entities that were removed after the sequence,
+        or None if the sequence is from before the removals we remember
+        or was never handed out.
+
+        This method must be run in the event loop.
+        """
+        if sequence < self._tombstones_floor or sequence > self._change_sequence:
+            return None
+        states_data = self._states_data
+        changed: list[State] = []
+        for entity_id, entity_sequence in reversed(self._entity_sequences.items()):
+            if entity_sequence <= sequence:
+                break
+            changed.append(states_data[entity_id])
+        # python has no ordered set, so we use a dict with True values
+        removed: dict[str, Literal[True]] = {}
+        for tombstone_sequence, entity_id in self._tombstones:
+            # An entity that was added again is in the changed states
+            if tombstone_sequence > sequence and entity_id not in states_data:
+                removed[entity_id] = True
+        changed.reverse()
+        return changed, list(removed)
 
     def entity_ids(self, domain_filter: str | None = None) -> list[str]:
         """List of entity ids that are being tracked."""
@@ -2148,6 +2832,44 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_set_index_keys(
+        self, index: str, entity_id: str, keys: Iterable[str]
+    ) -> None:
+        """Set the keys of an entity_id in a secondary index.
+
+        The secondary indexes, for example of the entities in an area,
+        are kept up to date by helpers so the states with a key can be
+        found without walking all states.
+
+        This method must be run in the event loop.
+        """
+        self._states.set_index_keys(index, entity_id, keys)
+
+    @callback
+    def async_clear_index(self, index: str) -> None:
+        """Remove all keys from a secondary index.
+
+        This method must be run in the event loop.
+        """
+        self._states.clear_index(index)
+
+    @callback
+    def async_index_entity_ids(self, index: str, key: str) -> KeysView[str] | tuple[()]:
+        """Return the entity_ids with a key in a secondary index.
+
+        This method must be run in the event loop.
+        """
+        return self._states.index_entity_ids(index, key)
+
+    @callback
+    def async_index_states(self, index: str, key: str) -> list[State]:
+        """Return the states of the entity_ids with a key in a secondary index.
+
+        This method must be run in the event loop.
+        """
+        return self._states.index_states(index, key)
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
@@ -2190,6 +2912,12 @@ class StateMachine:
             return False
 
         old_state.expire()
+        self._change_sequence += 1
+        del self._entity_sequences[entity_id]
+        tombstones = self._tombstones
+        if len(tombstones) == MAX_STATE_TOMBSTONES:
+            self._tombstones_floor = tombstones[0][0]
+        tombstones.append((self._change_sequence, entity_id))
         state_changed_data: EventStateChangedData = {
             "entity_id": entity_id,
             "old_state": old_state,
@@ -2303,6 +3031,93 @@ class StateMachine:
 
         This method must be run in the event loop.
         """
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        changed, event_data = self._async_write_state(
+            entity_id,
+            new_state,
+            attributes,
+            force_update,
+            context,
+            state_info,
+            timestamp,
+        )
+        self._bus.async_fire_internal(  # type: ignore[misc]
+            EVENT_STATE_CHANGED if changed else EVENT_STATE_REPORTED,
+            event_data,
+            context=context,
+            time_fired=timestamp,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        updates: Iterable[StateWrite],
+        context: Context | None = None,
+        timestamp: float | None = None,
+    ) -> None:
+        """Set the state of several entities in one transaction.
+
+        All states are written with the same timestamp and context before
+        any listener runs. The state changed and state reported events are
+        then fired together so the listeners are only looked up once per
+        event type and batch listeners receive the events in one batch.
+
+        This method must be run in the event loop.
+        """
+        if timestamp is None:
+            timestamp = time.time()
+        if context is None:
+            context = Context(id=ulid_at_time(timestamp))
+
+        changed_datas: list[EventStateChangedData] = []
+        reported_datas: list[EventStateReportedData] = []
+        for update in updates:
+            changed, event_data = self._async_write_state(
+                update.entity_id.lower(),
+                str(update.state),
+                update.attributes or {},
+                update.force_update,
+                context,
+                update.state_info,
+                timestamp,
+            )
+            if changed:
+                changed_datas.append(event_data)  # type: ignore[arg-type]
+            else:
+                reported_datas.append(event_data)  # type: ignore[arg-type]
+
+        if changed_datas:
+            self._bus.async_fire_many_internal(
+                EVENT_STATE_CHANGED,
+                changed_datas,
+                context=context,
+                time_fired=timestamp,
+            )
+        if reported_datas:
+            self._bus.async_fire_many_internal(
+                EVENT_STATE_REPORTED,
+                reported_datas,
+                context=context,
+                time_fired=timestamp,
+            )
+
+    @callback
+    def _async_write_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context,
+        state_info: StateInfo | None,
+        timestamp: float,
+    ) -> tuple[bool, EventStateChangedData | EventStateReportedData]:
+        """Write the state of an entity without firing an event.
+
+        Returns if the state changed and the data of the event to fire.
+        """
         # Most cases the key will be in the dict
         # so we optimize for the happy path as
         # python 3.11+ has near zero overhead for
@@ -2314,50 +3129,31 @@ class StateMachine:
             old_state = None
             same_state = False
             same_attr = False
-            last_changed = None
+            last_changed_timestamp = None
         else:
             same_state = old_state.state == new_state and not force_update
             same_attr = old_state.attributes == attributes
-            last_changed = old_state.last_changed if same_state else None
-
-        # It is much faster to convert a timestamp to a utc datetime object
-        # than converting a utc datetime object to a timestamp since cpython
-        # does not have a fast path for handling the UTC timezone and has to do
-        # multiple local timezone conversions.
-        #
-        # from_timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L2936
-        #
-        # timestamp implementation:
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6387
-        # https://github.com/python/cpython/blob/c90a862cdcf55dc1753c6466e5fa4a467a13ae24/Modules/_datetimemodule.c#L6323
-        now = dt_util.utc_from_timestamp(timestamp)
-
-        if context is None:
-            context = Context(id=ulid_at_time(timestamp))
+            last_changed_timestamp = (
+                old_state.last_changed_timestamp if same_state else None
+            )
 
         if same_state and same_attr:
             # mypy does not understand this is only possible if old_state is not None
             old_last_reported = old_state.last_reported  # type: ignore[union-attr]
-            old_state.last_reported = now  # type: ignore[union-attr]
-            old_state._cache["last_reported_timestamp"] = timestamp  # type: ignore[union-attr] # noqa: SLF001
+            old_state._set_last_reported_timestamp(timestamp)  # type: ignore[union-attr] # noqa: SLF001
             # Avoid creating an EventStateReportedData
-            self._bus.async_fire_internal(  # type: ignore[misc]
-                EVENT_STATE_REPORTED,
-                {
-                    "entity_id": entity_id,
-                    "old_last_reported": old_last_reported,
-                    "new_state": old_state,
-                },
-                context=context,
-                time_fired=timestamp,
-            )
-            return
+            return False, {  # type: ignore[return-value]
+                "entity_id": entity_id,
+                "old_last_reported": old_last_reported,
+                "new_state": old_state,
+            }
 
         if same_attr:
             if TYPE_CHECKING:
                 assert old_state is not None
             attributes = old_state.attributes
+        else:
+            attributes = self._attributes_intern.intern(attributes or {})
 
         # This is intentionally called with positional only arguments for performance
         # reasons
@@ -2365,28 +3161,28 @@ class StateMachine:
             entity_id,
             new_state,
             attributes,
-            last_changed,
-            now,
-            now,
+            None,
+            None,
+            None,
             context,
             old_state is None,
             state_info,
             timestamp,
+            last_changed_timestamp,
         )
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
-        state_changed_data: EventStateChangedData = {
+        self._change_sequence += 1
+        # Move the entity to the end so the sequences stay ordered
+        entity_sequences = self._entity_sequences
+        entity_sequences.pop(entity_id, None)
+        entity_sequences[entity_id] = self._change_sequence
+        return True, {
             "entity_id": entity_id,
             "old_state": old_state,
             "new_state": state,
         }
-        self._bus.async_fire_internal(
-            EVENT_STATE_CHANGED,
-            state_changed_data,
-            context=context,
-            time_fired=timestamp,
-        )
 
 
 class SupportsResponse(enum.StrEnum):
@@ -999,6 +999,7 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self._skipped_renders: dict[Template, int] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -1077,6 +1078,25 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> list[dict[str, Any]]:
+        """Return how often and how long each tracked template rendered.
+
+        Skipped renders are the state changes of referenced entities
+        that did not change the state or attributes the template uses.
+        """
+        return [
+            {
+                "template": template.template,
+                "renders": template.render_count,
+                "render_time": template.render_time,
+                "skipped_renders": self._skipped_renders.get(template, 0),
+            }
+            for template in (
+                track_template_.template for track_template_ in self._track_templates
+            )
+        ]
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1145,6 +1165,12 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if not _event_changes_used_state(event, info):
+                self._skipped_renders[template] = (
+                    self._skipped_renders.get(template, 0) + 1
+                )
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1165,6 +1191,7 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
+        template.async_set_render_trigger(event.data["entity_id"] if event else None)
         self._info[template] = info = template.async_render_to_info(
             track_template_.variables
         )
@@ -1974,6 +2001,38 @@ def _event_triggers_rerender(
     return bool(info.filter_lifecycle(entity_id))
 
 
+@callback
+def _event_changes_used_state(
+    event: Event[EventStateChangedData], info: RenderInfo
+) -> bool:
+    """Determine if an event changes the parts of a state the template used.
+
+    Entities that are only referenced by their state value or by
+    specific attributes are rendered again when those change.
+    """
+    entity_id = event.data["entity_id"]
+    if (attributes := info.entity_attributes.get(entity_id)) is None:
+        return True
+
+    old_state = event.data["old_state"]
+    new_state = event.data["new_state"]
+    if old_state is None or new_state is None:
+        return True
+
+    if entity_id in info.state_entities and old_state.state != new_state.state:
+        return True
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    # Unchanged attributes are shared between the old and new state
+    if old_attributes is new_attributes:
+        return False
+
+    return any(
+        old_attributes.get(name) != new_attributes.get(name) for name in attributes
+    )
+
+
 @callback
 def _rate_limit_for_event(
     event: Event[EventStateChangedData],
@@ -59,6 +59,7 @@ from . import (
     entity_registry,
     floor_registry,
     label_registry,
+    state_index,
     template,
     translation,
 )
@@ -575,30 +576,38 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     selected.referenced_devices.update(selector.device_ids)
 
     selected.referenced_areas.update(selector.area_ids)
+    area_device_ids: set[str] = set()
     if selected.referenced_areas:
         for area_id in selected.referenced_areas:
-            selected.referenced_devices.update(
+            area_device_ids.update(
                 device_entry.id
                 for device_entry in dev_reg.devices.get_devices_for_area_id(area_id)
             )
+        selected.referenced_devices.update(area_device_ids)
 
     if not selected.referenced_areas and not selected.referenced_devices:
         return selected
 
-    # Add indirectly referenced by area
+    # Add indirectly referenced by area, the area index includes the entities
+    # of devices in the area that have no explicitly set area
     selected.indirectly_referenced.update(
         entry.entity_id
         for area_id in selected.referenced_areas
-        # The entity's area matches a targeted area
-        for entry in entities.get_entries_for_area_id(area_id)
+        for entity_id in state_index.async_entity_ids(
+            hass, state_index.INDEX_AREA, area_id
+        )
+        if (entry := entities.get(entity_id)) is not None
         # Do not add entities which are hidden or which are config
         # or diagnostic entities.
-        if entry.entity_category is None and entry.hidden_by is None
+        and entry.entity_category is None
+        and entry.hidden_by is None
     )
-    # Add indirectly referenced by device
+    # Add indirectly referenced by device, the entities of devices that are
+    # only referenced by an area were already added by the area index
     selected.indirectly_referenced.update(
         entry.entity_id
         for device_id in selected.referenced_devices
+        if device_id in selector.device_ids or device_id not in area_device_ids
         for entry in entities.get_entries_for_device_id(device_id)
         # Do not add entities which are hidden or which are config
         # or diagnostic entities.
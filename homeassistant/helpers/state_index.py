@@ -0,0 +1,148 @@
+"""Keep the secondary indexes of the state machine up to date."""
+
+from __future__ import annotations
+
+from collections.abc import KeysView
+from typing import TYPE_CHECKING
+
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.util.hass_dict import HassKey
+
+from . import device_registry as dr, entity_registry as er
+
+# The area of an entity, or the area of its device if the entity
+# is enabled and does not have an area of its own, which matches
+# the entities the registries return for an area.
+INDEX_AREA = "area_id"
+INDEX_DEVICE = "device_id"
+INDEX_LABEL = "label_id"
+INDEX_PLATFORM = "platform"
+
+INDEXES = (INDEX_AREA, INDEX_DEVICE, INDEX_LABEL, INDEX_PLATFORM)
+
+DATA_STATE_INDEX: HassKey[StateIndex] = HassKey("state_index")
+
+
+class StateIndex:
+    """Feed the state machine indexes from the entity and device registries.
+
+    The indexes are built the first time they are used and are then
+    updated from the registry updated events. If a registry is replaced
+    the indexes are rebuilt the next time they are used.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the state index."""
+        self.hass = hass
+        self._entity_registry: er.EntityRegistry | None = None
+        self._device_registry: dr.DeviceRegistry | None = None
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._async_entity_registry_updated
+        )
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._async_device_registry_updated
+        )
+
+    @callback
+    def _async_is_current(self) -> bool:
+        """Return if the indexes were built from the current registries."""
+        hass = self.hass
+        return self._entity_registry is er.async_get(
+            hass
+        ) and self._device_registry is dr.async_get(hass)
+
+    @callback
+    def async_ensure_built(self) -> None:
+        """Build the indexes if they were not built from the current registries."""
+        if self._async_is_current():
+            return
+        states = self.hass.states
+        for index in INDEXES:
+            states.async_clear_index(index)
+        self._entity_registry = er.async_get(self.hass)
+        self._device_registry = dr.async_get(self.hass)
+        for entity_id in self._entity_registry.entities:
+            self._async_index_entity(entity_id)
+
+    @callback
+    def _async_index_entity(self, entity_id: str) -> None:
+        """Index an entity from its registry entry."""
+        if TYPE_CHECKING:
+            assert self._entity_registry is not None
+            assert self._device_registry is not None
+        set_index_keys = self.hass.states.async_set_index_keys
+        if (entry := self._entity_registry.entities.get(entity_id)) is None:
+            for index in INDEXES:
+                set_index_keys(index, entity_id, ())
+            return
+        area_id = entry.area_id
+        if (
+            area_id is None
+            and not entry.disabled_by
+            and (device_id := entry.device_id) is not None
+            and (device := self._device_registry.devices.get(device_id)) is not None
+        ):
+            area_id = device.area_id
+        set_index_keys(INDEX_AREA, entity_id, () if area_id is None else (area_id,))
+        set_index_keys(
+            INDEX_DEVICE,
+            entity_id,
+            () if entry.device_id is None else (entry.device_id,),
+        )
+        set_index_keys(INDEX_LABEL, entity_id, entry.labels)
+        set_index_keys(INDEX_PLATFORM, entity_id, (entry.platform,))
+
+    @callback
+    def _async_entity_registry_updated(
+        self, event: Event[er.EventEntityRegistryUpdatedData]
+    ) -> None:
+        """Update the indexes of an entity that was created, updated or removed."""
+        if not self._async_is_current():
+            return
+        data = event.data
+        if old_entity_id := data.get("old_entity_id"):
+            self._async_index_entity(old_entity_id)
+        self._async_index_entity(data["entity_id"])
+
+    @callback
+    def _async_device_registry_updated(
+        self, event: Event[dr.EventDeviceRegistryUpdatedData]
+    ) -> None:
+        """Update the areas of the entities of a device when its area changed."""
+        if (
+            event.data["action"] != "update"
+            or "area_id" not in event.data["changes"]
+            or not self._async_is_current()
+        ):
+            return
+        if TYPE_CHECKING:
+            assert self._entity_registry is not None
+        for entry in self._entity_registry.entities.get_entries_for_device_id(
+            event.data["device_id"], include_disabled_entities=True
+        ):
+            self._async_index_entity(entry.entity_id)
+
+
+@callback
+def async_get(hass: HomeAssistant) -> StateIndex:
+    """Return the state index, building the indexes if needed."""
+    if (state_index := hass.data.get(DATA_STATE_INDEX)) is None:
+        state_index = hass.data[DATA_STATE_INDEX] = StateIndex(hass)
+    state_index.async_ensure_built()
+    return state_index
+
+
+@callback
+def async_entity_ids(
+    hass: HomeAssistant, index: str, key: str
+) -> KeysView[str] | tuple[()]:
+    """Return the entity_ids with a key in an index."""
+    async_get(hass)
+    return hass.states.async_index_entity_ids(index, key)
+
+
+@callback
+def async_states(hass: HomeAssistant, index: str, key: str) -> list[State]:
+    """Return the states of the entities with a key in an index."""
+    async_get(hass)
+    return hass.states.async_index_states(index, key)
@@ -12,9 +12,12 @@ from contextvars import ContextVar
 from copy import deepcopy
 from datetime import date, datetime, time, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
 import pathlib
 import random
@@ -22,6 +25,8 @@ import re
 import statistics
 from struct import error as StructError, pack, unpack_from
 import sys
+import threading
+from time import perf_counter
 from types import CodeType, TracebackType
 from typing import Any, Concatenate, Literal, NoReturn, Self, cast, overload
 from urllib.parse import urlencode as urllib_urlencode
@@ -45,13 +50,16 @@ from homeassistant.const import (
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     ServiceResponse,
     State,
@@ -82,9 +90,11 @@ from . import (
     issue_registry,
     label_registry,
     location as loc_helper,
+    state_index,
 )
 from .deprecation import deprecated_function
 from .singleton import singleton
+from .storage import Store
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -102,6 +112,8 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILE_CACHE: HassKey[TemplateCompileCache] = HassKey("template.compile_cache")
+_RENDER_STATS: HassKey[LRU[str, TemplateRenderStats]] = HassKey("template.render_stats")
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -155,6 +167,18 @@ EVAL_CACHE_SIZE = 512
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
+COMPILE_CACHE_STORAGE_KEY = "core.template_compile_cache"
+COMPILE_CACHE_STORAGE_VERSION = 1
+COMPILE_CACHE_SAVE_DELAY = 60
+# Templates that are only rendered once, for example from the developer
+# tools, are compiled as well so the number of persisted templates is capped.
+MAX_PERSISTED_COMPILED_TEMPLATES = 10000
+
+# The render statistics are kept for the most recently rendered templates
+MAX_TEMPLATE_RENDER_STATS = 2048
+# The number of recent render times used to estimate the 95th percentile
+RENDER_TIME_SAMPLES = 100
+
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 CACHED_TEMPLATE_NO_COLLECT_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
 ENTITY_COUNT_GROWTH_FACTOR = 1.2
@@ -370,6 +394,64 @@ def _cached_parse_result(render_result: str) -> Any:
     return render_result
 
 
+class TemplateRenderStats:
+    """Statistics of the renders of the templates with the same source."""
+
+    __slots__ = ("renders", "render_time", "samples", "last_trigger")
+
+    def __init__(self) -> None:
+        """Initialize the statistics."""
+        self.renders = 0
+        self.render_time = 0.0
+        self.samples: collections.deque[float] = collections.deque(
+            maxlen=RENDER_TIME_SAMPLES
+        )
+        self.last_trigger: str | None = None
+
+    def add(self, render_time: float) -> None:
+        """Add the time a render took."""
+        self.renders += 1
+        self.render_time += render_time
+        self.samples.append(render_time)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dict."""
+        samples = sorted(self.samples)
+        return {
+            "renders": self.renders,
+            "render_time": self.render_time,
+            "p95_render_time": samples[math.ceil(len(samples) * 0.95) - 1]
+            if samples
+            else None,
+            "last_trigger": self.last_trigger,
+        }
+
+
+@callback
+def _async_get_render_stats(hass: HomeAssistant, source: str) -> TemplateRenderStats:
+    """Return the render statistics of a template source."""
+    if (render_stats := hass.data.get(_RENDER_STATS)) is None:
+        render_stats = hass.data[_RENDER_STATS] = LRU(MAX_TEMPLATE_RENDER_STATS)
+    if (stats := render_stats.get(source)) is None:
+        stats = render_stats[source] = TemplateRenderStats()
+    return stats
+
+
+@callback
+def async_get_render_stats(hass: HomeAssistant) -> list[dict[str, Any]]:
+    """Return the render statistics of the templates, most render time first."""
+    if (render_stats := hass.data.get(_RENDER_STATS)) is None:
+        return []
+    return sorted(
+        (
+            {"template": source, **stats.as_dict()}
+            for source, stats in render_stats.items()
+        ),
+        key=lambda stats: stats["render_time"],
+        reverse=True,
+    )
+
+
 class RenderInfo:
     """Holds information about a template render."""
 
@@ -385,6 +467,8 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_attributes",
+        "state_entities",
         "rate_limit",
         "has_time",
     )
@@ -403,6 +487,11 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # Entities that are only referenced by their state value or by specific
+        # attributes, mapped to the attributes, are split from the entities
+        # when frozen.
+        self.entity_attributes: dict[str, collections.abc.Set[str]] = {}
+        self.state_entities: collections.abc.Set[str] = set()
         self.rate_limit: float | None = None
         self.has_time = False
 
@@ -415,6 +504,8 @@ class RenderInfo:
             f" domains={self.domains}"
             f" domains_lifecycle={self.domains_lifecycle}"
             f" entities={self.entities}"
+            f" entity_attributes={self.entity_attributes}"
+            f" state_entities={self.state_entities}"
             f" rate_limit={self.rate_limit}"
             f" has_time={self.has_time}"
             f" exception={self.exception}"
@@ -456,7 +547,35 @@ class RenderInfo:
         self._freeze_sets()
         self.all_states = False
 
+    def _freeze_partial_entities(self) -> None:
+        """Split the entities that only have their state or attributes referenced.
+
+        All referenced entities are kept in the entities so the same state
+        changes are listened to. Entities that are also referenced as a whole
+        or through their domain stay fully referenced.
+        """
+        state_entities = self.state_entities
+        entity_attributes = self.entity_attributes
+        if not state_entities and not entity_attributes:
+            self.state_entities = frozenset()
+            return
+        entities = self.entities
+        partial: dict[str, collections.abc.Set[str]] = {}
+        if not self.all_states and not self.exception:
+            domains = self.domains
+            for entity_id in state_entities | entity_attributes.keys():
+                if (
+                    entity_id not in entities
+                    and split_entity_id(entity_id)[0] not in domains
+                ):
+                    partial[entity_id] = frozenset(entity_attributes.get(entity_id, ()))
+        entities.update(state_entities)  # type: ignore[attr-defined]
+        entities.update(entity_attributes)  # type: ignore[attr-defined]
+        self.entity_attributes = partial
+        self.state_entities = frozenset(state_entities.intersection(partial))
+
     def _freeze_sets(self) -> None:
+        self._freeze_partial_entities()
         self.entities = frozenset(self.entities)
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
@@ -506,6 +625,8 @@ class Template:
         "_log_fn",
         "_hash_cache",
         "_renders",
+        "_render_time",
+        "_fast_render",
     )
 
     def __init__(self, template: str, hass: HomeAssistant | None = None) -> None:
@@ -540,6 +661,8 @@ class Template:
         self._log_fn: Callable[[int, str], None] | None = None
         self._hash_cache: int = hash(self.template)
         self._renders: int = 0
+        self._render_time: float = 0.0
+        self._fast_render: Callable[[], Any] | None = None
 
     @property
     def _env(self) -> TemplateEnvironment:
@@ -629,10 +752,13 @@ class Template:
         if variables is not None:
             kwargs.update(variables)
 
+        start = perf_counter()
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            render_result = self._async_render_compiled(compiled, kwargs)
         except Exception as err:
             raise TemplateError(err) from err
+        finally:
+            self._async_add_render_time(perf_counter() - start)
 
         if len(render_result) > MAX_TEMPLATE_OUTPUT:
             raise TemplateError(
@@ -726,8 +852,6 @@ class Template:
         """Render the template and collect an entity filter."""
         if self.hass and self.hass.config.debug:
             self.hass.verify_event_loop_thread("async_render_to_info")
-        self._renders += 1
-
         render_info = RenderInfo(self)
 
         if not self.hass:
@@ -741,6 +865,7 @@ class Template:
             )
 
         if self.is_static:
+            self._renders += 1
             render_info._result = self.template.strip()  # noqa: SLF001
             render_info._freeze_static()  # noqa: SLF001
             return render_info
@@ -802,10 +927,9 @@ class Template:
         except JSON_DECODE_EXCEPTIONS:
             pass
 
+        start = perf_counter()
         try:
-            render_result = _render_with_context(
-                self.template, compiled, **variables
-            ).strip()
+            render_result = self._async_render_compiled(compiled, variables).strip()
         except jinja2.TemplateError as ex:
             if error_value is _SENTINEL:
                 _LOGGER.error(
@@ -815,6 +939,8 @@ class Template:
                     self.template,
                 )
             return value if error_value is _SENTINEL else error_value
+        finally:
+            self._async_add_render_time(perf_counter() - start)
 
         if not parse_result or self.hass and self.hass.config.legacy_templates:
             return render_result
@@ -851,9 +977,24 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        if not limited:
+            self._fast_render = _async_build_fast_render(self.hass, env, self.template)
 
         return self._compiled
 
+    @callback
+    def _async_render_compiled(
+        self, compiled: jinja2.Template, variables: dict[str, Any]
+    ) -> str:
+        """Render the compiled template, without Jinja if it is a simple expression."""
+        if (fast_render := self._fast_render) is not None and (
+            not variables or variables.keys().isdisjoint(_FAST_RENDER_NAMES)
+        ):
+            with _template_context_manager as cm:
+                cm.set_template(self.template, "rendering")
+                return str(fast_render())
+        return _render_with_context(self.template, compiled, **variables)
+
     def __eq__(self, other):
         """Compare template with another."""
         return (
@@ -862,6 +1003,29 @@ class Template:
             and self.hass == other.hass
         )
 
+    @callback
+    def _async_add_render_time(self, render_time: float) -> None:
+        """Add the time a render took to the template and its statistics."""
+        self._render_time += render_time
+        if self.hass is not None:
+            _async_get_render_stats(self.hass, self.template).add(render_time)
+
+    @callback
+    def async_set_render_trigger(self, entity_id: str | None) -> None:
+        """Set the entity_id whose state change caused the template to render."""
+        if self.hass is not None:
+            _async_get_render_stats(self.hass, self.template).last_trigger = entity_id
+
+    @property
+    def render_count(self) -> int:
+        """Return how many times the template was rendered."""
+        return self._renders
+
+    @property
+    def render_time(self) -> float:
+        """Return the total time in seconds spent rendering the template."""
+        return self._render_time
+
     def __hash__(self) -> int:
         """Hash code for template."""
         return self._hash_cache
@@ -1045,10 +1209,26 @@ class TemplateStateBase(State):
         if self._collect and (render_info := _render_info.get()):
             render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
 
+    def _collect_state_value(self) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            render_info.state_entities.add(self._entity_id)  # type: ignore[attr-defined]
+
+    def _collect_attribute(self, name: str) -> None:
+        if self._collect and (render_info := _render_info.get()):
+            if (
+                attributes := render_info.entity_attributes.get(self._entity_id)
+            ) is None:
+                render_info.entity_attributes[self._entity_id] = {name}
+            else:
+                attributes.add(name)  # type: ignore[attr-defined]
+
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
     def __getitem__(self, item: str) -> Any:
         """Return a property as an attribute for jinja."""
+        if item == "state":
+            self._collect_state_value()
+            return self._state.state
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
@@ -1071,7 +1251,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state_value()
         return self._state.state
 
     @property
@@ -1098,6 +1278,18 @@ class TemplateStateBase(State):
         self._collect_state()
         return self._state.last_updated
 
+    @property
+    def last_changed_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_changed_timestamp."""
+        self._collect_state()
+        return self._state.last_changed_timestamp
+
+    @property
+    def last_reported_timestamp(self) -> float:  # type: ignore[override]
+        """Wrap State.last_reported_timestamp."""
+        self._collect_state()
+        return self._state.last_reported_timestamp
+
     @property
     def context(self) -> Context:  # type: ignore[override]
         """Wrap State.context."""
@@ -1604,23 +1796,10 @@ def area_entities(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
         _area_id = area_id_or_name
     if _area_id is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entity_ids = [
-        entry.entity_id
-        for entry in entity_registry.async_entries_for_area(ent_reg, _area_id)
-    ]
-    dev_reg = device_registry.async_get(hass)
-    # We also need to add entities tied to a device in the area that don't themselves
-    # have an area specified since they inherit the area from the device.
-    entity_ids.extend(
-        [
-            entity.entity_id
-            for device in device_registry.async_entries_for_area(dev_reg, _area_id)
-            for entity in entity_registry.async_entries_for_device(ent_reg, device.id)
-            if entity.area_id is None
-        ]
-    )
-    return entity_ids
+    # The index includes entities tied to a device in the area that don't
+    # themselves have an area specified since they inherit the area from
+    # the device.
+    return list(state_index.async_entity_ids(hass, state_index.INDEX_AREA, _area_id))
 
 
 def area_devices(hass: HomeAssistant, area_id_or_name: str) -> Iterable[str]:
@@ -1720,9 +1899,7 @@ def label_entities(hass: HomeAssistant, label_id_or_name: str) -> Iterable[str]:
     """Return entities for a given label ID or name."""
     if (_label_id := _label_id_or_name(hass, label_id_or_name)) is None:
         return []
-    ent_reg = entity_registry.async_get(hass)
-    entries = entity_registry.async_entries_for_label(ent_reg, _label_id)
-    return [entry.entity_id for entry in entries]
+    return list(state_index.async_entity_ids(hass, state_index.INDEX_LABEL, _label_id))
 
 
 def closest(hass, *args):
@@ -1876,7 +2053,8 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        state_obj._collect_attribute(name)  # noqa: SLF001
+        return state_obj._state.attributes.get(name)  # noqa: SLF001
     return None
 
 
@@ -2735,6 +2913,116 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+# Templates that may be a single expression
+_FAST_RENDER_CANDIDATE = re.compile(r"^\s*\{\{[^{}%#]*\}\}\s*$")
+_FAST_RENDER_FUNCTIONS: dict[str, Callable[..., Any]] = {
+    "has_value": has_value,
+    "is_state": is_state,
+    "is_state_attr": is_state_attr,
+    "state_attr": state_attr,
+}
+_FAST_RENDER_NAMES = frozenset({"states", *_FAST_RENDER_FUNCTIONS})
+_FAST_RENDER_FILTERS = {"float", "int", "round"}
+_FAST_RENDER_OPERATORS: dict[type[jinja2.nodes.Expr], Callable[[Any, Any], Any]] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+}
+_FAST_RENDER_UNARY_OPERATORS: dict[type[jinja2.nodes.Expr], Callable[[Any], Any]] = {
+    jinja2.nodes.Neg: operator.neg,
+    jinja2.nodes.Pos: operator.pos,
+}
+
+
+def _async_build_fast_render(
+    hass: HomeAssistant, env: TemplateEnvironment, template_str: str
+) -> Callable[[], Any] | None:
+    """Build a function to render a template that is a simple expression.
+
+    The expression is a call of states, state_attr, is_state, is_state_attr
+    or has_value with constant arguments, optionally passed through the
+    float, int or round filters and used in arithmetic with constants
+    and other simple expressions.
+    The function calls the same functions and filters as the compiled
+    template, so the result and the collected RenderInfo are the same.
+
+    Returns None if the template is not a simple expression.
+    """
+    if not _FAST_RENDER_CANDIDATE.match(template_str):
+        return None
+    try:
+        parsed = env.parse(template_str)
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(parsed.body) != 1
+        or type(output := parsed.body[0]) is not jinja2.nodes.Output
+    ):
+        return None
+    # The whitespace around the expression is stripped from the result
+    expressions = [
+        node
+        for node in output.nodes
+        if type(node) is not jinja2.nodes.TemplateData or node.data.strip()
+    ]
+    if len(expressions) != 1:
+        return None
+    return _async_build_fast_expression(hass, env, expressions[0])
+
+
+def _async_build_fast_expression(
+    hass: HomeAssistant, env: TemplateEnvironment, node: jinja2.nodes.Node
+) -> Callable[[], Any] | None:
+    """Build a function to evaluate a simple expression."""
+    node_type = type(node)
+    if node_type is jinja2.nodes.Const:
+        return partial(_identity, node.value)
+
+    if (operation := _FAST_RENDER_OPERATORS.get(node_type)) is not None:
+        left = _async_build_fast_expression(hass, env, node.left)
+        right = _async_build_fast_expression(hass, env, node.right)
+        if left is None or right is None:
+            return None
+        return lambda: operation(left(), right())
+
+    if (unary_operation := _FAST_RENDER_UNARY_OPERATORS.get(node_type)) is not None:
+        if (operand := _async_build_fast_expression(hass, env, node.node)) is None:
+            return None
+        return lambda: unary_operation(operand())
+
+    if node_type not in (jinja2.nodes.Call, jinja2.nodes.Filter) or (
+        node.kwargs or node.dyn_args or node.dyn_kwargs
+    ):
+        return None
+    # Constant arguments are folded like the Jinja optimizer does
+    try:
+        args = [arg.as_const() for arg in node.args]
+    except jinja2.nodes.Impossible:
+        return None
+
+    if node_type is jinja2.nodes.Filter:
+        if node.name not in _FAST_RENDER_FILTERS or node.node is None:
+            return None
+        if (value := _async_build_fast_expression(hass, env, node.node)) is None:
+            return None
+        filter_ = env.filters[node.name]
+        return lambda: filter_(value(), *args)
+
+    if type(node.node) is not jinja2.nodes.Name:
+        return None
+    if (name := node.node.name) == "states":
+        return partial(AllStates(hass), *args)
+    if (function := _FAST_RENDER_FUNCTIONS.get(name)) is None:
+        return None
+    return partial(function, hass, *args)
+
+
+def _identity[_T](value: _T) -> _T:
+    """Return the value."""
+    return value
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2813,6 +3101,169 @@ def _get_hass_loader(hass: HomeAssistant) -> HassLoader:
     return HassLoader({})
 
 
+async def async_load_compile_cache(hass: HomeAssistant) -> None:
+    """Load the templates that were compiled before the last restart."""
+    compile_cache = _get_compile_cache(hass)
+    await compile_cache.async_load()
+
+    @callback
+    def _async_log_compile_stats(_: Event) -> None:
+        """Log the time spent compiling templates during startup."""
+        _LOGGER.debug(
+            "Compiled %s templates in %.3f seconds and restored %s"
+            " compiled templates in %.3f seconds during startup",
+            compile_cache.compiled,
+            compile_cache.compile_time,
+            compile_cache.restored,
+            compile_cache.restore_time,
+        )
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_log_compile_stats)
+
+
+@callback
+def async_get_compile_stats(hass: HomeAssistant) -> dict[str, Any]:
+    """Return how many templates were compiled and the time it took."""
+    return _get_compile_cache(hass).as_dict()
+
+
+@singleton(_COMPILE_CACHE)
+def _get_compile_cache(hass: HomeAssistant) -> TemplateCompileCache:
+    return TemplateCompileCache(hass)
+
+
+def _compile_cache_versions() -> dict[str, str | None]:
+    """Return the versions the persisted compiled code is valid for."""
+    return {
+        "homeassistant": __version__,
+        "jinja": jinja2.__version__,
+        "python": sys.implementation.cache_tag,
+    }
+
+
+def _compile_cache_digest(limited: bool, source: str) -> str:
+    """Return the key of the persisted compiled code of a template."""
+    return hashlib.sha256(f"{limited}:{source}".encode()).hexdigest()
+
+
+class TemplateCompileCache:
+    """Share compiled templates and persist them across restarts.
+
+    Templates with the same source are compiled once for all environments
+    of the instance, as long as one of the templates is still in use. The
+    compiled code is also written to storage so the templates do not need
+    to be compiled again on the next start unless Home Assistant, Jinja
+    or Python was upgraded.
+
+    Templates may be compiled outside of the event loop, saving is always
+    scheduled from the event loop.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the compile cache."""
+        self.hass = hass
+        self._store: Store[dict[str, Any]] = Store(
+            hass, COMPILE_CACHE_STORAGE_VERSION, COMPILE_CACHE_STORAGE_KEY
+        )
+        self._code: weakref.WeakValueDictionary[tuple[bool, str], CodeType] = (
+            weakref.WeakValueDictionary()
+        )
+        # Marshaled code loaded from storage, unmarshaled on first use
+        self._persisted: dict[str, str] = {}
+        # Marshaled code of the templates used since the start
+        self._used: dict[str, str] = {}
+        self._loaded = False
+        self.compiled = 0
+        self.compile_time = 0.0
+        self.shared = 0
+        self.restored = 0
+        self.restore_time = 0.0
+
+    async def async_load(self) -> None:
+        """Load the compiled code from storage."""
+        data = await self._store.async_load()
+        if data and data.get("versions") == _compile_cache_versions():
+            self._persisted = data["templates"]
+        self._loaded = True
+        if not self._used.keys() <= self._persisted.keys():
+            self._async_schedule_save()
+
+    def get(self, limited: bool, source: str) -> CodeType | None:
+        """Return the compiled code of a template if it was already compiled."""
+        key = (limited, source)
+        if (code := self._code.get(key)) is not None:
+            self.shared += 1
+            return code
+        digest = _compile_cache_digest(limited, source)
+        if (data := self._persisted.get(digest)) is None:
+            return None
+        start = perf_counter()
+        try:
+            code = marshal.loads(base64.b64decode(data))
+        except (EOFError, TypeError, ValueError):
+            code = None
+        if type(code) is not CodeType:
+            self._persisted.pop(digest, None)
+            return None
+        self.restore_time += perf_counter() - start
+        self.restored += 1
+        self._code[key] = code
+        self._mark_used(digest, data)
+        return code
+
+    def add(
+        self, limited: bool, source: str, code: CodeType, compile_time: float
+    ) -> None:
+        """Add the code of a template that was compiled."""
+        self.compiled += 1
+        self.compile_time += compile_time
+        self._code[(limited, source)] = code
+        try:
+            data = base64.b64encode(marshal.dumps(code)).decode()
+        except ValueError:
+            return
+        if self._mark_used(_compile_cache_digest(limited, source), data):
+            self._schedule_save()
+
+    def _mark_used(self, digest: str, data: str) -> bool:
+        """Mark code as used so it is saved, return if it was not saved before."""
+        if digest in self._used or len(self._used) >= MAX_PERSISTED_COMPILED_TEMPLATES:
+            return False
+        self._used[digest] = data
+        return digest not in self._persisted
+
+    def _schedule_save(self) -> None:
+        """Schedule saving the compiled code from any thread."""
+        if not self._loaded:
+            return
+        hass = self.hass
+        if hass.loop_thread_id == threading.get_ident():
+            self._async_schedule_save()
+        else:
+            hass.loop.call_soon_threadsafe(self._async_schedule_save)
+
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule saving the compiled code."""
+        self._store.async_delay_save(self._data_to_save, COMPILE_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the compiled code of the templates used since the start."""
+        return {"versions": _compile_cache_versions(), "templates": dict(self._used)}
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the compile statistics."""
+        return {
+            "compiled": self.compiled,
+            "compile_time": self.compile_time,
+            "shared": self.shared,
+            "restored": self.restored,
+            "restore_time": self.restore_time,
+            "persisted": len(self._persisted),
+        }
+
+
 class HassLoader(jinja2.BaseLoader):
     """An in-memory jinja loader that keeps track of templates that need to be reloaded."""
 
@@ -2854,6 +3305,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        self.limited = bool(limited)
+        self.compile_cache = None if hass is None else _get_compile_cache(hass)
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3209,7 +3662,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        if (compile_cache := self.compile_cache) is None or not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (compiled := compile_cache.get(self.limited, source)) is None:
+            start = perf_counter()
+            compiled = super().compile(source)
+            compile_cache.add(self.limited, source, compiled, perf_counter() - start)
         self.template_cache[source] = compiled
         return compiled
 
@@ -8,8 +8,12 @@ from collections.abc import Callable
 from contextlib import suppress
 import logging
 from timeit import default_timer as timer
+import tracemalloc
+from typing import Any
+import zlib
 
 from homeassistant import core
+from homeassistant.auth.models import User
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
@@ -17,6 +21,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.template import Template
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +313,301 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+@benchmark
+async def state_machine_single_writes(hass):
+    """Write 50 states 20k times with one async_set call per state."""
+    return await _state_machine_writes(hass, False)
+
+
+@benchmark
+async def state_machine_bulk_writes(hass):
+    """Write 50 states 20k times with one async_set_many call per frame."""
+    return await _state_machine_writes(hass, True)
+
+
+@benchmark
+async def state_machine_memory(hass):
+    """Measure the memory used by 10k entities that were written 10 times."""
+    entities = 10000
+    start = timer()
+    tracemalloc.start()
+    snapshot_start = tracemalloc.take_snapshot()
+    old_states = []
+
+    @core.callback
+    def listener(event):
+        """Hold on to the old states like listeners that compare them do."""
+        if (old_state := event.data["old_state"]) is not None:
+            old_states.append(old_state)
+            if len(old_states) > entities:
+                old_states.pop(0)
+
+    hass.bus.async_listen(EVENT_STATE_CHANGED, listener)
+    for write in range(10):
+        for idx in range(entities):
+            hass.states.async_set(
+                f"sensor.bench_{idx}",
+                str(write),
+                {"unit_of_measurement": "W", "friendly_name": f"Bench {idx}"},
+            )
+    await hass.async_block_till_done()
+    used = sum(
+        stat.size_diff
+        for stat in tracemalloc.take_snapshot().compare_to(snapshot_start, "filename")
+    )
+    tracemalloc.stop()
+    print(f"{used / entities / 2:.0f} bytes per state")
+    return timer() - start
+
+
+async def _state_machine_writes(hass, bulk: bool) -> float:
+    """Write frames of 50 states with a state changed listener per entity."""
+    count = 0
+    entities = 50
+    frames = 20000
+    entity_ids = [f"sensor.bench_{idx}" for idx in range(entities)]
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    async_track_state_change_event(hass, entity_ids, listener)
+
+    start = timer()
+    for frame in range(frames):
+        if bulk:
+            hass.states.async_set_many(
+                core.StateWrite(entity_id, str(frame), {"frame": frame})
+                for entity_id in entity_ids
+            )
+        else:
+            for entity_id in entity_ids:
+                hass.states.async_set(entity_id, str(frame), {"frame": frame})
+    await hass.async_block_till_done()
+    assert count == entities * frames
+    return timer() - start
+
+
+@benchmark
+async def template_render_simple(hass):
+    """Render 5 simple templates 50k times with the fast path."""
+    return _template_renders(hass, True)
+
+
+@benchmark
+async def template_render_simple_jinja(hass):
+    """Render 5 simple templates 50k times with Jinja."""
+    return _template_renders(hass, False)
+
+
+def _template_renders(hass, fast_render: bool) -> float:
+    """Render simple templates to info like template entities do."""
+    hass.states.async_set("sensor.power", "512.5", {"voltage": 230})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 128})
+    templates = [
+        Template(template_str, hass)
+        for template_str in (
+            "{{ states('sensor.power') }}",
+            "{{ states('sensor.power') | float(0) * 2 }}",
+            "{{ (states('sensor.power') | float(0) / 1000) | round(2) }}",
+            "{{ state_attr('light.kitchen', 'brightness') }}",
+            "{{ is_state('light.kitchen', 'on') }}",
+        )
+    ]
+    for template in templates:
+        template.async_render_to_info()
+        assert template._fast_render is not None  # noqa: SLF001
+        if not fast_render:
+            template._fast_render = None  # noqa: SLF001
+
+    start = timer()
+    for _ in range(50000):
+        for template in templates:
+            template.async_render_to_info()
+    return timer() - start
+
+
+@benchmark
+async def websocket_json_encoding(hass):
+    """Encode and deflate 100k websocket messages as JSON."""
+    return _websocket_encoding(hass, False)
+
+
+@benchmark
+async def websocket_cbor_encoding(hass):
+    """Encode and deflate 100k websocket messages as CBOR."""
+    return _websocket_encoding(hass, True)
+
+
+def _websocket_encoding(hass, binary: bool) -> float:
+    """Encode a mix of cached state and result messages like the writer does."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api.messages import (
+        message_to_cbor_bytes,
+        message_to_json_bytes,
+    )
+
+    def encode(message: bytes | dict[str, Any]) -> bytes:
+        """Encode a message like WebSocketHandler._send_message."""
+        if binary:
+            return message_to_cbor_bytes(message)
+        if type(message) is bytes:
+            return message
+        return message_to_json_bytes(message)
+
+    states = [
+        core.State(
+            f"sensor.bench_{idx}",
+            str(idx),
+            {"unit_of_measurement": "W", "friendly_name": f"Bench {idx}"},
+        )
+        for idx in range(1000)
+    ]
+    cached_messages = [
+        b"".join(
+            (b'{"id":1,"type":"event","event":', state.as_compressed_state_json, b"}")
+        )
+        for state in states
+    ]
+    result_messages = [
+        {"id": 2, "type": "result", "success": True, "result": state.as_dict()}
+        for state in states
+    ]
+    # Deflate like permessage-deflate, which keeps the context between messages
+    compressor = zlib.compressobj(zlib.Z_BEST_SPEED, zlib.DEFLATED, -15)
+    encoded_bytes = 0
+    deflated_bytes = 0
+
+    start = timer()
+    for _ in range(50):
+        for message in (*cached_messages, *result_messages):
+            encoded = encode(message)
+            deflated = compressor.compress(encoded) + compressor.flush(
+                zlib.Z_SYNC_FLUSH
+            )
+            encoded_bytes += len(encoded)
+            deflated_bytes += len(deflated)
+    runtime = timer() - start
+    print(f"{encoded_bytes / 100000:.0f} bytes per message")
+    print(f"{deflated_bytes / 100000:.0f} bytes per message with permessage-deflate")
+    print(f"{runtime / 100000 * 1000000:.2f} µs per message")
+    return runtime
+
+
+@benchmark
+async def subscribe_entities_fan_out(hass):
+    """Forward 20k state changes to 40 subscribe_entities subscriptions."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import entity_changes
+
+    count = 0
+
+    @core.callback
+    def send_message(message):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    hub = entity_changes.async_get_hub(hass)
+    for idx in range(40):
+        user = User(name=f"Bench {idx}", perm_lookup=None, is_owner=True)
+        hub.async_subscribe(
+            entity_changes.EntityChangesSubscription(
+                hass, send_message, None, None, user, str(idx).encode()
+            )
+        )
+
+    start = timer()
+    for idx in range(20000):
+        hass.states.async_set(f"sensor.bench_{idx % 50}", str(idx))
+    await hass.async_block_till_done()
+    assert count == 20000 * 40
+    return timer() - start
+
+
+@benchmark
+async def recorder_orm_state_writes(hass):
+    """Write 150k state rows with the recorder ORM flush path."""
+    return await hass.async_add_executor_job(_recorder_state_writes, False)
+
+
+@benchmark
+async def recorder_bulk_state_writes(hass):
+    """Write 150k state rows with the recorder bulk insert path."""
+    return await hass.async_add_executor_job(_recorder_state_writes, True)
+
+
+def _recorder_state_writes(bulk: bool) -> float:
+    """Write state rows for 3000 entities in 50 commits and return the runtime."""
+    # pylint: disable=import-outside-toplevel
+    from sqlalchemy import create_engine, insert
+    from sqlalchemy.orm import Session
+
+    from homeassistant.components.recorder.db_schema import (
+        Base,
+        StateAttributes,
+        States,
+        StatesMeta,
+    )
+    from homeassistant.components.recorder.table_managers.states import PendingStateRow
+
+    entities = 3000
+    commits = 50
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        attributes = StateAttributes(shared_attrs="{}", hash=1)
+        states_meta = [
+            StatesMeta(entity_id=f"sensor.bench_{i}") for i in range(entities)
+        ]
+        session.add(attributes)
+        session.add_all(states_meta)
+        session.commit()
+        attributes_id = attributes.attributes_id
+        metadata_ids = [meta.metadata_id for meta in states_meta]
+
+    last_state_ids: list[int | None] = [None] * entities
+    start = timer()
+    with Session(engine) as session:
+        for commit in range(commits):
+            if bulk:
+                rows = []
+                for idx, metadata_id in enumerate(metadata_ids):
+                    row = PendingStateRow(
+                        "", str(commit), commit, None, None, None, None, None, 0
+                    )
+                    row.metadata_id = metadata_id
+                    row.attributes_id = attributes_id
+                    row.old_state_id = last_state_ids[idx]
+                    rows.append(row)
+                result = session.connection().execute(
+                    insert(States).returning(
+                        States.state_id, sort_by_parameter_order=True
+                    ),
+                    [row.as_insert_params(False) for row in rows],
+                )
+                last_state_ids = list(result.scalars())
+            else:
+                dbstates = []
+                for idx, metadata_id in enumerate(metadata_ids):
+                    dbstate = States(
+                        state=str(commit),
+                        last_updated_ts=commit,
+                        metadata_id=metadata_id,
+                        attributes_id=attributes_id,
+                        old_state_id=last_state_ids[idx],
+                        origin_idx=0,
+                    )
+                    session.add(dbstate)
+                    dbstates.append(dbstate)
+                session.flush()
+                last_state_ids = [dbstate.state_id for dbstate in dbstates]
+            session.commit()
+    runtime = timer() - start
+    print(f"{entities * commits / runtime:.0f} rows/second")
+    engine.dispose()
+    return runtime
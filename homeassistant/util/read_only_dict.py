@@ -1,5 +1,6 @@
 """Read only dictionary."""
 
+from collections.abc import Mapping
 from copy import deepcopy
 from typing import Any
 
@@ -29,3 +30,17 @@ class ReadOnlyDict[_KT, _VT](dict[_KT, _VT]):
         return ReadOnlyDict(
             {deepcopy(key, memo): deepcopy(value, memo) for key, value in self.items()}
         )
+
+
+class InternedReadOnlyDict[_KT, _VT](ReadOnlyDict[_KT, _VT]):
+    """Read only dict that is shared by all holders of equal data.
+
+    The JSON of the dict is kept so it only has to be serialized once.
+    """
+
+    __slots__ = ("json_bytes",)
+
+    def __init__(self, data: Mapping[_KT, _VT], json_bytes: bytes) -> None:
+        """Initialize the dict with its JSON."""
+        super().__init__(data)
+        self.json_bytes = json_bytes
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
@@ -9,7 +10,7 @@ import pytest
 
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
-from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder import Recorder, history as recorder_history
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, STATE_OFF, STATE_ON
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_track_state_change_event
@@ -173,6 +174,57 @@ async def test_history_during_period(
     assert sensor_test_history[2]["a"] == {"any": "attr"}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sending the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_setup_component(hass, "sensor", {})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "on", attributes={"any": "attr"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.two", "off", attributes={"any": "changed"})
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.one", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "entity_ids": ["sensor.one", "sensor.two"],
+        "significant_changes_only": False,
+        "minimal_response": True,
+    }
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    expected = response["result"]
+    assert len(expected["sensor.one"]) == 3
+    assert len(expected["sensor.two"]) == 2
+
+    with patch(
+        "homeassistant.components.recorder.history._modern_iter_significant_states_chunks",
+        partial(recorder_history.modern.iter_significant_states_chunks, chunk_size=2),
+    ):
+        await client.send_json_auto_id(request | {"chunked": True})
+        combined: dict[str, list[dict]] = {}
+        chunks = 0
+        while (response := await client.receive_json())["type"] == "event":
+            chunks += 1
+            for entity_id, states in response["event"]["states"].items():
+                combined.setdefault(entity_id, []).extend(states)
+
+    assert response["success"]
+    assert response["result"] == {}
+    assert chunks == 3
+    assert combined == expected
+
+
 async def test_history_during_period_impossible_conditions(
     hass: HomeAssistant, recorder_mock: Recorder, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -29,11 +29,13 @@ from homeassistant.components.profiler import (
     SERVICE_START_LOG_OBJECTS,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
+    SERVICE_TEMPLATE_STATS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
@@ -313,6 +315,57 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "sqlalchemy_test" in caplog.text
 
 
+async def test_template_stats(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test logging the templates that spent the most time rendering."""
+
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_TEMPLATE_STATS)
+
+    Template("{{ 'slow' }}", hass).async_render()
+    Template("{{ 'fast' }}", hass).async_render()
+    with patch(
+        "homeassistant.components.profiler.async_get_render_stats",
+        return_value=[
+            {
+                "template": "{{ 'slow' }}",
+                "renders": 1,
+                "render_time": 2.0,
+                "p95_render_time": 2.0,
+                "last_trigger": "sensor.slow",
+            },
+            {
+                "template": "{{ 'fast' }}",
+                "renders": 1,
+                "render_time": 1.0,
+                "p95_render_time": 1.0,
+                "last_trigger": None,
+            },
+        ],
+    ):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_TEMPLATE_STATS, {"max_templates": 1}, blocking=True
+        )
+
+    assert "Template rendered 1 times in 2.000 seconds" in caplog.text
+    assert "last triggered by sensor.slow: {{ 'slow' }}" in caplog.text
+    assert "{{ 'fast' }}" not in caplog.text
+    caplog.clear()
+
+    await hass.services.async_call(DOMAIN, SERVICE_TEMPLATE_STATS, blocking=True)
+    assert "{{ 'slow' }}" in caplog.text
+    assert "{{ 'fast' }}" in caplog.text
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
 async def test_log_object_sources(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
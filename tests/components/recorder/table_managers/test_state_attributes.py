@@ -0,0 +1,113 @@
+"""Test state attributes table manager."""
+
+from homeassistant.components import recorder
+from homeassistant.components.recorder import Recorder
+from homeassistant.components.recorder.bloom_filter import HashBloomFilter
+from homeassistant.components.recorder.db_schema import (
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from homeassistant.components.recorder.table_managers.state_attributes import CACHE_SIZE
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.core import HomeAssistant
+
+from ..common import async_wait_recording_done
+
+
+def test_hash_bloom_filter() -> None:
+    """Test the bloom filter has no false negatives."""
+    bloom_filter = HashBloomFilter(0)
+    hashes = [hash_ * 2654435761 & 0xFFFFFFFF for hash_ in range(1000)]
+    for hash_ in hashes:
+        bloom_filter.add(hash_)
+    assert bloom_filter.count == 1000
+    assert all(hash_ in bloom_filter for hash_ in hashes)
+    false_positives = sum(
+        hash_ in bloom_filter for hash_ in range(1 << 20, (1 << 20) + 10000)
+    )
+    assert false_positives < 100
+
+
+async def test_prewarm(recorder_mock: Recorder, hass: HomeAssistant) -> None:
+    """Test the cache is filled with the latest attributes of each entity."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    hass.states.async_set("sensor.one", "1", {"old": True})
+    hass.states.async_set("sensor.one", "2", {"latest": 1})
+    hass.states.async_set("sensor.two", "1", {"latest": 2})
+    await async_wait_recording_done(hass)
+
+    def _prewarm_after_reset() -> None:
+        manager.reset()
+        with instance.get_session() as session:
+            manager.prewarm(session, True)
+
+    await instance.async_add_executor_job(_prewarm_after_reset)
+    assert manager.get_from_cache('{"latest":1}') is not None
+    assert manager.get_from_cache('{"latest":2}') is not None
+    assert manager.get_from_cache('{"old":true}') is None
+
+    def _get_many() -> dict[str, int | None]:
+        with instance.get_session() as session:
+            return manager.get_many(
+                (
+                    (
+                        shared_attrs,
+                        StateAttributes.hash_shared_attrs_bytes(shared_attrs.encode()),
+                    )
+                    for shared_attrs in ('{"old":true}', '{"unknown":true}')
+                ),
+                session,
+            )
+
+    # Attributes that are in the database are still found and
+    # attributes that are not in the database are not looked up
+    skipped_lookups = manager.skipped_lookups
+    results = await instance.async_add_executor_job(_get_many)
+    assert results['{"old":true}'] is not None
+    assert results['{"unknown":true}'] is None
+    assert manager.skipped_lookups == skipped_lookups + 1
+
+    # New attributes are added to the known hashes when they are committed
+    hass.states.async_set("sensor.two", "2", {"unknown": True})
+    await async_wait_recording_done(hass)
+    manager._id_map.clear()
+    results = await instance.async_add_executor_job(_get_many)
+    assert results['{"unknown":true}'] is not None
+
+
+async def test_prewarm_more_than_cache_size(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test the cache is resized before it is filled with the latest attributes."""
+    instance = recorder.get_instance(hass)
+    manager = instance.state_attributes_manager
+    entity_count = CACHE_SIZE + 100
+
+    def _add_states_and_prewarm() -> None:
+        with session_scope(session=instance.get_session()) as session:
+            for idx in range(entity_count):
+                shared_attrs = f'{{"idx":{idx}}}'
+                session.add(
+                    States(
+                        state="on",
+                        last_updated_ts=1.0,
+                        states_meta_rel=StatesMeta(entity_id=f"sensor.s{idx}"),
+                        state_attributes=StateAttributes(
+                            shared_attrs=shared_attrs,
+                            hash=StateAttributes.hash_shared_attrs_bytes(
+                                shared_attrs.encode()
+                            ),
+                        ),
+                    )
+                )
+        manager.reset()
+        with instance.get_session() as session:
+            manager.prewarm(session, True)
+
+    await instance.async_add_executor_job(_add_states_and_prewarm)
+    assert all(
+        manager.get_from_cache(f'{{"idx":{idx}}}') is not None
+        for idx in range(entity_count)
+    )
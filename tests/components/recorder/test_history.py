@@ -5,20 +5,25 @@ from __future__ import annotations
 from copy import copy
 from datetime import datetime, timedelta
 import json
-from unittest.mock import sentinel
+from typing import Any
+from unittest.mock import patch, sentinel
 
 from freezegun import freeze_time
 import pytest
+from sqlalchemy.engine import Connection
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import Recorder, history
+from homeassistant.components.recorder.const import DOMAIN
 from homeassistant.components.recorder.db_schema import (
     StateAttributes,
     States,
     StatesMeta,
 )
 from homeassistant.components.recorder.filters import Filters
+from homeassistant.components.recorder.history import modern as history_modern
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.services import SERVICE_PURGE_ENTITIES
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
@@ -726,6 +731,176 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 100])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+async def test_iter_significant_states_chunks(
+    hass: HomeAssistant,
+    chunk_size: int,
+    minimal_response: bool,
+    significant_changes_only: bool,
+) -> None:
+    """Test combining the chunks gives the same states as a single query."""
+    zero, four, states = record_states(hass)
+    await async_recorder_block_till_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "off", attributes={"any": "changed"})
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    await async_wait_recording_done(hass)
+    entity_ids = [*states, "sensor.test"]
+    end = dt_util.utcnow()
+
+    expected = history.get_significant_states(
+        hass,
+        zero,
+        end,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        compressed_state_format=True,
+    )
+    combined: dict[str, list[dict]] = {}
+    num_chunks = 0
+    for chunk in history_modern.iter_significant_states_chunks(
+        hass,
+        zero,
+        end,
+        entity_ids,
+        significant_changes_only=significant_changes_only,
+        minimal_response=minimal_response,
+        chunk_size=chunk_size,
+    ):
+        num_chunks += 1
+        for entity_id, entity_states in chunk.items():
+            combined.setdefault(entity_id, []).extend(entity_states)
+
+    assert combined == expected
+    if chunk_size == 1:
+        assert num_chunks > len(expected)
+
+
+async def test_iter_significant_states_chunks_streams_results(
+    hass: HomeAssistant,
+) -> None:
+    """Test the chunks are fetched with a server side cursor."""
+    zero = dt_util.utcnow()
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    with patch.object(
+        Connection, "execute", autospec=True, side_effect=Connection.execute
+    ) as execute:
+        chunks = list(
+            history_modern.iter_significant_states_chunks(
+                hass, zero, None, ["sensor.test"], chunk_size=7
+            )
+        )
+
+    assert len(chunks) == 1
+    assert execute.call_args.kwargs["execution_options"] == {
+        "stream_results": True,
+        "yield_per": 7,
+    }
+
+
+@pytest.mark.parametrize("include_start_time_state", [True, False])
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("use_end_time", [True, False])
+async def test_get_significant_states_from_history_cache(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    use_end_time: bool,
+) -> None:
+    """Test significant states are served from the history cache."""
+    history_cache = recorder_mock.history_cache
+    base = dt_util.utcnow() - timedelta(hours=1)
+    entity_ids = ["sensor.one", "sensor.two", "climate.three"]
+
+    def set_states(offset: int) -> None:
+        for idx, entity_id in enumerate(entity_ids):
+            for second in range(3):
+                hass.states.async_set(
+                    entity_id,
+                    str(second % 2),
+                    {"second": second},
+                    timestamp=(
+                        base + timedelta(seconds=offset + idx * 3 + second)
+                    ).timestamp(),
+                )
+        # Attribute only change
+        hass.states.async_set(
+            "sensor.one",
+            "0",
+            {"second": "changed"},
+            timestamp=(base + timedelta(seconds=offset + 9)).timestamp(),
+        )
+
+    def get_states(start_offset: int) -> dict[str, list[dict[str, Any]]]:
+        return history.get_significant_states(
+            hass,
+            base + timedelta(seconds=start_offset),
+            base + timedelta(minutes=5) if use_end_time else None,
+            entity_ids,
+            include_start_time_state=include_start_time_state,
+            significant_changes_only=significant_changes_only,
+            compressed_state_format=True,
+        )
+
+    def get_uncached_states(start_offset: int) -> dict[str, list[dict[str, Any]]]:
+        history_cache.clear()
+        return get_states(start_offset)
+
+    set_states(0)
+    await async_wait_recording_done(hass)
+    assert history_cache.committed_ts == (base + timedelta(seconds=9)).timestamp()
+
+    first = await recorder_mock.async_add_executor_job(get_states, 0)
+    assert history_cache.hits == 0
+
+    # Only sensor.one has states in the new range
+    hass.states.async_set(
+        "sensor.one", "later", timestamp=(base + timedelta(seconds=20)).timestamp()
+    )
+    set_states(30)
+    await async_wait_recording_done(hass)
+
+    for start_offset in (0, 4, 25, 35):
+        hits = history_cache.hits
+        cached = await recorder_mock.async_add_executor_job(get_states, start_offset)
+        assert history_cache.hits == hits + len(entity_ids)
+        assert cached == await recorder_mock.async_add_executor_job(
+            get_uncached_states, start_offset
+        )
+        assert cached != first
+
+    # States in the past clear the cache
+    await recorder_mock.async_add_executor_job(get_states, 0)
+    hass.states.async_set(
+        "sensor.two", "past", timestamp=(base + timedelta(seconds=5.5)).timestamp()
+    )
+    await async_wait_recording_done(hass)
+    hits = history_cache.hits
+    cached = await recorder_mock.async_add_executor_job(get_states, 0)
+    assert history_cache.hits == hits
+    assert cached == await recorder_mock.async_add_executor_job(get_uncached_states, 0)
+    assert "past" in [state["s"] for state in cached["sensor.two"]]
+
+    # Purging clears the cache
+    await recorder_mock.async_add_executor_job(get_states, 0)
+    hits = history_cache.hits
+    await hass.services.async_call(
+        DOMAIN, SERVICE_PURGE_ENTITIES, {"entity_id": "sensor.one"}, blocking=True
+    )
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    cached = await recorder_mock.async_add_executor_job(get_states, 0)
+    assert history_cache.hits == hits
+    assert "sensor.one" not in cached
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
@@ -13,6 +13,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 from sqlalchemy.pool import QueuePool
 
@@ -25,8 +26,10 @@ from homeassistant.components.recorder import (
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
     CONF_DB_URL,
+    CONF_QUERY_WORKERS,
     CONFIG_SCHEMA,
     DOMAIN,
+    QueryType,
     Recorder,
     db_schema,
     get_instance,
@@ -34,6 +37,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_QUERY_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -71,7 +75,15 @@ from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
     MATCH_ALL,
 )
-from homeassistant.core import Context, CoreState, Event, HomeAssistant, State, callback
+from homeassistant.core import (
+    Context,
+    CoreState,
+    Event,
+    HomeAssistant,
+    State,
+    StateWrite,
+    callback,
+)
 from homeassistant.helpers import (
     entity_registry as er,
     issue_registry as ir,
@@ -129,6 +141,10 @@ def _default_recorder(hass: HomeAssistant) -> Recorder:
         hass,
         auto_purge=True,
         auto_repack=True,
+        bulk_insert=False,
+        query_workers=4,
+        range_purge=False,
+        compact_after_days=None,
         keep_days=7,
         commit_interval=1,
         uri="sqlite://",
@@ -360,6 +376,114 @@ async def test_saving_many_states(
         assert db_states[0].event_id is None
 
 
+async def test_saving_states_bulk_insert(
+    hass: HomeAssistant, async_setup_recorder_instance: RecorderInstanceGenerator
+) -> None:
+    """Test saving states with the bulk insert path links old states."""
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_INSERT: True, recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+    assert instance.bulk_insert is True
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.async_set("test.one", "on", attributes)
+    hass.states.async_set("test.one", "off", attributes)
+    hass.states.async_set("test.two", "on", {"other": True})
+    hass.states.async_set("test.one", "on", attributes)
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "off", attributes)
+    hass.states.async_remove("test.two")
+    hass.states.async_remove("test.never_existed")
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = (
+            session.query(States, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.last_updated_ts)
+            .all()
+        )
+        # Rows replacing a row in the same commit are inserted after it
+        # so the state_ids are not in the order the states were set
+        assert [(db_state.state, entity_id) for db_state, entity_id in db_states] == [
+            ("on", "test.one"),
+            ("off", "test.one"),
+            ("on", "test.two"),
+            ("on", "test.one"),
+            ("off", "test.one"),
+            (None, "test.two"),
+        ]
+        state_ids = [db_state.state_id for db_state, _ in db_states]
+        assert [db_state.old_state_id for db_state, _ in db_states] == [
+            None,
+            state_ids[0],
+            None,
+            state_ids[1],
+            state_ids[3],
+            state_ids[2],
+        ]
+        assert db_states[0][0].attributes_id == db_states[4][0].attributes_id
+        assert db_states[0][0].attributes_id != db_states[2][0].attributes_id
+        assert session.query(StateAttributes).count() == 3
+        assert session.query(StatesMeta).count() == 2
+
+
+async def test_saving_states_written_together(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states written together are recorded from one batch."""
+    hass.states.async_set_many(
+        [
+            StateWrite("test.one", "on", {"idx": 1}),
+            StateWrite("test.two", "on", {"idx": 2}),
+            StateWrite("test.one", "off", {"idx": 1}),
+        ]
+    )
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = (
+            session.query(States, StatesMeta.entity_id)
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .order_by(States.state_id)
+            .all()
+        )
+        assert [(db_state.state, entity_id) for db_state, entity_id in db_states] == [
+            ("on", "test.one"),
+            ("on", "test.two"),
+            ("off", "test.one"),
+        ]
+        assert db_states[2][0].old_state_id == db_states[0][0].state_id
+
+
+async def test_saving_states_bulk_insert_unserializable_attributes(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a state with unserializable attributes is not the old state of a row."""
+    await async_setup_recorder_instance(
+        hass, {recorder.CONF_BULK_INSERT: True, recorder.CONF_COMMIT_INTERVAL: 30}
+    )
+
+    hass.states.async_set("test.one", "on", {"bad": object()})
+    hass.states.async_set("test.one", "off", {"good": True})
+    hass.states.async_set("test.one", "on", {"good": True})
+    await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    assert "State is not JSON serializable" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = session.query(States).order_by(States.last_updated_ts).all()
+        assert [db_state.state for db_state in db_states] == ["off", "on"]
+        assert [db_state.old_state_id for db_state in db_states] == [
+            None,
+            db_states[0].state_id,
+        ]
+
+
 async def test_saving_state_with_intermixed_time_changes(
     hass: HomeAssistant, setup_recorder: None
 ) -> None:
@@ -1803,6 +1927,82 @@ async def test_entity_id_filter(
             assert len(db_events) == idx + 1, data
 
 
+@pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
+@pytest.mark.usefixtures("skip_by_db_engine")
+@pytest.mark.parametrize("persistent_database", [True])
+async def test_query_jobs_use_read_only_connections(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test query jobs run on the query workers with read-only connections.
+
+    This test is specific for SQLite: Only SQLite connections are made read-only.
+    """
+    instance = await async_setup_recorder_instance(hass, {CONF_QUERY_WORKERS: 2})
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+
+    def _count_states_and_try_to_delete() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            count = session.query(States).count()
+            with pytest.raises(OperationalError, match="readonly database"):
+                session.execute(text("DELETE FROM states"))
+        return threading.current_thread().name, count
+
+    thread_name, count = await instance.async_add_query_job(
+        QueryType.HISTORY, _count_states_and_try_to_delete
+    )
+    assert thread_name.startswith(DB_QUERY_WORKER_PREFIX)
+    assert count == 1
+
+    # Connections of the other workers can still write
+    hass.states.async_set("sensor.test", "off")
+    await async_wait_recording_done(hass)
+
+    snapshot = instance.query_limiter.async_snapshot()
+    assert snapshot[QueryType.HISTORY]["limit"] == 1
+    assert snapshot[QueryType.HISTORY]["completed"] == 1
+    assert snapshot[QueryType.HISTORY]["running"] == 0
+    assert snapshot[QueryType.LOGBOOK]["completed"] == 0
+
+
+async def test_query_jobs_are_limited_per_query_type(
+    hass: HomeAssistant,
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+) -> None:
+    """Test query jobs of the same type wait when the limit is reached."""
+    instance = await async_setup_recorder_instance(hass, {CONF_QUERY_WORKERS: 2})
+    release = threading.Event()
+
+    def _blocking_job() -> str:
+        release.wait(10)
+        return "done"
+
+    history_job = hass.async_create_task(
+        instance.async_add_query_job(QueryType.HISTORY, _blocking_job)
+    )
+    queued_history_job = hass.async_create_task(
+        instance.async_add_query_job(QueryType.HISTORY, lambda: "queued")
+    )
+    # A different type of query is not held up by the history queries
+    assert (
+        await instance.async_add_query_job(QueryType.STATISTICS, lambda: "statistics")
+        == "statistics"
+    )
+    snapshot = instance.query_limiter.async_snapshot()
+    assert snapshot[QueryType.HISTORY]["running"] == 1
+    assert snapshot[QueryType.HISTORY]["waiting"] == 1
+    assert snapshot[QueryType.STATISTICS]["completed"] == 1
+
+    release.set()
+    assert await history_job == "done"
+    assert await queued_history_job == "queued"
+    snapshot = instance.query_limiter.async_snapshot()
+    assert snapshot[QueryType.HISTORY]["running"] == 0
+    assert snapshot[QueryType.HISTORY]["waiting"] == 0
+    assert snapshot[QueryType.HISTORY]["completed"] == 2
+
+
 @pytest.mark.skip_on_db_engine(["mysql", "postgresql"])
 @pytest.mark.usefixtures("skip_by_db_engine")
 @pytest.mark.parametrize("persistent_database", [True])
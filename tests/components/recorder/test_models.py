@@ -22,6 +22,7 @@ import homeassistant.core as ha
 from homeassistant.exceptions import InvalidEntityFormatError
 from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
+from homeassistant.util.read_only_dict import InternedReadOnlyDict
 
 
 def test_from_event_to_db_event() -> None:
@@ -106,6 +107,37 @@ def test_from_event_to_db_state_attributes_with_null() -> None:
     assert decoded["this_attr"] == "withnull"
 
 
+def test_from_event_to_db_state_attributes_interned() -> None:
+    """Test the JSON of interned attributes is reused unless attributes are excluded."""
+    attrs = InternedReadOnlyDict({"this_attr": True}, b'{"this_attr":true}')
+    state = ha.State("sensor.temperature", "18", attrs)
+    assert state.attributes is attrs
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(
+        event, SupportedDialect.MYSQL
+    )
+    assert shared_attrs is attrs.json_bytes
+
+    attrs = InternedReadOnlyDict(
+        {"this_attr": True, "supported_features": 1},
+        b'{"this_attr":true,"supported_features":1}',
+    )
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    shared_attrs = StateAttributes.shared_attrs_bytes_from_event(
+        event, SupportedDialect.MYSQL
+    )
+    assert shared_attrs == b'{"this_attr":true}'
+
+
 def test_repr() -> None:
     """Test converting event to db state repr."""
     attrs = {"this_attr": True}
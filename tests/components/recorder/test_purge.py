@@ -25,13 +25,13 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import compact_states, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
     SERVICE_PURGE_ENTITIES,
 )
-from homeassistant.components.recorder.tasks import PurgeTask
+from homeassistant.components.recorder.tasks import CompactStatesTask, PurgeTask
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_THEMES_UPDATED, STATE_ON
 from homeassistant.core import HomeAssistant
@@ -110,6 +110,134 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_old_states_by_range(
+    hass: HomeAssistant, recorder_mock: Recorder, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test deleting old states in ranges of last_updated_ts."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+    assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    with (
+        patch.object(recorder_mock, "range_purge", True),
+        patch.object(recorder_mock, "max_bind_vars", 24),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 24),
+    ):
+        # Each range holds 24 states and ends with the states
+        # that share the last_updated_ts of the last one
+        for remaining_states, remaining_attributes in ((48, 2), (24, 1)):
+            assert not purge_old_data(
+                recorder_mock,
+                purge_before,
+                states_batch_size=1,
+                events_batch_size=1,
+                repack=False,
+            )
+            with session_scope(hass=hass) as session:
+                assert session.query(States).count() == remaining_states
+                assert session.query(StateAttributes).count() == remaining_attributes
+
+        progress = recorder_mock.purge_progress
+        assert progress is not None
+        assert progress.states == 48
+        assert progress.attributes == 2
+        assert progress.rows_per_second > 0
+
+        assert purge_old_data(recorder_mock, purge_before, repack=False)
+        assert recorder_mock.purge_progress is None
+        assert "Purged 48 states and 2 attributes" in caplog.text
+
+        with session_scope(hass=hass) as session:
+            states = list(session.query(States))
+            assert len(states) == 24
+            assert {state.state for state in states} == {
+                "dontpurgeme_4",
+                "dontpurgeme_5",
+            }
+            state_ids = {state.state_id for state in states}
+            # States are disconnected from the purged states
+            assert all(
+                state.old_state_id is None or state.old_state_id in state_ids
+                for state in states
+            )
+        assert "test.recorder2" in recorder_mock.states_manager._last_committed_id
+
+        assert purge_old_data(recorder_mock, dt_util.utcnow(), repack=False)
+        with session_scope(hass=hass) as session:
+            assert session.query(States).count() == 0
+            assert session.query(StateAttributes).count() == 0
+        assert "test.recorder2" not in recorder_mock.states_manager._last_committed_id
+
+
+async def test_compact_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test compacting numeric states into buckets."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        days=3
+    )
+    # The 4 that ends the gap is neither the minimum nor the maximum
+    values = ["5", "1", "7", "2", "6", "unavailable", "4", "9", "3", "8", "6"]
+    with freeze_time(start) as freezer:
+        for idx, value in enumerate(values):
+            freezer.move_to(start + timedelta(seconds=idx))
+            hass.states.async_set("sensor.power", value, {"idx": idx})
+            hass.states.async_set("sensor.text", f"text_{idx}")
+        # A bucket with few states is kept as it is
+        for idx, value in enumerate(("7", "8")):
+            freezer.move_to(start + timedelta(minutes=5, seconds=idx))
+            hass.states.async_set("sensor.power", value)
+        await async_wait_recording_done(hass)
+
+    def _get_states() -> dict[str, list[str]]:
+        with session_scope(hass=hass) as session:
+            states: dict[str, list[str]] = {}
+            for state, entity_id in (
+                session.query(States.state, StatesMeta.entity_id)
+                .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+                .order_by(States.last_updated_ts)
+            ):
+                states.setdefault(entity_id, []).append(state)
+            return states
+
+    with patch.object(recorder_mock, "max_bind_vars", 2):
+        assert compact_states(recorder_mock, start, start + timedelta(hours=1))
+    compacted = await recorder_mock.async_add_executor_job(_get_states)
+    # The first, minimum, maximum and last numeric states are kept
+    # on each side of a state that is not numeric
+    assert compacted["sensor.power"] == [
+        "5",
+        "1",
+        "7",
+        "6",
+        "unavailable",
+        "4",
+        "9",
+        "3",
+        "6",
+        "7",
+        "8",
+    ]
+    assert compacted["sensor.text"] == [f"text_{idx}" for idx in range(len(values))]
+
+    def _get_attributes() -> list[str]:
+        with session_scope(hass=hass) as session:
+            return sorted(
+                shared_attrs
+                for (shared_attrs,) in session.query(StateAttributes.shared_attrs)
+            )
+
+    # The attributes of the removed states are removed
+    assert await recorder_mock.async_add_executor_job(_get_attributes) == sorted(
+        [*(f'{{"idx":{idx}}}' for idx in (0, 1, 2, 4, 5, 6, 7, 8, 10)), "{}"]
+    )
+
+    # Compacting again keeps the same states
+    recorder_mock.queue_task(CompactStatesTask(start, start + timedelta(hours=3)))
+    await async_wait_recording_done(hass)
+    assert await recorder_mock.async_add_executor_job(_get_states) == compacted
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -23,6 +23,7 @@ from homeassistant.components.recorder.statistics import (
     async_add_external_statistics,
     async_import_statistics,
     async_list_statistic_ids,
+    get_hourly_statistics_accumulator,
     get_last_short_term_statistics,
     get_last_statistics,
     get_latest_short_term_statistics_with_session,
@@ -2561,6 +2562,79 @@ async def test_recorder_platform_with_statistics(
     recorder_platform.validate_statistics.assert_called_once_with(hass)
 
 
+@pytest.mark.parametrize("invalidate", [False, True])
+async def test_compile_hourly_statistics_from_accumulator(
+    hass: HomeAssistant, setup_recorder: None, invalidate: bool
+) -> None:
+    """Test hourly statistics are the same with and without the accumulator."""
+    zero = get_start_time(dt_util.utcnow()).replace(minute=0) + timedelta(hours=1)
+    metadata = {
+        "has_mean": True,
+        "has_sum": True,
+        "name": None,
+        "source": "recorder",
+        "statistic_id": "sensor.test1",
+        "unit_of_measurement": "kWh",
+    }
+
+    def _mock_compile_statistics(
+        hass: HomeAssistant, session: Any, start: Any, end: Any
+    ) -> PlatformCompiledStatistics:
+        period = int((start - zero).total_seconds() // 300)
+        stat = {
+            "start": start,
+            "mean": None if period == 3 else period * 1.5,
+            "min": period - 1.0,
+            "max": None if period == 11 else period + 10.0,
+            "last_reset": zero,
+            "state": float(period),
+            "sum": period * 2.0,
+        }
+        current_metadata = get_metadata_with_session(
+            recorder.get_instance(hass), session, statistic_ids={"sensor.test1"}
+        )
+        return PlatformCompiledStatistics(
+            [{"meta": metadata, "stat": stat}], current_metadata
+        )
+
+    await _setup_mock_domain(
+        hass, Mock(compile_statistics=Mock(wraps=_mock_compile_statistics))
+    )
+    await async_recorder_block_till_done(hass)
+
+    accumulator = get_hourly_statistics_accumulator(hass)
+    with patch.object(
+        statistics,
+        "_compile_hourly_statistics_summary_mean_stmt",
+        wraps=statistics._compile_hourly_statistics_summary_mean_stmt,
+    ) as summary_mean_stmt:
+        for period in range(12):
+            if invalidate and period == 6:
+                await async_wait_recording_done(hass)
+                accumulator.invalidate()
+            do_adhoc_statistics(hass, start=zero + timedelta(minutes=5 * period))
+        await async_wait_recording_done(hass)
+
+    assert summary_mean_stmt.called is invalidate
+    stats = statistics_during_period(hass, zero, period="hour")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "start": zero.timestamp(),
+                "end": (zero + timedelta(hours=1)).timestamp(),
+                "mean": pytest.approx(
+                    sum(period * 1.5 for period in range(12) if period != 3) / 11
+                ),
+                "min": -1.0,
+                "max": 20.0,
+                "last_reset": zero.timestamp(),
+                "state": 11.0,
+                "sum": 22.0,
+            }
+        ]
+    }
+
+
 async def test_recorder_platform_without_statistics(
     hass: HomeAssistant,
     setup_recorder: None,
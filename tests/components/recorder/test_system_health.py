@@ -35,6 +35,8 @@ async def test_recorder_system_health(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "backlog": ANY,
+        "events_per_second": ANY,
     }
 
 
@@ -64,6 +66,8 @@ async def test_recorder_system_health_alternate_dbms(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "backlog": ANY,
+        "events_per_second": ANY,
     }
 
 
@@ -99,6 +103,8 @@ async def test_recorder_system_health_db_url_missing_host(
         "estimated_db_size": "1.00 MiB",
         "database_engine": db_engine.value,
         "database_version": ANY,
+        "backlog": ANY,
+        "events_per_second": ANY,
     }
 
 
@@ -127,4 +133,6 @@ async def test_recorder_system_health_crashed_recorder_runs_table(
         "estimated_db_size": ANY,
         "database_engine": SupportedDialect.SQLITE.value,
         "database_version": ANY,
+        "backlog": ANY,
+        "events_per_second": ANY,
     }
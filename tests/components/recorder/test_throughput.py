@@ -0,0 +1,85 @@
+"""Test the recorder throughput tracker."""
+
+from unittest.mock import patch
+
+from homeassistant.components.recorder.throughput import (
+    THROUGHPUT_WINDOW,
+    RecorderThroughput,
+)
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event
+
+
+def _state_changed(entity_id: str) -> Event:
+    """Return a state changed event for an entity."""
+    return Event(EVENT_STATE_CHANGED, {"entity_id": entity_id})
+
+
+def test_throughput_windows_roll_without_snapshots() -> None:
+    """Test old windows are dropped even if no snapshot was taken."""
+    now = THROUGHPUT_WINDOW * 1000.0
+    with patch(
+        "homeassistant.components.recorder.throughput.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        throughput = RecorderThroughput()
+        for _ in range(6):
+            throughput.async_record_enqueued(_state_changed("sensor.old"))
+            throughput.record_processed()
+        throughput.record_commit(0.01)
+
+        # Several windows pass without a snapshot
+        now += THROUGHPUT_WINDOW * 5
+        for _ in range(3):
+            throughput.async_record_enqueued(_state_changed("light.new"))
+            throughput.record_processed()
+        throughput.record_commit(0.01)
+
+        snapshot = throughput.async_snapshot()
+        assert snapshot["enqueued"] == 9
+        assert snapshot["committed"] == 9
+        # The previous window was idle
+        assert snapshot["enqueued_per_second"] == 0
+        assert snapshot["committed_per_second"] == 0
+        assert snapshot["top_entity_ids"] == [("light.new", 3)]
+        assert snapshot["top_domains"] == [("light", 3)]
+        assert snapshot["top_event_types"] == [(EVENT_STATE_CHANGED, 3)]
+
+        # The rates are calculated over the previous window
+        now += THROUGHPUT_WINDOW
+        snapshot = throughput.async_snapshot()
+        assert snapshot["enqueued_per_second"] == round(3 / THROUGHPUT_WINDOW, 2)
+        assert snapshot["committed_per_second"] == round(3 / THROUGHPUT_WINDOW, 2)
+        assert snapshot["top_entity_ids"] == [("light.new", 3)]
+
+        # Nothing was enqueued for two windows
+        now += THROUGHPUT_WINDOW * 2
+        snapshot = throughput.async_snapshot()
+        assert snapshot["enqueued_per_second"] == 0
+        assert snapshot["committed_per_second"] == 0
+        assert snapshot["top_entity_ids"] == []
+
+
+def test_throughput_first_window() -> None:
+    """Test the rates of the first window are calculated from its start."""
+    now = THROUGHPUT_WINDOW * 1000.0 + 10
+    with patch(
+        "homeassistant.components.recorder.throughput.time.monotonic",
+        side_effect=lambda: now,
+    ):
+        throughput = RecorderThroughput()
+        for _ in range(20):
+            throughput.async_record_enqueued(_state_changed("sensor.one"))
+            throughput.record_processed()
+        throughput.record_commit(0.01)
+        now += 10
+        snapshot = throughput.async_snapshot()
+        assert snapshot["enqueued_per_second"] == 2
+        assert snapshot["committed_per_second"] == 2
+
+        # The previous window only counts from when tracking started
+        now += THROUGHPUT_WINDOW
+        snapshot = throughput.async_snapshot()
+        assert snapshot["enqueued_per_second"] == round(
+            20 / (THROUGHPUT_WINDOW - 10), 2
+        )
@@ -1595,6 +1595,101 @@ async def test_statistics_during_period_in_the_past(
     assert response["result"] == {}
 
 
+@pytest.mark.freeze_time(datetime.datetime(2022, 10, 21, 7, 25, tzinfo=datetime.UTC))
+@pytest.mark.parametrize("period", ["5minute", "hour", "day", "week", "month"])
+@pytest.mark.parametrize(
+    "types",
+    [None, ["change"], ["last_reset", "state"]],
+)
+async def test_statistics_during_period_columnar(
+    recorder_mock: Recorder,
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    period: str,
+    types: list[str] | None,
+) -> None:
+    """Test statistics_during_period returns the same data as columns."""
+    await hass.config.async_set_time_zone("Europe/Amsterdam")
+    now = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    start = now - timedelta(days=40)
+    num_hours = 40 * 24
+
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": True,
+            "has_sum": False,
+            "name": "Temperature",
+            "source": "test",
+            "statistic_id": "test:temperature",
+            "unit_of_measurement": "°C",
+        },
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "mean": hour % 24,
+                "min": hour % 24 - 1,
+                "max": hour % 24 + 1,
+            }
+            for hour in range(num_hours)
+        ],
+    )
+    async_add_external_statistics(
+        hass,
+        {
+            "has_mean": False,
+            "has_sum": True,
+            "name": "Total imported energy",
+            "source": "test",
+            "statistic_id": "test:total_energy_import",
+            "unit_of_measurement": "kWh",
+        },
+        [
+            {
+                "start": start + timedelta(hours=hour),
+                "last_reset": start + timedelta(days=hour // (24 * 10) * 10),
+                "state": hour % (24 * 10),
+                "sum": hour * 2,
+            }
+            for hour in range(num_hours)
+        ],
+    )
+    await async_wait_recording_done(hass)
+
+    # Short term statistics are not imported, compile a few for the 5minute period
+    do_adhoc_statistics(hass, start=now - timedelta(minutes=10))
+    await async_wait_recording_done(hass)
+
+    request = {
+        "type": "recorder/statistics_during_period",
+        "start_time": (start + timedelta(days=5, hours=3)).isoformat(),
+        "statistic_ids": ["test:total_energy_import", "test:temperature"],
+        "period": period,
+        "units": {"energy": "Wh"},
+    }
+    if types is not None:
+        request["types"] = types
+
+    client = await hass_ws_client()
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    rows = response["result"]
+
+    await client.send_json_auto_id(request | {"columnar": True})
+    response = await client.receive_json()
+    assert response["success"]
+    columns = response["result"]
+
+    assert list(columns) == list(rows)
+    for statistic_id, statistic_rows in rows.items():
+        assert columns[statistic_id] == {
+            key: [row[key] for row in statistic_rows] for key in statistic_rows[0]
+        }
+    if period != "5minute":
+        assert rows
+
+
 async def test_statistics_during_period_bad_start_time(
     recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
@@ -2542,6 +2637,67 @@ async def test_recorder_info(
     }
 
 
+async def test_recorder_throughput(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the recorder throughput and top contributors."""
+    client = await hass_ws_client()
+
+    for idx in range(3):
+        hass.states.async_set("sensor.busy", str(idx))
+    hass.states.async_set("light.quiet", "on")
+    hass.bus.async_fire("custom_event")
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/throughput", "top": 2})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["backlog"] == 0
+    assert result["max_backlog"] == 65000
+    assert result["enqueued"] >= 5
+    assert result["committed"] >= 5
+    assert result["top_entity_ids"] == [["sensor.busy", 3], ["light.quiet", 1]]
+    assert result["top_domains"] == [["sensor", 3], ["light", 1]]
+    assert len(result["top_event_types"]) == 2
+
+    await client.send_json_auto_id({"type": "recorder/throughput"})
+    response = await client.receive_json()
+    assert response["success"]
+    top_event_types = dict(response["result"]["top_event_types"])
+    assert top_event_types["state_changed"] == 4
+    assert top_event_types["custom_event"] == 1
+    latency = result["commit_latency"]
+    assert latency["commits"] >= 1
+    assert sum(latency["buckets_ms"].values()) == latency["commits"]
+
+
+async def test_recorder_query_stats(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the usage of the query workers."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id(
+        {"type": "recorder/list_statistic_ids", "statistic_type": "sum"}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+
+    await client.send_json_auto_id({"type": "recorder/query_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    result = response["result"]
+    assert result["workers"] == 4
+    statistics = result["queries"]["statistics"]
+    assert statistics["limit"] == 3
+    assert statistics["completed"] == 1
+    assert statistics["running"] == 0
+    assert statistics["mean_ms"] is not None
+    assert result["queries"]["history"]["completed"] == 0
+    assert result["queries"]["history"]["mean_ms"] is None
+
+
 async def test_recorder_info_no_recorder(
     hass: HomeAssistant, hass_ws_client: WebSocketGenerator
 ) -> None:
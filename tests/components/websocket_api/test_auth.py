@@ -7,6 +7,7 @@ from aiohttp import WSMsgType
 import pytest
 
 from homeassistant.auth.providers.homeassistant import HassAuthProvider
+from homeassistant.components.websocket_api import cbor
 from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH,
     TYPE_AUTH_INVALID,
@@ -127,6 +128,35 @@ async def test_auth_active_with_token(
     assert auth_msg["type"] == TYPE_AUTH_OK
 
 
+@pytest.mark.parametrize(
+    ("encodings", "encoding"),
+    [(["cbor", "json"], "cbor"), (["unknown", "json", "cbor"], "json"), ([], "json")],
+)
+async def test_auth_negotiate_encoding(
+    hass: HomeAssistant,
+    no_auth_websocket_client,
+    hass_access_token: str,
+    encodings: list[str],
+    encoding: str,
+) -> None:
+    """Test negotiating the encoding of the messages after auth."""
+    await no_auth_websocket_client.send_json(
+        {"type": TYPE_AUTH, "access_token": hass_access_token, "encodings": encodings}
+    )
+    auth_msg = await no_auth_websocket_client.receive_json()
+    assert auth_msg["type"] == TYPE_AUTH_OK
+    assert auth_msg["encoding"] == encoding
+
+    await no_auth_websocket_client.send_json({"id": 5, "type": "ping"})
+    msg = await no_auth_websocket_client.receive()
+    if encoding == "cbor":
+        assert msg.type is WSMsgType.BINARY
+        assert msg.data == cbor.encode({"id": 5, "type": "pong"})
+    else:
+        assert msg.type is WSMsgType.TEXT
+        assert msg.json() == {"id": 5, "type": "pong"}
+
+
 async def test_auth_active_user_inactive(
     hass: HomeAssistant,
     hass_client_no_auth: ClientSessionGenerator,
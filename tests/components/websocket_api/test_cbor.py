@@ -0,0 +1,64 @@
+"""Test the CBOR encoding of websocket messages."""
+
+from datetime import date
+from typing import Any
+
+import pytest
+
+from homeassistant.components.websocket_api import cbor
+from homeassistant.const import UnitOfPower
+from homeassistant.helpers.json import json_fragment
+from homeassistant.util.read_only_dict import ReadOnlyDict
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        # Examples from RFC 8949 Appendix A
+        (0, "00"),
+        (23, "17"),
+        (24, "1818"),
+        (1000, "1903e8"),
+        (1000000, "1a000f4240"),
+        (1000000000000, "1b000000e8d4a51000"),
+        (18446744073709551615, "1bffffffffffffffff"),
+        (-1, "20"),
+        (-1000, "3903e7"),
+        (1.1, "fb3ff199999999999a"),
+        (-4.1, "fbc010666666666666"),
+        (False, "f4"),
+        (True, "f5"),
+        (None, "f6"),
+        ("", "60"),
+        ("IETF", "6449455446"),
+        ("水", "63e6b0b4"),
+        ([], "80"),
+        ([1, [2, 3], (4, 5)], "8301820203820405"),
+        ({"a": 1, "b": [2, 3]}, "a26161016162820203"),
+        # Keys are strings like in JSON
+        ({1: 2}, "a1613102"),
+        (UnitOfPower.WATT, "6157"),
+        (ReadOnlyDict({"a": 1}), "a1616101"),
+        # Other values are embedded as JSON
+        (date(2020, 1, 2), "d901064c22323032302d30312d303222"),
+        (json_fragment(b'{"a":1}'), "d9010647" + b'{"a":1}'.hex()),
+    ],
+)
+def test_encode(value: Any, expected: str) -> None:
+    """Test encoding values."""
+    assert cbor.encode(value).hex() == expected
+
+
+def test_encode_invalid() -> None:
+    """Test encoding values that cannot be serialized."""
+    with pytest.raises(TypeError):
+        cbor.encode({"value": 2**64})
+    with pytest.raises(TypeError):
+        cbor.encode({"value": object()})
+
+
+def test_encode_array() -> None:
+    """Test encoding an array of encoded items."""
+    assert cbor.encode_array(
+        [cbor.encode(1), cbor.embedded_json(b"[2]")]
+    ) == bytes.fromhex("8201d9010643" + b"[2]".hex())
@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+from datetime import timedelta
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -19,14 +20,22 @@ from homeassistant.components.websocket_api.auth import (
 )
 from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
-from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
+from homeassistant.const import EVENT_STATE_CHANGED, SIGNAL_BOOTSTRAP_INTEGRATIONS
+from homeassistant.core import (
+    Context,
+    HomeAssistant,
+    State,
+    StateWrite,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, template
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -34,6 +43,7 @@ from tests.common import (
     MockEntity,
     MockEntityPlatform,
     MockUser,
+    async_fire_time_changed,
     async_mock_service,
     mock_platform,
 )
@@ -819,6 +829,75 @@ async def test_states_filters_visible(
     assert msg["result"][0]["entity_id"] == "test.entity"
 
 
+async def test_get_states_since(
+    hass: HomeAssistant, hass_admin_user: MockUser, websocket_client
+) -> None:
+    """Test get_states_since returns the changes since a sequence."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("light.kitchen", "off")
+
+    await websocket_client.send_json({"id": 5, "type": "get_states_since"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert result["full"]
+    assert result["epoch"] == hass.states.change_epoch
+    assert result["sequence"] == hass.states.change_sequence
+    assert result["states"] == [state.as_dict() for state in hass.states.async_all()]
+    assert result["removed"] == []
+
+    hass.states.async_set("light.bowl", "off")
+    hass.states.async_remove("light.ceiling")
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "get_states_since",
+            "epoch": result["epoch"],
+            "sequence": result["sequence"],
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert not result["full"]
+    assert result["sequence"] == hass.states.change_sequence
+    assert result["states"] == [hass.states.get("light.bowl").as_dict()]
+    assert result["removed"] == ["light.ceiling"]
+
+    # We only get the entities we are allowed to see
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.bowl": True}}})
+    sequence = result["sequence"]
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_remove("light.kitchen")
+    await websocket_client.send_json(
+        {
+            "id": 7,
+            "type": "get_states_since",
+            "epoch": result["epoch"],
+            "sequence": sequence,
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert not result["full"]
+    assert result["states"] == [hass.states.get("light.bowl").as_dict()]
+    assert result["removed"] == []
+
+    # A sequence of another epoch gets all the states
+    await websocket_client.send_json(
+        {"id": 8, "type": "get_states_since", "epoch": "other", "sequence": sequence}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    result = msg["result"]
+    assert result["full"]
+    assert result["states"] == [hass.states.get("light.bowl").as_dict()]
+
+
 async def test_get_states_not_allows_nan(
     hass: HomeAssistant, websocket_client: MockHAClientWebSocket
 ) -> None:
@@ -1310,6 +1389,113 @@ async def test_subscribe_unsubscribe_entities_with_filter(
     }
 
 
+async def test_subscribe_entities_shared_listener(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test subscriptions of all connections share a state changed listener."""
+    listeners = hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0)
+    clients = [await hass_ws_client(hass), await hass_ws_client(hass)]
+    await clients[0].send_json({"id": 5, "type": "subscribe_entities"})
+    await clients[1].send_json({"id": 5, "type": "subscribe_entities"})
+    await clients[1].send_json(
+        {"id": 6, "type": "subscribe_entities", "entity_ids": ["light.other"]}
+    )
+    for client, msg_id in ((clients[0], 5), (clients[1], 5), (clients[1], 6)):
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["success"]
+        msg = await client.receive_json()
+        assert msg["id"] == msg_id
+        assert msg["event"] == {"a": {}}
+    assert hass.bus.async_listeners()[EVENT_STATE_CHANGED] == listeners + 1
+
+    hass.states.async_set("light.test", "on")
+    for client in clients:
+        msg = await client.receive_json()
+        assert msg["id"] == 5
+        assert msg["event"] == {
+            "a": {"light.test": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+        }
+
+    # Changes written together are forwarded from one batch in order
+    hass.states.async_set_many(
+        [StateWrite("light.test", "off"), StateWrite("light.other", "on")]
+    )
+    for client, expected in (
+        (clients[0], [(5, "light.test"), (5, "light.other")]),
+        (clients[1], [(5, "light.test"), (5, "light.other"), (6, "light.other")]),
+    ):
+        received = []
+        for _ in expected:
+            msg = await client.receive_json()
+            received.append((msg["id"], next(iter(msg["event"].values())).popitem()[0]))
+        assert received == expected
+
+    for client, msg_id in ((clients[0], 5), (clients[1], 5), (clients[1], 6)):
+        await client.send_json(
+            {"id": msg_id + 10, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await client.receive_json()
+        assert msg["success"]
+    assert hass.bus.async_listeners().get(EVENT_STATE_CHANGED, 0) == listeners
+
+
+async def test_subscribe_entities_min_interval(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test changes within the minimum interval are coalesced."""
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_entities", "min_interval": 10}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.changed": {"a": {"color": "red"}, "c": ANY, "lc": ANY, "s": "off"}}
+    }
+
+    # The first change is sent right away
+    hass.states.async_set("light.changed", "on", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"light.changed": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}
+    }
+
+    # Changes within the interval are held back
+    hass.states.async_set("light.changed", "off", {"color": "red"})
+    hass.states.async_set("light.changed", "on", {"color": "blue"})
+    hass.states.async_set("light.changed", "on", {"color": "green", "effect": "x"})
+    hass.states.async_set("light.added", "on")
+    hass.states.async_set("light.added_and_removed", "on")
+    hass.states.async_remove("light.added_and_removed")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"] == {
+        "a": {"light.added": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}},
+        "c": {
+            "light.changed": {
+                "+": {"a": {"color": "green", "effect": "x"}, "c": ANY, "lc": ANY}
+            }
+        },
+    }
+
+    hass.states.async_remove("light.changed")
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=22))
+    await websocket_client.send_json({"id": 7, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2563,6 +2749,36 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_template_render_stats(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the render statistics of the templates."""
+    template.Template("{{ 1 + 1 }}", hass).async_render()
+
+    await websocket_client.send_json({"id": 7, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == [
+        {
+            "template": "{{ 1 + 1 }}",
+            "renders": 1,
+            "render_time": ANY,
+            "p95_render_time": ANY,
+            "last_trigger": None,
+        }
+    ]
+
+    hass_admin_user.groups = []
+    await websocket_client.send_json({"id": 8, "type": "template/render_stats"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_UNAUTHORIZED
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
@@ -10,16 +10,22 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    cbor,
     const,
     http,
     websocket_command,
 )
 from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.setup import async_setup_component
 from homeassistant.util.dt import utcnow
 
 from tests.common import async_fire_time_changed
-from tests.typing import MockHAClientWebSocket, WebSocketGenerator
+from tests.typing import (
+    ClientSessionGenerator,
+    MockHAClientWebSocket,
+    WebSocketGenerator,
+)
 
 
 @pytest.fixture
@@ -345,6 +351,53 @@ async def test_pending_msg_peak_but_does_not_overflow(
     assert "Client unable to keep up with pending messages" not in caplog.text
 
 
+async def test_bulk_messages(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test bulk messages are sent after other messages and in order per id."""
+    orig_handler = http.WebSocketHandler
+    setup_instance: http.WebSocketHandler | None = None
+
+    def instantiate_handler(*args):
+        nonlocal setup_instance
+        setup_instance = orig_handler(*args)
+        return setup_instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    instance: http.WebSocketHandler = cast(http.WebSocketHandler, setup_instance)
+    assert hass.data[const.DATA_HANDLERS] == {instance}
+
+    bulk_result = {"id": 10, "type": "result", "success": True, "result": "x" * 70000}
+    instance._send_message(bulk_result)
+    instance._send_message({"id": 11, "type": "pong"})
+    instance._send_message({"id": 10, "type": "event", "event": "after bulk"})
+    instance._send_message(b'{"type":"unknown"}')
+    assert instance.queued_messages == 4
+    assert instance.queued_bytes > 70000
+
+    assert await websocket_client.receive_json() == {"id": 11, "type": "pong"}
+    assert await websocket_client.receive_json() == bulk_result
+    assert await websocket_client.receive_json() == {
+        "id": 10,
+        "type": "event",
+        "event": "after bulk",
+    }
+    assert await websocket_client.receive_json() == {"type": "unknown"}
+    assert instance.queued_messages == 0
+    assert instance.queued_bytes == 0
+    assert instance.async_pop_max_time_in_queue() > 0
+    assert instance.async_pop_max_time_in_queue() == 0
+
+    await websocket_client.close()
+    await hass.async_block_till_done()
+    assert not hass.data[const.DATA_HANDLERS]
+
+
 async def test_non_json_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -451,6 +504,57 @@ async def test_enable_coalesce(
         await asyncio.gather(*send_tasks_with_close)
 
 
+async def test_compressed_binary_encoding(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test permessage-deflate with coalesced messages in the binary encoding."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    client = await hass_client_no_auth()
+    websocket_client = await client.ws_connect(const.URL, compress=15)
+    assert websocket_client.compress == 15
+
+    assert (await websocket_client.receive_json())["type"] == "auth_required"
+    await websocket_client.send_json(
+        {"type": "auth", "access_token": hass_access_token, "encodings": ["cbor"]}
+    )
+    assert (await websocket_client.receive_json())["encoding"] == "cbor"
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive()
+    assert msg.type is WSMsgType.BINARY
+    assert msg.data == cbor.encode(
+        {"id": 1, "type": const.TYPE_RESULT, "success": True, "result": None}
+    )
+
+    await asyncio.gather(
+        *(
+            websocket_client.send_json({"id": id_, "type": "ping"})
+            for id_ in range(2, 12)
+        )
+    )
+    pongs = [cbor.encode({"id": id_, "type": "pong"}) for id_ in range(2, 12)]
+    while pongs:
+        msg = await websocket_client.receive()
+        assert msg.type is WSMsgType.BINARY
+        if msg.data == pongs[0]:
+            pongs.pop(0)
+            continue
+        # Coalesced messages are sent as an array
+        count = msg.data[0] - 0x80
+        assert msg.data == cbor.encode_array(pongs[:count])
+        del pongs[:count]
+
+    await websocket_client.close()
+
+
 async def test_binary_message(
     hass: HomeAssistant, websocket_client, caplog: pytest.LogCaptureFixture
 ) -> None:
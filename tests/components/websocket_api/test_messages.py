@@ -6,7 +6,10 @@ from homeassistant.components.websocket_api.messages import (
     _partial_cached_event_message as lru_event_cache,
     _state_diff_event,
     cached_event_message,
+    construct_result_message,
+    message_id,
     message_to_json_bytes,
+    result_message,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
@@ -299,3 +302,23 @@ async def test_message_to_json_bytes(caplog: pytest.LogCaptureFixture) -> None:
 
 class _Unserializeable:
     """A class that cannot be serialized."""
+
+
+@pytest.mark.parametrize(
+    ("message", "expected"),
+    [
+        (result_message(5), 5),
+        ({"type": "pong"}, None),
+        (construct_result_message(12, b'{"id":3}'), 12),
+        (message_to_json_bytes({"id": 7, "type": "event", "event": {"id": 3}}), 7),
+        (b'{"type":"event","event":{"a":{}},"id":42}', 42),
+        ('{"type":"event","event":{"a":{}},"id":42}', 42),
+        # The id of nested objects is not the id of the message
+        (b'{"type":"event","event":{"id":3}}', None),
+        (b'{"type":"event","id":"abc"}', None),
+        (b"\xa1bidb42", None),
+    ],
+)
+def test_message_id(message: bytes | str | dict, expected: int | None) -> None:
+    """Test finding the id of messages."""
+    assert message_id(message) == expected
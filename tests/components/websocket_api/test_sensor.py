@@ -4,6 +4,7 @@ from homeassistant.auth.providers.homeassistant import HassAuthProvider
 from homeassistant.components.websocket_api.auth import TYPE_AUTH_REQUIRED
 from homeassistant.components.websocket_api.http import URL
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_component import async_update_entity
 from homeassistant.setup import async_setup_component
 
 from .test_auth import test_auth_active_with_token
@@ -40,6 +41,16 @@ async def test_websocket_api(
     state = hass.states.get("sensor.connected_clients")
     assert state.state == "1"
 
+    for entity_id in (
+        "sensor.queued_messages",
+        "sensor.queued_bytes",
+        "sensor.max_time_in_queue",
+    ):
+        await async_update_entity(hass, entity_id)
+    assert hass.states.get("sensor.queued_messages").state == "0"
+    assert hass.states.get("sensor.queued_bytes").state == "0"
+    assert float(hass.states.get("sensor.max_time_in_queue").state) >= 0
+
     await ws.close()
     await hass.async_block_till_done()
 
@@ -50,7 +50,11 @@ from homeassistant.helpers.event import (
     async_track_utc_time_change,
     track_point_in_utc_time,
 )
-from homeassistant.helpers.template import Template, result_as_boolean
+from homeassistant.helpers.template import (
+    Template,
+    async_get_render_stats,
+    result_as_boolean,
+)
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -2418,6 +2422,59 @@ async def test_static_string(hass: HomeAssistant) -> None:
     assert refresh_runs == ["static"]
 
 
+async def test_track_template_result_partial_entities(hass: HomeAssistant) -> None:
+    """Test templates only render again when the used state or attributes change."""
+    hass.states.async_set("sensor.test", "on", {"battery": 50, "signal": 1})
+    template = Template(
+        "{{ states('sensor.test') }} {{ state_attr('sensor.test', 'battery') }}", hass
+    )
+    results = []
+
+    @ha.callback
+    def refresh_listener(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        results.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+    assert results == []
+    assert template.render_count == 1
+
+    # Attributes the template does not use are ignored
+    hass.states.async_set("sensor.test", "on", {"battery": 50, "signal": 2})
+    await hass.async_block_till_done()
+    assert results == []
+    assert template.render_count == 1
+
+    hass.states.async_set("sensor.test", "on", {"battery": 40, "signal": 2})
+    await hass.async_block_till_done()
+    assert results == ["on 40"]
+
+    hass.states.async_set("sensor.test", "off", {"battery": 40, "signal": 2})
+    await hass.async_block_till_done()
+    assert results == ["on 40", "off 40"]
+
+    hass.states.async_remove("sensor.test")
+    await hass.async_block_till_done()
+    assert results == ["on 40", "off 40", "unknown None"]
+
+    assert info.render_stats == [
+        {
+            "template": template.template,
+            "renders": 4,
+            "render_time": template.render_time,
+            "skipped_renders": 1,
+        }
+    ]
+    assert template.render_time > 0
+    assert async_get_render_stats(hass)[0]["last_trigger"] == "sensor.test"
+    info.async_remove()
+
+
 async def test_track_template_rate_limit(hass: HomeAssistant) -> None:
     """Test template rate limit."""
     template_refresh = Template("{{ states | count }}", hass)
@@ -0,0 +1,109 @@
+"""Tests for the state machine indexes."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+    state_index,
+)
+
+from tests.common import MockConfigEntry, mock_registry
+
+
+async def test_state_index(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    device_registry: dr.DeviceRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the indexes follow the entity and device registries."""
+    config_entry = MockConfigEntry(domain="light")
+    config_entry.add_to_hass(hass)
+    kitchen = area_registry.async_get_or_create("kitchen")
+    living_room = area_registry.async_get_or_create("living_room")
+    label = "my_label"
+
+    device = device_registry.async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        connections={(dr.CONNECTION_NETWORK_MAC, "12:34:56:AB:CD:EF")},
+    )
+    device_registry.async_update_device(device.id, area_id=kitchen.id)
+    device_entity = entity_registry.async_get_or_create(
+        "light", "hue", "1234", config_entry=config_entry, device_id=device.id
+    )
+    own_area_entity = entity_registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=config_entry, device_id=device.id
+    )
+    entity_registry.async_update_entity(
+        own_area_entity.entity_id, area_id=living_room.id, labels={label}
+    )
+    hass.states.async_set(device_entity.entity_id, "on")
+
+    # The indexes are built from the registries when first used
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_AREA, kitchen.id)
+    ) == {device_entity.entity_id}
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_DEVICE, device.id)
+    ) == {device_entity.entity_id, own_area_entity.entity_id}
+    assert set(state_index.async_entity_ids(hass, state_index.INDEX_LABEL, label)) == {
+        own_area_entity.entity_id
+    }
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_PLATFORM, "hue")
+    ) == {device_entity.entity_id, own_area_entity.entity_id}
+    # Only entities with a state are returned as states
+    assert state_index.async_states(hass, state_index.INDEX_PLATFORM, "hue") == [
+        hass.states.get(device_entity.entity_id)
+    ]
+    assert state_index.async_entity_ids(hass, state_index.INDEX_AREA, "unknown") == ()
+
+    # Entities without an area follow the area of their device
+    device_registry.async_update_device(device.id, area_id=living_room.id)
+    assert not state_index.async_entity_ids(hass, state_index.INDEX_AREA, kitchen.id)
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_AREA, living_room.id)
+    ) == {device_entity.entity_id, own_area_entity.entity_id}
+
+    # Disabled entities do not inherit the area of their device
+    entity_registry.async_update_entity(
+        device_entity.entity_id, disabled_by=er.RegistryEntryDisabler.USER
+    )
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_AREA, living_room.id)
+    ) == {own_area_entity.entity_id}
+
+    # Renamed entities are indexed under their new entity_id
+    entity_registry.async_update_entity(
+        own_area_entity.entity_id, new_entity_id="light.renamed"
+    )
+    assert set(state_index.async_entity_ids(hass, state_index.INDEX_LABEL, label)) == {
+        "light.renamed"
+    }
+
+    # Removed entities are dropped from all the indexes
+    entity_registry.async_remove("light.renamed")
+    assert not state_index.async_entity_ids(hass, state_index.INDEX_LABEL, label)
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_DEVICE, device.id)
+    ) == {device_entity.entity_id}
+
+
+async def test_state_index_rebuilt_when_registry_replaced(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test the indexes are rebuilt when the entity registry is replaced."""
+    entity_registry.async_get_or_create("light", "hue", "1234")
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_PLATFORM, "hue")
+    ) == {"light.hue_1234"}
+
+    new_registry = mock_registry(hass)
+    new_registry.async_get_or_create("light", "other", "1234")
+
+    assert not state_index.async_entity_ids(hass, state_index.INDEX_PLATFORM, "hue")
+    assert set(
+        state_index.async_entity_ids(hass, state_index.INDEX_PLATFORM, "other")
+    ) == {"light.other_1234"}
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import base64
 from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
 import random
 from types import MappingProxyType
@@ -5170,6 +5172,124 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+async def test_compile_cache_shared(hass: HomeAssistant) -> None:
+    """Test templates with the same source are compiled once."""
+    template_string = "{{ states | count + 1 }}"
+    tpl = template.Template(template_string, hass)
+    tpl.ensure_valid()
+    env = template.TemplateEnvironment(hass, log_fn=lambda level, msg: None)
+    assert env.compile(template_string) is tpl._compiled_code
+
+    stats = template.async_get_compile_stats(hass)
+    assert stats["compiled"] == 1
+    assert stats["shared"] == 1
+    assert stats["compile_time"] > 0
+
+
+async def test_render_stats(hass: HomeAssistant) -> None:
+    """Test the renders of templates with the same source are aggregated."""
+    assert template.async_get_render_stats(hass) == []
+    tpl = template.Template("{{ 1 + 1 }}", hass)
+    tpl2 = template.Template("{{ 1 + 1 }}", hass)
+    static = template.Template("static", hass)
+    tpl.ensure_valid()
+    tpl2.ensure_valid()
+    with patch(
+        "homeassistant.helpers.template.perf_counter",
+        side_effect=[0.0, 1.0, 1.0, 3.0],
+    ):
+        tpl.async_render()
+        tpl2.async_render()
+    static.async_render()
+    tpl.async_set_render_trigger("sensor.test")
+
+    assert tpl.render_time == 1.0
+    assert tpl2.render_time == 2.0
+    assert template.async_get_render_stats(hass) == [
+        {
+            "template": "{{ 1 + 1 }}",
+            "renders": 2,
+            "render_time": 3.0,
+            "p95_render_time": 2.0,
+            "last_trigger": "sensor.test",
+        }
+    ]
+
+
+async def test_compile_cache_persisted(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates are restored from and saved to storage."""
+    restored_string = "{{ 1 + 2 }}"
+    code = template._NO_HASS_ENV.compile(restored_string)
+    restored_digest = template._compile_cache_digest(False, restored_string)
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY] = {
+        "version": template.COMPILE_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": template.COMPILE_CACHE_STORAGE_KEY,
+        "data": {
+            "versions": template._compile_cache_versions(),
+            "templates": {
+                restored_digest: base64.b64encode(marshal.dumps(code)).decode(),
+                "unused": "not code",
+            },
+        },
+    }
+    await template.async_load_compile_cache(hass)
+
+    tpl = template.Template(restored_string, hass)
+    assert tpl.async_render() == 3
+    stats = template.async_get_compile_stats(hass)
+    assert stats["compiled"] == 0
+    assert stats["restored"] == 1
+
+    compiled_string = "{{ 2 + 2 }}"
+    tpl2 = template.Template(compiled_string, hass)
+    assert tpl2.async_render() == 4
+    assert template.async_get_compile_stats(hass)["compiled"] == 1
+
+    # Only the templates used since the start are saved
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=template.COMPILE_CACHE_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+    data = hass_storage[template.COMPILE_CACHE_STORAGE_KEY]["data"]
+    assert data["versions"] == template._compile_cache_versions()
+    assert data["templates"].keys() == {
+        restored_digest,
+        template._compile_cache_digest(False, compiled_string),
+    }
+
+
+async def test_compile_cache_other_versions(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test compiled templates of other versions are not restored."""
+    template_string = "{{ 1 + 2 }}"
+    code = template._NO_HASS_ENV.compile(template_string)
+    hass_storage[template.COMPILE_CACHE_STORAGE_KEY] = {
+        "version": template.COMPILE_CACHE_STORAGE_VERSION,
+        "minor_version": 1,
+        "key": template.COMPILE_CACHE_STORAGE_KEY,
+        "data": {
+            "versions": {**template._compile_cache_versions(), "jinja": "0.0.1"},
+            "templates": {
+                template._compile_cache_digest(False, template_string): (
+                    base64.b64encode(marshal.dumps(code)).decode()
+                ),
+            },
+        },
+    }
+    await template.async_load_compile_cache(hass)
+
+    tpl = template.Template(template_string, hass)
+    assert tpl.async_render() == 3
+    stats = template.async_get_compile_stats(hass)
+    assert stats["compiled"] == 1
+    assert stats["restored"] == 0
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
@@ -5605,6 +5725,143 @@ async def test_render_to_info_with_exception(hass: HomeAssistant) -> None:
     assert info.entities == {"test_domain.object"}
 
 
+async def test_render_to_info_partial_entities(hass: HomeAssistant) -> None:
+    """Test entities only referenced by state or attributes are split out."""
+    hass.states.async_set("sensor.state", "on")
+    hass.states.async_set("sensor.attribute", "on", {"battery": 50})
+    hass.states.async_set("sensor.both", "on", {"battery": 60})
+    hass.states.async_set("sensor.whole", "on", {"battery": 70})
+    hass.states.async_set("light.domain", "on")
+
+    info = render_to_info(
+        hass,
+        "{{ states('sensor.state') }}"
+        "{{ state_attr('sensor.attribute', 'battery') }}"
+        "{{ is_state('sensor.both', 'on') }}"
+        "{{ is_state_attr('sensor.both', 'battery', 60) }}"
+        "{{ states.sensor.whole.state }}{{ states.sensor.whole.attributes }}"
+        "{{ states.light.domain.state }}{{ states.light | list | count }}",
+    )
+    assert info.entities == {
+        "sensor.state",
+        "sensor.attribute",
+        "sensor.both",
+        "sensor.whole",
+        "light.domain",
+    }
+    assert info.entity_attributes == {
+        "sensor.state": set(),
+        "sensor.attribute": {"battery"},
+        "sensor.both": {"battery"},
+    }
+    assert info.state_entities == {"sensor.state", "sensor.both"}
+
+    # Counting the states only adds listening to entities being added or removed
+    info = render_to_info(hass, "{{ states('sensor.state') }}{{ states | count }}")
+    assert info.entity_attributes == {"sensor.state": set()}
+
+    # Templates iterating all states are rendered again for any change
+    info = render_to_info(hass, "{{ states('sensor.state') }}{{ states | list }}")
+    assert info.all_states is True
+    assert info.entity_attributes == {}
+    assert info.state_entities == set()
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states('sensor.power') }}",
+        " {{ states('sensor.power') | float(0) * 2 }} ",
+        "{{ (states('sensor.power') | float / 1000) | round(2) }}",
+        "{{ states('sensor.power') | int(0) - 1 + 0.5 }}",
+        "{{ -(states('sensor.unknown') | float(-1)) }}",
+        "{{ state_attr('light.kitchen', 'brightness') }}",
+        "{{ is_state('light.kitchen', 'on') }}",
+        "{{ is_state_attr('light.kitchen', 'brightness', 128) }}",
+        "{{ has_value('sensor.unknown') }}",
+        "{{ 1 + 2 }}",
+    ],
+)
+async def test_fast_render(hass: HomeAssistant, template_str: str) -> None:
+    """Test simple templates render the same without Jinja."""
+    hass.states.async_set("sensor.power", "512.5")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 128})
+
+    fast_template = template.Template(template_str, hass)
+    fast_info = fast_template.async_render_to_info()
+    assert fast_template._fast_render is not None
+    jinja_template = template.Template(template_str, hass)
+    jinja_template.ensure_valid()
+    with patch.object(template, "_async_build_fast_render", return_value=None):
+        jinja_info = jinja_template.async_render_to_info()
+
+    for attr in (
+        "_result",
+        "entities",
+        "domains",
+        "all_states",
+        "all_states_lifecycle",
+        "entity_attributes",
+        "state_entities",
+    ):
+        assert getattr(fast_info, attr) == getattr(jinja_info, attr)
+    assert fast_template.async_render(
+        parse_result=False
+    ) == jinja_template.async_render(parse_result=False)
+    assert fast_template.async_render_with_possible_json_value(
+        "{}", parse_result=False
+    ) == jinja_template.async_render_with_possible_json_value("{}", parse_result=False)
+
+
+@pytest.mark.parametrize(
+    "template_str",
+    [
+        "{{ states.sensor.power.state }}",
+        "{{ states('sensor.power') | float(default=0) }}",
+        "{{ states(entity_id) }}",
+        "{{ states('sensor.power') | upper }}",
+        "{{ states('sensor.power') | int // 2 }}",
+        "{{ states('sensor.power') }} W",
+        "{{ states('sensor.power') }}{{ states('sensor.power') }}",
+        "{% if true %}{{ states('sensor.power') }}{% endif %}",
+    ],
+)
+async def test_fast_render_not_simple(hass: HomeAssistant, template_str: str) -> None:
+    """Test templates that are not simple expressions are rendered with Jinja."""
+    hass.states.async_set("sensor.power", "512")
+    tpl = template.Template(template_str, hass)
+    tpl.async_render({"entity_id": "sensor.power"})
+    assert tpl._fast_render is None
+
+
+async def test_fast_render_fallback(hass: HomeAssistant) -> None:
+    """Test the fast path falls back to Jinja and raises the same errors."""
+    hass.states.async_set("sensor.power", "512")
+
+    # Variables shadowing the functions are rendered with Jinja
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    assert tpl.async_render() == 512
+    assert tpl._fast_render is not None
+    assert tpl.async_render({"states": lambda entity_id: "shadowed"}) == "shadowed"
+    assert tpl.async_render({"other": 1}) == 512
+
+    # Limited templates are always rendered with Jinja
+    tpl = template.Template("{{ 1 + 2 }}", hass)
+    assert tpl.async_render(limited=True) == 3
+    assert tpl._fast_render is None
+
+    tpl = template.Template("{{ states('sensor.unknown') | float }}", hass)
+    with pytest.raises(
+        TemplateError,
+        match=(
+            "float got invalid input 'unknown' when rendering template "
+            "'{{ states\\('sensor.unknown'\\) \\| float }}' but no default was specified"
+        ),
+    ):
+        tpl.async_render()
+    assert tpl._fast_render is not None
+
+
 async def test_lru_increases_with_many_entities(hass: HomeAssistant) -> None:
     """Test that the template internal LRU cache increases with many entities."""
     # We do not actually want to record 4096 entities so we mock the entity count
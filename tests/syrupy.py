@@ -25,6 +25,7 @@ from homeassistant.helpers import (
     entity_registry as er,
     issue_registry as ir,
 )
+from homeassistant.util.read_only_dict import InternedReadOnlyDict, ReadOnlyDict
 
 
 class _ANY:
@@ -107,6 +108,9 @@ class HomeAssistantSnapshotSerializer(AmberDataSerializer):
             serializable_data = cls._serializable_config_entry(data)
         elif dataclasses.is_dataclass(type(data)):
             serializable_data = dataclasses.asdict(data)
+        elif type(data) is InternedReadOnlyDict:
+            # Interned attributes behave like any other ReadOnlyDict
+            serializable_data = ReadOnlyDict(data)
         elif isinstance(data, IntFlag):
             # The repr of an enum.IntFlag has changed between Python 3.10 and 3.11
             # so we normalize it here.
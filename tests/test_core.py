@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import array
 import asyncio
+from collections import deque
 from datetime import datetime, timedelta
 import functools
 import gc
@@ -64,6 +65,7 @@ from homeassistant.helpers.json import json_dumps
 from homeassistant.setup import async_setup_component
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -1169,6 +1171,383 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listeners are looked up by the value of a key in the event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(("keyed", event.data))
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener."""
+        calls.append(("other", event.data))
+
+    @ha.callback
+    def filtered_listener(event):
+        """Mock listener."""
+        calls.append(("filtered", event.data))
+
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", "light.one", listener)
+    unsub_other = hass.bus.async_listen_keyed(
+        "test", "entity_id", "light.two", other_listener
+    )
+    unsub_filtered = hass.bus.async_listen("test", filtered_listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 3
+
+    hass.bus.async_fire("test", {"entity_id": "light.one"})
+    hass.bus.async_fire("test", {"entity_id": "light.three"})
+    hass.bus.async_fire("test", {"entity_id": ["light.one"]})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    # Keyed listeners run after the other listeners of the event type
+    assert calls == [
+        ("filtered", {"entity_id": "light.one"}),
+        ("keyed", {"entity_id": "light.one"}),
+        ("filtered", {"entity_id": "light.three"}),
+        ("filtered", {"entity_id": ["light.one"]}),
+        ("filtered", {}),
+    ]
+
+    calls.clear()
+    unsub()
+    unsub_filtered()
+    hass.bus.async_fire("test", {"entity_id": "light.one"})
+    hass.bus.async_fire("test", {"entity_id": "light.two"})
+    await hass.async_block_till_done()
+    assert calls == [("other", {"entity_id": "light.two"})]
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+
+    unsub_other()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", "light.one", listener)
+
+
+async def test_eventbus_keyed_listener_many_values(hass: HomeAssistant) -> None:
+    """Test keyed listeners for more values do not rebuild the data keys."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    unsubs = [
+        hass.bus.async_listen_keyed("test", "entity_id", f"light.{idx}", listener)
+        for idx in range(100)
+    ]
+    keyed_dispatch = hass.bus._keyed_dispatch["test"]
+    unsub_twice = hass.bus.async_listen_keyed("test", "entity_id", "light.1", listener)
+    assert hass.bus._keyed_dispatch["test"] is keyed_dispatch
+
+    hass.bus.async_fire("test", {"entity_id": "light.1"})
+    hass.bus.async_fire("test", {"entity_id": "light.99"})
+    await hass.async_block_till_done()
+    assert calls == ["light.1", "light.1", "light.99"]
+
+    calls.clear()
+    unsub_twice()
+    for unsub in unsubs[1:]:
+        unsub()
+    assert hass.bus._keyed_dispatch["test"] is keyed_dispatch
+    hass.bus.async_fire("test", {"entity_id": "light.1"})
+    hass.bus.async_fire("test", {"entity_id": "light.0"})
+    await hass.async_block_till_done()
+    assert calls == ["light.0"]
+
+    unsubs[0]()
+    assert "test" not in hass.bus._keyed_dispatch
+    assert "test" not in hass.bus.async_listeners()
+
+
+async def test_eventbus_dispatch_follows_listener_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test the precomputed listeners are rebuilt when listeners change."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append("test")
+
+    @ha.callback
+    def match_all_listener(event):
+        """Mock listener."""
+        if event.event_type == "test":
+            calls.append("match_all")
+
+    hass.bus.async_fire("test")
+    unsub = hass.bus.async_listen("test", listener)
+    hass.bus.async_fire("test")
+    assert calls == ["test"]
+
+    unsub_match_all = hass.bus.async_listen(MATCH_ALL, match_all_listener)
+    hass.bus.async_fire("test")
+    assert calls == ["test", "test", "match_all"]
+
+    unsub()
+    hass.bus.async_fire("test")
+    assert calls == ["test", "test", "match_all", "match_all"]
+
+    unsub_match_all()
+    hass.bus.async_fire("test")
+    assert calls == ["test", "test", "match_all", "match_all"]
+
+
+async def test_eventbus_batch_listener(hass: HomeAssistant) -> None:
+    """Test coalescible events are delivered in batches once per loop iteration."""
+    batches = []
+    calls = []
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["entity_id"] for event in events])
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event.data["entity_id"])
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_batch("test", batch_listener)
+
+    hass.bus.async_declare_coalescible("test")
+    old_count = hass.bus.async_listeners().get("test", 0)
+    unsub = hass.bus.async_listen_batch("test", batch_listener)
+    unsub_listener = hass.bus.async_listen("test", listener)
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    for entity_id in ("light.one", "light.two", "light.three"):
+        hass.bus.async_fire("test", {"entity_id": entity_id})
+    # Legacy listeners still receive each event right away
+    assert calls == ["light.one", "light.two", "light.three"]
+    assert batches == []
+    await hass.async_block_till_done()
+    assert batches == [["light.one", "light.two", "light.three"]]
+
+    hass.bus.async_fire("test", {"entity_id": "light.four"})
+    await hass.async_block_till_done()
+    assert batches == [["light.one", "light.two", "light.three"], ["light.four"]]
+    assert hass.bus.async_batch_stats()["test"] == {
+        "events": 4,
+        "batches": 2,
+        "coalesced": 2,
+    }
+
+    unsub()
+    unsub_listener()
+    hass.bus.async_fire("test", {"entity_id": "light.five"})
+    await hass.async_block_till_done()
+    assert len(batches) == 2
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
+async def test_eventbus_batch_listener_state_reported(hass: HomeAssistant) -> None:
+    """Test state reported events can be received in batches."""
+    batches = []
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["entity_id"] for event in events])
+
+    hass.states.async_set("light.one", "on")
+    hass.states.async_set("light.two", "on")
+    unsub = hass.bus.async_listen_batch(EVENT_STATE_REPORTED, batch_listener)
+    for _ in range(3):
+        hass.states.async_set("light.one", "on")
+        hass.states.async_set("light.two", "on")
+    await hass.async_block_till_done()
+    assert batches == [["light.one", "light.two"] * 3]
+    unsub()
+
+
+async def test_state_datetimes_are_created_lazily(hass: HomeAssistant) -> None:
+    """Test the state machine only creates the datetimes when accessed."""
+    hass.states.async_set("light.one", "on", timestamp=1000.0)
+    hass.states.async_set("light.one", "on", {"brightness": 50}, timestamp=1010.0)
+    hass.states.async_set("light.one", "on", {"brightness": 50}, timestamp=1020.0)
+    state = hass.states.get("light.one")
+    assert state._last_changed is None
+    assert state._last_updated is None
+    assert state._last_reported is None
+    assert state.last_changed_timestamp == 1000.0
+    assert state.last_updated_timestamp == 1010.0
+    assert state.last_reported_timestamp == 1020.0
+    assert state.as_compressed_state == {
+        "a": {"brightness": 50},
+        "c": state.context.id,
+        "lc": 1000.0,
+        "lu": 1010.0,
+        "s": "on",
+    }
+    assert state._last_changed is None
+
+    assert state.last_changed == dt_util.utc_from_timestamp(1000.0)
+    assert state.last_updated == dt_util.utc_from_timestamp(1010.0)
+    assert state.last_reported == dt_util.utc_from_timestamp(1020.0)
+    assert state.as_dict()["last_updated"] == "1970-01-01T00:16:50+00:00"
+
+    hass.states.async_set("light.one", "off", {"brightness": 50}, timestamp=1030.0)
+    state = hass.states.get("light.one")
+    assert state.last_changed is state.last_updated
+    assert state.last_reported == state.last_updated
+
+    last_changed = dt_util.utc_from_timestamp(900.0)
+    state.last_changed = last_changed
+    assert state.last_changed is last_changed
+    assert state.last_changed_timestamp == 900.0
+
+
+async def test_statemachine_interns_attributes(hass: HomeAssistant) -> None:
+    """Test equal attributes are shared between entities."""
+    attributes = {"unit_of_measurement": "W", "device_class": "power"}
+    hass.states.async_set("sensor.one", "1", attributes)
+    hass.states.async_set("sensor.two", "2", dict(attributes))
+    hass.states.async_set("sensor.three", "3", {"unit_of_measurement": "kW"})
+    one = hass.states.get("sensor.one")
+    two = hass.states.get("sensor.two")
+    three = hass.states.get("sensor.three")
+    assert one.attributes is two.attributes
+    assert one.attributes is not three.attributes
+    assert one.attributes.json_bytes == (
+        b'{"unit_of_measurement":"W","device_class":"power"}'
+    )
+
+    # The cached JSON is used to serialize the state
+    assert json_loads(one.as_dict_json) == {
+        **one.as_dict(),
+        "attributes": attributes,
+        "context": {"id": one.context.id, "parent_id": None, "user_id": None},
+    }
+    assert json_loads(b"{" + two.as_compressed_state_json + b"}") == {
+        "sensor.two": {
+            "a": attributes,
+            "c": two.context.id,
+            "lc": two.last_changed_timestamp,
+            "s": "2",
+        }
+    }
+
+    # Values that serialize the same but are not equal are not shared
+    now = dt_util.utcnow()
+    hass.states.async_set("sensor.four", "4", {"at": now})
+    hass.states.async_set("sensor.five", "5", {"at": now.isoformat()})
+    assert hass.states.get("sensor.four").attributes["at"] is now
+    assert hass.states.get("sensor.five").attributes["at"] == now.isoformat()
+
+    # Attributes that can not be serialized are not interned
+    hass.states.async_set("sensor.six", "6", {"obj": object()})
+    assert type(hass.states.get("sensor.six").attributes) is ReadOnlyDict
+
+
+async def test_statemachine_secondary_index(hass: HomeAssistant) -> None:
+    """Test looking up states by the keys of a secondary index."""
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.hallway", "off")
+    hass.states.async_set_index_keys("area_id", "light.kitchen", ("kitchen",))
+    hass.states.async_set_index_keys("area_id", "light.hallway", ("hallway",))
+    hass.states.async_set_index_keys("area_id", "light.no_state", ("kitchen",))
+
+    assert set(hass.states.async_index_entity_ids("area_id", "kitchen")) == {
+        "light.kitchen",
+        "light.no_state",
+    }
+    assert hass.states.async_index_states("area_id", "kitchen") == [
+        hass.states.get("light.kitchen")
+    ]
+    assert hass.states.async_index_entity_ids("area_id", "garage") == ()
+    assert hass.states.async_index_entity_ids("label_id", "kitchen") == ()
+
+    # Moving an entity_id replaces its keys
+    hass.states.async_set_index_keys("area_id", "light.kitchen", ("hallway",))
+    assert set(hass.states.async_index_entity_ids("area_id", "kitchen")) == {
+        "light.no_state"
+    }
+    assert set(hass.states.async_index_entity_ids("area_id", "hallway")) == {
+        "light.kitchen",
+        "light.hallway",
+    }
+
+    hass.states.async_set_index_keys("area_id", "light.no_state", ())
+    assert hass.states.async_index_entity_ids("area_id", "kitchen") == ()
+
+    hass.states.async_clear_index("area_id")
+    assert hass.states.async_index_entity_ids("area_id", "hallway") == ()
+
+
+async def test_statemachine_set_many(hass: HomeAssistant) -> None:
+    """Test writing several states in one transaction."""
+    hass.states.async_set("light.reported", "on", {"brightness": 100})
+    changed = async_capture_events(hass, EVENT_STATE_CHANGED)
+    reported = []
+    batches = []
+
+    @ha.callback
+    def reported_listener(event):
+        """Mock listener."""
+        reported.append(event)
+
+    @ha.callback
+    def batch_listener(events):
+        """Mock batch listener."""
+        batches.append([event.data["entity_id"] for event in events])
+
+    hass.bus.async_listen(
+        EVENT_STATE_REPORTED,
+        reported_listener,
+        event_filter=ha.callback(lambda _: True),
+    )
+    hass.bus.async_listen_batch(EVENT_STATE_CHANGED, batch_listener)
+    context = ha.Context()
+
+    hass.states.async_set_many(
+        [
+            ha.StateWrite("Light.One", "on", {"brightness": 50}),
+            ha.StateWrite("light.reported", "on", {"brightness": 100}),
+            ha.StateWrite("light.two", "off"),
+        ],
+        context=context,
+        timestamp=1000.0,
+    )
+
+    assert [event.data["entity_id"] for event in changed] == [
+        "light.one",
+        "light.two",
+    ]
+    assert [event.data["entity_id"] for event in reported] == ["light.reported"]
+    light_one = hass.states.get("light.one")
+    light_two = hass.states.get("light.two")
+    assert light_one.attributes == {"brightness": 50}
+    assert light_one.context is context
+    assert light_two.context is context
+    assert light_one.last_updated_timestamp == 1000.0
+    assert light_two.last_updated_timestamp == 1000.0
+    assert hass.states.get("light.reported").last_reported_timestamp == 1000.0
+    assert all(event.time_fired_timestamp == 1000.0 for event in changed)
+
+    await hass.async_block_till_done()
+    assert batches == [["light.one", "light.two"]]
+
+    # Without a context or timestamp the writes still share them
+    hass.states.async_set_many(
+        [ha.StateWrite("light.one", "off"), ha.StateWrite("light.two", "on")]
+    )
+    light_one = hass.states.get("light.one")
+    light_two = hass.states.get("light.two")
+    assert light_one.context is light_two.context
+    assert light_one.last_updated == light_two.last_updated
+    assert changed[-1].data["old_state"].state == "off"
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -1492,6 +1871,74 @@ async def test_statemachine_remove(hass: HomeAssistant) -> None:
     assert len(events) == 1
 
 
+async def test_statemachine_changes_since(hass: HomeAssistant) -> None:
+    """Test the state machine keeps a change sequence per entity."""
+    states = hass.states
+    start = states.change_sequence
+    states.async_set("light.bowl", "on")
+    states.async_set("light.ceiling", "off")
+    assert states.change_sequence == start + 2
+
+    # Reporting the same state is not a change
+    states.async_set("light.bowl", "on")
+    assert states.change_sequence == start + 2
+    assert states.async_changes_since(start + 2) == ([], [])
+
+    sequence = states.change_sequence
+    states.async_set("light.ceiling", "on")
+    states.async_set("light.kitchen", "on")
+    states.async_remove("light.bowl")
+    assert states.async_changes_since(sequence) == (
+        [states.get("light.ceiling"), states.get("light.kitchen")],
+        ["light.bowl"],
+    )
+    assert states.async_changes_since(start) == (
+        [states.get("light.ceiling"), states.get("light.kitchen")],
+        ["light.bowl"],
+    )
+
+    # An entity that is added again is changed, not removed
+    states.async_set("light.bowl", "off")
+    assert states.async_changes_since(sequence) == (
+        [
+            states.get("light.ceiling"),
+            states.get("light.kitchen"),
+            states.get("light.bowl"),
+        ],
+        [],
+    )
+
+    # Sequences that were never handed out are not known
+    assert states.async_changes_since(states.change_sequence + 1) is None
+
+
+async def test_statemachine_changes_since_tombstones_exceeded(
+    hass: HomeAssistant,
+) -> None:
+    """Test changes are not known once removals are dropped from the log."""
+    states = hass.states
+    sequence = states.change_sequence
+    with patch.object(ha, "MAX_STATE_TOMBSTONES", 2):
+        states._tombstones = deque(maxlen=2)
+        for entity_id in ("light.a", "light.b", "light.c"):
+            states.async_set(entity_id, "on")
+        for entity_id in ("light.a", "light.b"):
+            states.async_remove(entity_id)
+        assert states.async_changes_since(sequence) == (
+            [states.get("light.c")],
+            ["light.a", "light.b"],
+        )
+
+        states.async_remove("light.c")
+
+    assert states.async_changes_since(sequence) is None
+    # The removals that are still known can be returned
+    assert states.async_changes_since(states.change_sequence - 2) == (
+        [],
+        ["light.b", "light.c"],
+    )
+
+
 async def test_state_machine_case_insensitivity(hass: HomeAssistant) -> None:
     """Test setting and getting states entity_id insensitivity."""
     events = async_capture_events(hass, EVENT_STATE_CHANGED)
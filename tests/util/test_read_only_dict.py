@@ -5,7 +5,7 @@ import json
 
 import pytest
 
-from homeassistant.util.read_only_dict import ReadOnlyDict
+from homeassistant.util.read_only_dict import InternedReadOnlyDict, ReadOnlyDict
 
 
 def test_read_only_dict() -> None:
@@ -38,3 +38,16 @@ def test_read_only_dict() -> None:
     assert json.dumps(data) == json.dumps({"hello": "world"})
 
     assert copy.deepcopy(data) == {"hello": "world"}
+
+
+def test_interned_read_only_dict() -> None:
+    """Test interned read only dictionary keeps its JSON."""
+    data = InternedReadOnlyDict({"hello": "world"}, b'{"hello":"world"}')
+
+    with pytest.raises(RuntimeError):
+        data["hello"] = "universe"
+
+    assert isinstance(data, ReadOnlyDict)
+    assert data == {"hello": "world"}
+    assert data.json_bytes == b'{"hello":"world"}'
+    assert copy.copy(data) == {"hello": "world"}